@@ -88,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -97,6 +97,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_setup_timeline,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -254,7 +255,11 @@ SETUP_ORDER = (
 #
 # If they do not exist they will not be loaded
 #
+STARTUP_PROFILE_STORAGE_KEY = "core.startup_profile"
+STARTUP_PROFILE_STORAGE_VERSION = 1
+
 PRELOAD_STORAGE = [
+    STARTUP_PROFILE_STORAGE_KEY,
     "core.logger",
     "core.network",
     "http.auth",
@@ -452,6 +457,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -469,6 +475,8 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Load the manifest cache before the first integration is resolved
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -895,6 +903,14 @@ async def _async_set_up_integrations(
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
 
+    profile_store = Store[dict[str, Any]](
+        hass, STARTUP_PROFILE_STORAGE_VERSION, STARTUP_PROFILE_STORAGE_KEY
+    )
+    previous_profile = await profile_store.async_load() or {}
+    priorities = _async_critical_path_priorities(
+        domains_to_setup, integration_cache, previous_profile.get("setup_times", {})
+    )
+
     pre_stage_domains = [
         (name, domains_to_setup & domain_group) for name, domain_group in SETUP_ORDER
     ]
@@ -935,7 +951,7 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await _async_setup_multi_components(hass, domain_group, config)
+            await _async_setup_multi_components(hass, domain_group, config, priorities)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -947,7 +963,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await _async_setup_multi_components(hass, stage_1_domains, config)
+                await _async_setup_multi_components(
+                    hass, stage_1_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -963,7 +981,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await _async_setup_multi_components(hass, stage_2_domains, config)
+                await _async_setup_multi_components(
+                    hass, stage_2_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -983,13 +1003,59 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
 
+    # The profile is in the Chrome trace JSON object format so the timeline
+    # of this boot can be loaded in chrome://tracing or Perfetto, the setup
+    # times are used to prioritize the critical path on the next boot.
+    await profile_store.async_save(
+        {
+            "traceEvents": async_get_setup_timeline(hass),
+            "displayTimeUnit": "ms",
+            "setup_times": setup_time,
+        }
+    )
+
+
+@core.callback
+def _async_critical_path_priorities(
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+    setup_times: dict[str, float],
+) -> dict[str, float]:
+    """Return the setup priority of each domain.
+
+    The priority of a domain is how long the longest chain of setups which
+    starts with it took on the previous boot, so the domains which gate most
+    of the startup are started first.
+    """
+    dependents: defaultdict[str, list[str]] = defaultdict(list)
+    for domain in domains:
+        if (integration := integration_cache.get(domain)) is not None:
+            for dependency in integration.dependencies:
+                dependents[dependency].append(domain)
+
+    priorities: dict[str, float] = {}
+
+    def _priority(domain: str) -> float:
+        if (priority := priorities.get(domain)) is not None:
+            return priority
+        # Guard against dependency cycles, which fail to set up later on
+        priorities[domain] = 0.0
+        priority = priorities[domain] = setup_times.get(domain, 0.0) + max(
+            (_priority(dependent) for dependent in dependents[domain]), default=0.0
+        )
+        return priority
+
+    for domain in domains:
+        _priority(domain)
+    return priorities
+
 
 class _WatchPendingSetups:
     """Periodic log and dispatch of setups that are pending."""
@@ -1066,13 +1132,17 @@ async def _async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    priorities: dict[str, float] | None = None,
 ) -> None:
     """Set up multiple domains. Log on failure."""
     # Avoid creating tasks for domains that were setup in a previous stage
     domains_not_yet_setup = domains - hass.config.components
+    priorities = priorities or {}
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # The other domains are started in order of their critical path, so
+    # the slow dependency chains get to the import executor first.
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -1080,7 +1150,12 @@ async def _async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=lambda domain: (
+                SETUP_ORDER_SORT_KEY(domain),
+                priorities.get(domain, 0.0),
+            ),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from fnmatch import translate
-from functools import lru_cache
+from functools import lru_cache, partial
+from operator import eq
 import re
-from typing import TYPE_CHECKING, Final, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 from lru import LRU
 
@@ -34,6 +36,8 @@ MANUFACTURER_DATA_START: Final = "manufacturer_data_start"
 
 LOCAL_NAME_MIN_MATCH_LENGTH = 3
 
+_FNMATCH_SPECIAL_CHARS = re.compile(r"[*?[]")
+
 
 class BluetoothCallbackMatcherOptional(TypedDict, total=False):
     """Matcher for the bluetooth integration for callback optional fields."""
@@ -149,6 +153,86 @@ class IntegrationMatcher:
         return matched_domains
 
 
+class CompiledMatcher[_T: (BluetoothMatcher, BluetoothCallbackMatcherWithCallback)]:
+    """A matcher with its fields prepared for matching advertisements.
+
+    This avoids looking up the fields of the matcher, converting the
+    manufacturer data start and matching the local name pattern
+    with fnmatch for every advertisement.
+    """
+
+    __slots__ = (
+        "connectable",
+        "local_name",
+        "manufacturer_data_start",
+        "manufacturer_id",
+        "matcher",
+        "service_data_uuid",
+        "service_uuid",
+    )
+
+    def __init__(self, matcher: _T) -> None:
+        """Initialize the compiled matcher."""
+        self.matcher = matcher
+        self.connectable = matcher.get(CONNECTABLE, True)
+        self.service_uuid = matcher.get(SERVICE_UUID)
+        self.service_data_uuid = matcher.get(SERVICE_DATA_UUID)
+        self.manufacturer_id = matcher.get(MANUFACTURER_ID)
+        self.manufacturer_data_start: bytes | None = None
+        if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+            self.manufacturer_data_start = bytes(manufacturer_data_start)
+        self.local_name: Callable[[str], Any] | None = None
+        if local_name := matcher.get(LOCAL_NAME):
+            self.local_name = _compile_local_name(local_name)
+
+    def matches(self, service_info: BluetoothServiceInfoBleak) -> bool:
+        """Check if a ble device and advertisement_data matches the matcher.
+
+        This is the same check as ble_device_matches.
+        """
+        if self.connectable and not service_info.connectable:
+            return False
+
+        if (
+            service_uuid := self.service_uuid
+        ) and service_uuid not in service_info.service_uuids:
+            return False
+
+        if (
+            service_data_uuid := self.service_data_uuid
+        ) and service_data_uuid not in service_info.service_data:
+            return False
+
+        if (manufacturer_id := self.manufacturer_id) is not None:
+            if manufacturer_id not in service_info.manufacturer_data:
+                return False
+
+            if (
+                manufacturer_data_start := self.manufacturer_data_start
+            ) and not service_info.manufacturer_data[manufacturer_id].startswith(
+                manufacturer_data_start
+            ):
+                return False
+
+        if (local_name := self.local_name) is not None and not local_name(
+            service_info.name
+        ):
+            return False
+
+        return True
+
+
+def _remove_compiled_matcher[
+    _T: (BluetoothMatcher, BluetoothCallbackMatcherWithCallback)
+](compiled_matchers: list[CompiledMatcher[_T]], matcher: _T) -> None:
+    """Remove the compiled matcher of a matcher from a list."""
+    for idx, compiled_matcher in enumerate(compiled_matchers):
+        if compiled_matcher.matcher == matcher:
+            del compiled_matchers[idx]
+            return
+    raise ValueError(f"Matcher {matcher} not found")
+
+
 class BluetoothMatcherIndexBase[
     _T: (BluetoothMatcher, BluetoothCallbackMatcherWithCallback)
 ]:
@@ -174,10 +258,16 @@ class BluetoothMatcherIndexBase[
 
     def __init__(self) -> None:
         """Initialize the matcher index."""
-        self.local_name: defaultdict[str, list[_T]] = defaultdict(list)
-        self.service_uuid: defaultdict[str, list[_T]] = defaultdict(list)
-        self.service_data_uuid: defaultdict[str, list[_T]] = defaultdict(list)
-        self.manufacturer_id: defaultdict[int, list[_T]] = defaultdict(list)
+        self.local_name: defaultdict[str, list[CompiledMatcher[_T]]] = defaultdict(list)
+        self.service_uuid: defaultdict[str, list[CompiledMatcher[_T]]] = defaultdict(
+            list
+        )
+        self.service_data_uuid: defaultdict[str, list[CompiledMatcher[_T]]] = (
+            defaultdict(list)
+        )
+        self.manufacturer_id: defaultdict[int, list[CompiledMatcher[_T]]] = defaultdict(
+            list
+        )
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
@@ -192,21 +282,25 @@ class BluetoothMatcherIndexBase[
         # Local name is the cheapest to match since its just a dict lookup
         if LOCAL_NAME in matcher:
             self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].append(
-                matcher
+                CompiledMatcher(matcher)
             )
             return True
 
         # Manufacturer data is 2nd cheapest since its all ints
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id[matcher[MANUFACTURER_ID]].append(matcher)
+            self.manufacturer_id[matcher[MANUFACTURER_ID]].append(
+                CompiledMatcher(matcher)
+            )
             return True
 
         if SERVICE_UUID in matcher:
-            self.service_uuid[matcher[SERVICE_UUID]].append(matcher)
+            self.service_uuid[matcher[SERVICE_UUID]].append(CompiledMatcher(matcher))
             return True
 
         if SERVICE_DATA_UUID in matcher:
-            self.service_data_uuid[matcher[SERVICE_DATA_UUID]].append(matcher)
+            self.service_data_uuid[matcher[SERVICE_DATA_UUID]].append(
+                CompiledMatcher(matcher)
+            )
             return True
 
         return False
@@ -218,21 +312,26 @@ class BluetoothMatcherIndexBase[
         removed one, we are done.
         """
         if LOCAL_NAME in matcher:
-            self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
-                matcher
+            _remove_compiled_matcher(
+                self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])],
+                matcher,
             )
             return True
 
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id[matcher[MANUFACTURER_ID]].remove(matcher)
+            _remove_compiled_matcher(
+                self.manufacturer_id[matcher[MANUFACTURER_ID]], matcher
+            )
             return True
 
         if SERVICE_UUID in matcher:
-            self.service_uuid[matcher[SERVICE_UUID]].remove(matcher)
+            _remove_compiled_matcher(self.service_uuid[matcher[SERVICE_UUID]], matcher)
             return True
 
         if SERVICE_DATA_UUID in matcher:
-            self.service_data_uuid[matcher[SERVICE_DATA_UUID]].remove(matcher)
+            _remove_compiled_matcher(
+                self.service_data_uuid[matcher[SERVICE_DATA_UUID]], matcher
+            )
             return True
 
         return False
@@ -252,9 +351,9 @@ class BluetoothMatcherIndexBase[
             )
         ):
             matches.extend(
-                matcher
-                for matcher in local_name_matchers
-                if ble_device_matches(matcher, service_info)
+                compiled.matcher
+                for compiled in local_name_matchers
+                if compiled.matches(service_info)
             )
 
         if (
@@ -263,10 +362,10 @@ class BluetoothMatcherIndexBase[
             and (matched_uuids := service_data_uuid_set.intersection(service_data))
         ):
             matches.extend(
-                matcher
+                compiled.matcher
                 for service_data_uuid in matched_uuids
-                for matcher in self.service_data_uuid[service_data_uuid]
-                if ble_device_matches(matcher, service_info)
+                for compiled in self.service_data_uuid[service_data_uuid]
+                if compiled.matches(service_info)
             )
 
         if (
@@ -275,10 +374,10 @@ class BluetoothMatcherIndexBase[
             and (matched_ids := manufacturer_id_set.intersection(manufacturer_data))
         ):
             matches.extend(
-                matcher
+                compiled.matcher
                 for manufacturer_id in matched_ids
-                for matcher in self.manufacturer_id[manufacturer_id]
-                if ble_device_matches(matcher, service_info)
+                for compiled in self.manufacturer_id[manufacturer_id]
+                if compiled.matches(service_info)
             )
 
         if (
@@ -287,10 +386,10 @@ class BluetoothMatcherIndexBase[
             and (matched_uuids := service_uuid_set.intersection(service_uuids))
         ):
             matches.extend(
-                matcher
+                compiled.matcher
                 for service_uuid in matched_uuids
-                for matcher in self.service_uuid[service_uuid]
-                if ble_device_matches(matcher, service_info)
+                for compiled in self.service_uuid[service_uuid]
+                if compiled.matches(service_info)
             )
 
         return matches
@@ -313,10 +412,12 @@ class BluetoothCallbackMatcherIndex(
     def __init__(self) -> None:
         """Initialize the matcher index."""
         super().__init__()
-        self.address: defaultdict[str, list[BluetoothCallbackMatcherWithCallback]] = (
-            defaultdict(list)
-        )
-        self.connectable: list[BluetoothCallbackMatcherWithCallback] = []
+        self.address: defaultdict[
+            str, list[CompiledMatcher[BluetoothCallbackMatcherWithCallback]]
+        ] = defaultdict(list)
+        self.connectable: list[
+            CompiledMatcher[BluetoothCallbackMatcherWithCallback]
+        ] = []
 
     def add_callback_matcher(
         self, matcher: BluetoothCallbackMatcherWithCallback
@@ -328,7 +429,7 @@ class BluetoothCallbackMatcherIndex(
         We put them in the bucket that they are most likely to match.
         """
         if ADDRESS in matcher:
-            self.address[matcher[ADDRESS]].append(matcher)
+            self.address[matcher[ADDRESS]].append(CompiledMatcher(matcher))
             return
 
         if super().add(matcher):
@@ -336,7 +437,7 @@ class BluetoothCallbackMatcherIndex(
             return
 
         if CONNECTABLE in matcher:
-            self.connectable.append(matcher)
+            self.connectable.append(CompiledMatcher(matcher))
             return
 
     def remove_callback_matcher(
@@ -348,7 +449,7 @@ class BluetoothCallbackMatcherIndex(
         removed one, we are done.
         """
         if ADDRESS in matcher:
-            self.address[matcher[ADDRESS]].remove(matcher)
+            _remove_compiled_matcher(self.address[matcher[ADDRESS]], matcher)
             return
 
         if super().remove(matcher):
@@ -356,7 +457,7 @@ class BluetoothCallbackMatcherIndex(
             return
 
         if CONNECTABLE in matcher:
-            self.connectable.remove(matcher)
+            _remove_compiled_matcher(self.connectable, matcher)
             return
 
     def match_callbacks(
@@ -364,12 +465,17 @@ class BluetoothCallbackMatcherIndex(
     ) -> list[BluetoothCallbackMatcherWithCallback]:
         """Check for a match."""
         matches = self.match(service_info)
-        for matcher in self.address.get(service_info.address, []):
-            if ble_device_matches(matcher, service_info):
-                matches.append(matcher)
-        for matcher in self.connectable:
-            if ble_device_matches(matcher, service_info):
-                matches.append(matcher)
+        if address_matchers := self.address.get(service_info.address):
+            matches.extend(
+                compiled.matcher
+                for compiled in address_matchers
+                if compiled.matches(service_info)
+            )
+        matches.extend(
+            compiled.matcher
+            for compiled in self.connectable
+            if compiled.matches(service_info)
+        )
         return matches
 
 
@@ -430,6 +536,20 @@ def ble_device_matches(
     return True
 
 
+def _compile_local_name(pattern: str) -> Callable[[str], Any]:
+    """Compile a local name pattern to the cheapest check of a name.
+
+    Most patterns are a literal name or a literal prefix, which do not
+    need a regular expression.
+    """
+    prefix = pattern.removesuffix("*")
+    if _FNMATCH_SPECIAL_CHARS.search(prefix):
+        return _compile_fnmatch(pattern).match
+    if prefix == pattern:
+        return partial(eq, pattern)
+    return lambda name: name.startswith(prefix)
+
+
 @lru_cache(maxsize=4096, typed=True)
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
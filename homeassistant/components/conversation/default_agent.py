@@ -29,7 +29,7 @@ from hassil.recognize import (
     recognize_best,
 )
 from hassil.string_matcher import UnmatchedRangeEntity, UnmatchedTextEntity
-from hassil.trie import Trie
+from hassil.trie import Trie, TrieNode
 from hassil.util import merge_dict
 from home_assistant_intents import ErrorKey, get_intents, get_languages
 import yaml
@@ -183,6 +183,64 @@ class IntentCache:
         """Clear the cache."""
         self.cache.clear()
 
+    def invalidate_names(self, names: Iterable[str]) -> int:
+        """Remove results for texts containing one of the names.
+
+        Names are only offered to the matcher when they occur in the input
+        text, so other results can't be affected by a change to these names.
+        """
+        if not (names := [name for name in names if name]):
+            return 0
+
+        stale_keys = [
+            key
+            for key in self.cache
+            if any(name in key.text.strip().lower() for name in names)
+        ]
+        for key in stale_keys:
+            del self.cache[key]
+
+        return len(stale_keys)
+
+
+@dataclass(slots=True)
+class EntityNames:
+    """Names of an entity in the name tries."""
+
+    exposed: bool
+    """True if names are in the exposed names trie."""
+
+    name_tuples: list[tuple[str, str, dict[str, Any]]]
+    """(input name, output name, context) tuples for the entity."""
+
+    values: list[TextSlotValue]
+    """Slot values inserted into the trie."""
+
+
+def _get_trie_text(value: TextSlotValue) -> str:
+    """Get the text a slot value is stored under in a name trie."""
+    assert isinstance(value.text_in, TextChunk)
+    return value.text_in.text.strip().lower()
+
+
+def _trie_remove(trie: Trie, text: str, value: TextSlotValue) -> None:
+    """Remove a single value from a trie."""
+    node: TrieNode | None = None
+    children: dict[str, TrieNode] | None = trie.roots
+    for char in text:
+        if children is None or (node := children.get(char)) is None:
+            return
+        children = node.children
+
+    if (node is None) or (not node.values):
+        return
+
+    node.values = [existing for existing in node.values if existing is not value]
+    if not node.values:
+        # Nodes without values are matched as null values
+        node.text = None
+        node.values = None
+
 
 def _get_language_variations(language: str) -> Iterable[str]:
     """Generate language codes with and without region."""
@@ -247,10 +305,18 @@ class DefaultAgent(ConversationEntity):
         self._exposed_names_trie: Trie | None = None
         self._unexposed_names_trie: Trie | None = None
 
+        # entity_id -> names in the tries, used to update them incrementally
+        self._entity_names: dict[str, EntityNames] = {}
+
+        # Changes not yet applied to the slot lists and tries
+        self._changed_entity_ids: set[str] = set()
+        self._check_exposed_entities = False
+        self._areas_floors_changed = False
+
         # Sentences that will trigger a callback (skipping intent recognition)
         self.trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._unsub_slot_list_changes: list[Callable[[], None]] | None = None
         self._load_intents_lock = asyncio.Lock()
 
         # LRU cache to avoid unnecessary intent matching
@@ -276,30 +342,32 @@ class DefaultAgent(ConversationEntity):
         return not event_data["old_state"] or not event_data["new_state"]
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_slot_list_changes(self) -> None:
+        """Listen for changes that need to be applied to the slot lists."""
+        assert self._unsub_slot_list_changes is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_changes = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_areas_floors_changed,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_areas_floors_changed,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_changed,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_entity_changed,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_exposed_entities_changed
+            ),
         ]
 
     async def async_recognize_intent(
@@ -314,19 +382,17 @@ class DefaultAgent(ConversationEntity):
             _LOGGER.warning("No intents were loaded for language: %s", language)
             return None
 
-        slot_lists = self._make_slot_lists()
+        # Filter entity names by input string
+        text_lower = user_input.text.strip().lower()
+        slot_lists = {
+            **self._make_slot_lists(),
+            "name": self._get_filtered_names(self._exposed_names_trie, text_lower),
+        }
+        unexposed_names = self._get_filtered_names(
+            self._unexposed_names_trie, text_lower
+        )
         intent_context = self._make_intent_context(user_input)
 
-        if self._exposed_names_trie is not None:
-            # Filter by input string
-            text_lower = user_input.text.strip().lower()
-            slot_lists["name"] = TextSlotList(
-                name="name",
-                values=[
-                    result[2] for result in self._exposed_names_trie.find(text_lower)
-                ],
-            )
-
         start = time.monotonic()
 
         result = await self.hass.async_add_executor_job(
@@ -334,6 +400,7 @@ class DefaultAgent(ConversationEntity):
             user_input,
             lang_intents,
             slot_lists,
+            unexposed_names,
             intent_context,
             language,
             strict_intents_only,
@@ -524,6 +591,7 @@ class DefaultAgent(ConversationEntity):
         user_input: ConversationInput,
         lang_intents: LanguageIntents,
         slot_lists: dict[str, SlotList],
+        unexposed_names: TextSlotList,
         intent_context: dict[str, Any] | None,
         language: str,
         strict_intents_only: bool,
@@ -590,7 +658,7 @@ class DefaultAgent(ConversationEntity):
         if not skip_unexposed_entities_match:
             unexposed_entities_slot_lists = {
                 **slot_lists,
-                "name": self._get_unexposed_entity_names(user_input.text),
+                "name": unexposed_names,
             }
 
             start_time = time.monotonic()
@@ -718,63 +786,92 @@ class DefaultAgent(ConversationEntity):
 
         return maybe_result
 
-    def _get_unexposed_entity_names(self, text: str) -> TextSlotList:
-        """Get filtered slot list with unexposed entity names in Home Assistant."""
-        if self._unexposed_names_trie is None:
-            # Build trie
-            self._unexposed_names_trie = Trie()
-            for name_tuple in self._get_entity_name_tuples(exposed=False):
-                self._unexposed_names_trie.insert(
-                    name_tuple[0].lower(),
-                    TextSlotValue.from_tuple(name_tuple, allow_template=False),
-                )
+    def _get_filtered_names(self, names_trie: Trie | None, text: str) -> TextSlotList:
+        """Get slot list with the entity names from a trie found in text."""
+        if names_trie is None:
+            return TextSlotList(name="name", values=[])
 
-        # Build filtered slot list
-        text_lower = text.strip().lower()
         return TextSlotList(
-            name="name",
-            values=[
-                result[2] for result in self._unexposed_names_trie.find(text_lower)
-            ],
+            name="name", values=[result[2] for result in names_trie.find(text)]
         )
 
     def _get_entity_name_tuples(
-        self, exposed: bool
+        self, state: core.State, entity_registry: er.EntityRegistry
     ) -> Iterable[tuple[str, str, dict[str, Any]]]:
-        """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
+        """Yield (input name, output name, context) tuples for an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                alias = alias.strip()
+                if not alias:
+                    continue
 
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+                yield (alias, alias, context)
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        # Default name
+        yield (state.name, state.name, context)
 
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    alias = alias.strip()
-                    if not alias:
-                        continue
+    @core.callback
+    def _async_update_entity_names(
+        self, entity_id: str, entity_registry: er.EntityRegistry
+    ) -> set[str]:
+        """Update the names of an entity in the tries.
 
-                    yield (alias, alias, context)
+        Returns the names that were added or removed.
+        """
+        old_names = self._entity_names.get(entity_id)
+        new_names: EntityNames | None = None
+        if (state := self.hass.states.get(entity_id)) is not None:
+            new_names = EntityNames(
+                exposed=async_should_expose(self.hass, DOMAIN, entity_id),
+                name_tuples=list(self._get_entity_name_tuples(state, entity_registry)),
+                values=[],
+            )
+            if (
+                (old_names is not None)
+                and (old_names.exposed == new_names.exposed)
+                and (old_names.name_tuples == new_names.name_tuples)
+            ):
+                return set()
+
+        changed_names: set[str] = set()
+        if old_names is not None:
+            names_trie = (
+                self._exposed_names_trie
+                if old_names.exposed
+                else self._unexposed_names_trie
+            )
+            assert names_trie is not None
+            for value in old_names.values:
+                name_text = _get_trie_text(value)
+                _trie_remove(names_trie, name_text, value)
+                changed_names.add(name_text)
+            del self._entity_names[entity_id]
+
+        if new_names is not None:
+            names_trie = (
+                self._exposed_names_trie
+                if new_names.exposed
+                else self._unexposed_names_trie
+            )
+            assert names_trie is not None
+            for name_tuple in new_names.name_tuples:
+                value = TextSlotValue.from_tuple(name_tuple, allow_template=False)
+                name_text = _get_trie_text(value)
+                names_trie.insert(name_text, value)
+                new_names.values.append(value)
+                changed_names.add(name_text)
+            self._entity_names[entity_id] = new_names
 
-            # Default name
-            yield (state.name, state.name, context)
+        return changed_names
 
     def _recognize_strict(
         self,
@@ -1038,26 +1135,33 @@ class DefaultAgent(ConversationEntity):
         )
 
     @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
-        _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
-            return
-        self._slot_lists = None
-        self._exposed_names_trie = None
-        self._unexposed_names_trie = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
-
-        # Slot lists have changed, so we must clear the cache
-        self._intent_cache.clear()
+    def _async_entity_changed(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Mark entity names to be updated when an entity has changed."""
+        self._changed_entity_ids.add(event.data["entity_id"])
+
+    @core.callback
+    def _async_exposed_entities_changed(self) -> None:
+        """Mark exposed entities to be checked when expose settings have changed."""
+        self._check_exposed_entities = True
+
+    @core.callback
+    def _async_areas_floors_changed(
+        self,
+        event: core.Event[ar.EventAreaRegistryUpdatedData]
+        | core.Event[fr.EventFloorRegistryUpdatedData],
+    ) -> None:
+        """Mark area and floor slot lists to be rebuilt when a registry has changed."""
+        self._areas_floors_changed = True
 
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
         """Create slot lists with areas and entity names/aliases."""
         if self._slot_lists is not None:
+            self._async_update_slot_lists()
             return self._slot_lists
 
         start = time.monotonic()
@@ -1069,9 +1173,30 @@ class DefaultAgent(ConversationEntity):
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        exposed_entity_names = list(self._get_entity_name_tuples(exposed=True))
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+        #
+        # Names are only kept in tries, which are filtered by the input text
+        # before intent matching.
+        self._exposed_names_trie = Trie()
+        self._unexposed_names_trie = Trie()
+        self._entity_names.clear()
+        entity_registry = er.async_get(self.hass)
+        for state in self.hass.states.async_all():
+            self._async_update_entity_names(state.entity_id, entity_registry)
+
+        self._slot_lists = self._make_area_floor_slot_lists()
+
+        self._listen_slot_list_changes()
 
+        _LOGGER.debug(
+            "Created slot lists in %.2f seconds",
+            time.monotonic() - start,
+        )
+
+        return self._slot_lists
+
+    @core.callback
+    def _make_area_floor_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with area and floor names/aliases."""
         # Expose all areas.
         areas = ar.async_get(self.hass)
         area_names = []
@@ -1102,29 +1227,60 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        # Build trie
-        self._exposed_names_trie = Trie()
-        name_list = TextSlotList.from_tuples(exposed_entity_names, allow_template=False)
-        for name_value in name_list.values:
-            assert isinstance(name_value.text_in, TextChunk)
-            name_text = name_value.text_in.text.strip().lower()
-            self._exposed_names_trie.insert(name_text, name_value)
-
-        self._slot_lists = {
+        return {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": name_list,
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
-        self._listen_clear_slot_list()
+    @core.callback
+    def _async_update_slot_lists(self) -> None:
+        """Apply registry, state and expose changes to the slot lists and tries."""
+        if self._areas_floors_changed:
+            start = time.monotonic()
+            self._areas_floors_changed = False
+            self._slot_lists = self._make_area_floor_slot_lists()
+
+            # Areas are also used for the intent context of devices
+            self._intent_cache.clear()
+
+            _LOGGER.debug(
+                "Updated area and floor slot lists in %.4f seconds",
+                time.monotonic() - start,
+            )
+
+        if self._check_exposed_entities:
+            self._check_exposed_entities = False
+            for entity_id, entity_names in self._entity_names.items():
+                if entity_names.exposed != async_should_expose(
+                    self.hass, DOMAIN, entity_id
+                ):
+                    self._changed_entity_ids.add(entity_id)
+
+        if not self._changed_entity_ids:
+            return
+
+        start = time.monotonic()
+        entity_registry = er.async_get(self.hass)
+        changed_names: set[str] = set()
+        for entity_id in self._changed_entity_ids:
+            changed_names.update(
+                self._async_update_entity_names(entity_id, entity_registry)
+            )
+
+        num_entities = len(self._changed_entity_ids)
+        self._changed_entity_ids.clear()
+
+        # Only results for input text containing a changed name are affected
+        num_invalidated = self._intent_cache.invalidate_names(changed_names)
 
         _LOGGER.debug(
-            "Created slot lists in %.2f seconds",
+            "Updated names of %s entities in %.4f seconds, "
+            "invalidated %s cached result(s)",
+            num_entities,
             time.monotonic() - start,
+            num_invalidated,
         )
 
-        return self._slot_lists
-
     def _make_intent_context(
         self, user_input: ConversationInput
     ) -> dict[str, Any] | None:
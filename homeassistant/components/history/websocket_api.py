@@ -93,6 +93,34 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_significant_states_columnar(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+) -> bytes:
+    """Fetch history significant_states as columns and convert them to json."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                entity_id: columns.as_dict()
+                for entity_id, columns in history.get_significant_states_columnar(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                ).items()
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +131,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -160,6 +189,21 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["columnar"]:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_significant_states_columnar,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
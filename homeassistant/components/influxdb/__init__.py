@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import math
 import queue
@@ -84,15 +85,13 @@ from .const import (
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    QUEUE_FULL_MESSAGE,
+    QUEUE_MAX_SIZE,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
@@ -204,8 +203,50 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+_TAG_TRANSLATION = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+_STRING_FIELD_TRANSLATION = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+_TIMESTAMP_DIVISORS = {"ns": None, "us": 1, "ms": 1_000, "s": 1_000_000}
+
+
+@lru_cache(maxsize=4096)
+def _escape_tag(value: str) -> str:
+    """Escape a measurement, tag key, tag value or field key."""
+    return value.translate(_TAG_TRANSLATION)
+
+
+def _encode_line(
+    measurement: str, tags: dict[str, Any], fields: dict[str, Any], timestamp: int
+) -> str:
+    """Encode a point in the InfluxDB line protocol.
+
+    Tags and fields are sorted by key, and tags or fields with an empty key
+    or value are left out.
+    """
+    parts = [_escape_tag(measurement)]
+    parts.extend(
+        f",{_escape_tag(key)}={_escape_tag(value)}"
+        for key in sorted(tags)
+        if key and (value := str(tags[key]))
+    )
+    separator = " "
+    for key in sorted(fields):
+        if not key:
+            continue
+        value = fields[key]
+        if type(value) is str:
+            value = f'"{value.translate(_STRING_FIELD_TRANSLATION)}"'
+        else:
+            value = repr(value)
+        parts.append(f"{separator}{_escape_tag(key)}={value}")
+        separator = ","
+    parts.append(f" {timestamp}")
+    return "".join(parts)
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter and add to config."""
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
@@ -218,9 +259,10 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    timestamp_divisor = _TIMESTAMP_DIVISORS[conf.get(CONF_PRECISION) or "ns"]
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line in the protocol Influx expects."""
         state: State | None = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
@@ -269,59 +311,61 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields: dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                point_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
+
+        point_tags.update(tags)
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        # Timestamps are converted from whole microseconds to avoid float
+        # rounding errors in the integer timestamps
+        timestamp = round(event.time_fired_timestamp * 1_000_000)
+        if timestamp_divisor is None:
+            timestamp *= 1_000
+        else:
+            timestamp //= timestamp_divisor
 
-        return json
+        return _encode_line(str(measurement), point_tags, fields, timestamp)
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -329,7 +373,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -349,6 +393,7 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_TOKEN] = conf[CONF_TOKEN]
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
+        kwargs["enable_gzip"] = True
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
         bucket = conf.get(CONF_BUCKET)
@@ -357,9 +402,9 @@ def get_influx_connection(  # noqa: C901
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
+        def write_v2(lines: list[str]) -> None:
             """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+            data = {"bucket": bucket, "record": "\n".join(lines).encode()}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -370,7 +415,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -393,7 +438,7 @@ def get_influx_connection(  # noqa: C901
             # Try to write b"" to influx. If we can connect and creds are valid
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
-                write_v2(b"")
+                write_v2([])
             write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
@@ -432,12 +477,12 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
-    influx = InfluxDBClient(**kwargs)
+    influx = InfluxDBClient(**kwargs, gzip=True)
 
-    def write_v1(json):
+    def write_v1(lines: list[str]) -> None:
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -446,7 +491,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -494,9 +539,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_line, max_tries)
     instance.start()
 
     def shutdown(event):
@@ -513,22 +558,36 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        # Statistics of the events handled since the start
+        self.events_written = 0
+        self.events_dropped = 0
+        self.bytes_written = 0
+        self._queue_full = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
+        if self.queue.qsize() >= QUEUE_MAX_SIZE:
+            # Drop new events instead of growing the queue without limits
+            # while the writes can't keep up or influx is not reachable
+            if not self._queue_full:
+                _LOGGER.warning(QUEUE_FULL_MESSAGE, QUEUE_MAX_SIZE)
+                self._queue_full = True
+            self.events_dropped += 1
+            return
+        self._queue_full = False
         item = (time.monotonic(), event)
         self.queue.put(item)
 
@@ -537,17 +596,17 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded in the line protocol for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines: list[str] = []
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -559,8 +618,8 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
@@ -568,20 +627,24 @@ class InfluxThread(threading.Thread):
 
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+            self.events_dropped += dropped
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(lines)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
+                self.events_written += len(lines)
+                # Separators are not counted
+                self.bytes_written += sum(map(len, lines))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -592,14 +655,14 @@ class InfluxThread(threading.Thread):
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += len(lines)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            _, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
 
     def block_till_done(self):
         """Block till all events processed.
@@ -29,6 +29,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.recorder import DATA_INSTANCE
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.event_type import EventType
@@ -46,6 +47,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_SOURCE,
 )
 from .models import LazyEventPartialState, LogbookConfig
+from .recent import RecentEvents
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -136,7 +138,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    # Without a running recorder there is nothing to complement with
+    # recent events in memory
+    recent_events: RecentEvents | None = None
+    if (instance := hass.data.get(DATA_INSTANCE)) is not None:
+        recent_events = RecentEvents(
+            hass, external_events, instance.exclude_event_types, instance.entity_filter
+        )
+        recent_events.async_start()
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, recent_events
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -160,5 +172,7 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        if logbook_config.recent_events:
+            logbook_config.recent_events.async_reset()
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import chain
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -34,7 +35,7 @@ from homeassistant.const import (
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
@@ -126,6 +127,8 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.entities_filter = logbook_config.entity_filter
+        self.recent_events = logbook_config.recent_events
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -150,12 +153,41 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    @callback
+    def async_get_recent_rows(
+        self, start_day: dt, end_day: dt
+    ) -> tuple[dt, list[EventAsRow]] | None:
+        """Get the rows retained in memory for the end of a period.
+
+        Must be called from the event loop; the result is passed
+        to get_events so only the rest of the period is queried.
+        """
+        if self.recent_events is None:
+            return None
+        return self.recent_events.async_get_rows(
+            start_day,
+            end_day,
+            self.event_types,
+            None if self.limited_select else self.entities_filter,
+            self.entity_ids,
+            self.device_ids,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
         end_day: dt,
+        recent: tuple[dt, list[EventAsRow]] | None = None,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        recent_rows: Iterable[EventAsRow] = ()
+        if recent is not None:
+            recent_start, recent_rows = recent
+            if recent_start.timestamp() <= start_day.timestamp():
+                return self.humanify(recent_rows)
+            # Only the part which is not retained in memory is queried
+            end_day = recent_start
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -181,11 +213,14 @@ class EventProcessor:
                 self.context_id,
             )
             return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+                chain(
+                    execute_stmt_lambda_element(session, stmt, orm_rows=False),
+                    recent_rows,
+                )
             )
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self, rows: Iterable[EventAsRow | Row] | Result
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -201,7 +236,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Iterable[EventAsRow | Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -0,0 +1,284 @@
+"""In memory index of recent logbook events."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import datetime as dt, timedelta
+import math
+import time
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util import dt as dt_util
+from homeassistant.util.event_type import EventType
+
+from .const import (
+    ALWAYS_CONTINUOUS_DOMAINS,
+    BUILT_IN_EVENTS,
+    CONDITIONALLY_CONTINUOUS_DOMAINS,
+)
+from .helpers import event_forwarder_filtered
+from .models import EventAsRow, async_event_to_row
+
+# Upper bound of events retained in memory
+MAX_RECENT_EVENTS = 10000
+
+
+class RecentEvents:
+    """Size bounded ring of the logbook relevant events recorded recently.
+
+    The ring is fed live from the event bus with the events the recorder
+    will write and the logbook can show. Every such event with a timestamp
+    at or after covered_since is retained, so a request for a period which
+    ends after covered_since only has to query the database for the part
+    before it. Events are additionally indexed by context id to serve
+    requests for a single context.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        external_events: dict[EventType[Any] | str, Any],
+        exclude_event_types: set[EventType[Any] | str],
+        entity_filter: Callable[[str], bool] | None,
+        max_events: int = MAX_RECENT_EVENTS,
+    ) -> None:
+        """Init the ring."""
+        self._hass = hass
+        self._external_events = external_events
+        self._exclude_event_types = exclude_event_types
+        self._entity_filter = entity_filter
+        self._max_events = max_events
+        self._events: deque[tuple[float, Event]] = deque()
+        self._contexts: dict[str, list[Event]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self.covered_since_dt = _ceil_to_datetime(time.time())
+        self.covered_since = self.covered_since_dt.timestamp()
+
+    @callback
+    def _async_cover_since(self, timestamp: float) -> None:
+        """Move the start of the retained window."""
+        self.covered_since_dt = _ceil_to_datetime(timestamp)
+        self.covered_since = self.covered_since_dt.timestamp()
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording events."""
+        self._async_cover_since(time.time())
+        self._unsub = self._hass.bus.async_listen(MATCH_ALL, self._async_record_event)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording events and forget the retained ones."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._events.clear()
+        self._contexts.clear()
+
+    @callback
+    def async_reset(self) -> None:
+        """Forget the retained events.
+
+        Called when the logbook learns to describe a new event type since
+        earlier events of that type were not retained.
+        """
+        self._events.clear()
+        self._contexts.clear()
+        self._async_cover_since(time.time())
+
+    def _is_recorded(self, event: Event[Any]) -> bool:
+        """Return if the recorder writes the event and the logbook shows it."""
+        event_type = event.event_type
+        if event_type in self._exclude_event_types:
+            return False
+        if event_type == EVENT_STATE_CHANGED:
+            data: EventStateChangedData = event.data
+            if (old_state := data["old_state"]) is None or (
+                new_state := data["new_state"]
+            ) is None:
+                return False
+            if _is_state_filtered(new_state, old_state):
+                return False
+        elif event_type not in BUILT_IN_EVENTS and (
+            event_type not in self._external_events
+        ):
+            return False
+        if (entity_filter := self._entity_filter) is None or not (
+            entity_id := event.data.get(ATTR_ENTITY_ID)
+        ):
+            return True
+        if isinstance(entity_id, str):
+            return entity_filter(entity_id)
+        if isinstance(entity_id, list):
+            return any(entity_filter(eid) for eid in entity_id)
+        return True
+
+    def _is_linkable(self, event: Event[Any]) -> bool:
+        """Return if the recorder writes an event that may start a context."""
+        if event.event_type in self._exclude_event_types:
+            return False
+        return (
+            event.event_type != EVENT_STATE_CHANGED
+            or event.data["new_state"] is not None
+        )
+
+    @callback
+    def _async_record_event(self, event: Event[Any]) -> None:
+        """Retain an event if the logbook can show it."""
+        if not self._is_recorded(event):
+            return
+        if event.event_type == EVENT_STATE_CHANGED:
+            timestamp = event.data["new_state"].last_updated_timestamp
+        else:
+            timestamp = event.time_fired_timestamp
+        events = self._events
+        events.append((timestamp, event))
+        self._contexts.setdefault(event.context.id, []).append(event)
+        if len(events) <= self._max_events:
+            return
+        evicted_timestamp, evicted = events.popleft()
+        context_id = evicted.context.id
+        bucket = self._contexts[context_id]
+        del bucket[0]
+        if not bucket:
+            del self._contexts[context_id]
+        # Events at or before the evicted one are only in the database now
+        if evicted_timestamp >= self.covered_since:
+            self._async_cover_since(math.nextafter(evicted_timestamp, math.inf))
+
+    @callback
+    def async_get_rows(
+        self,
+        start_day: dt,
+        end_day: dt,
+        event_types: tuple[EventType[Any] | str, ...],
+        entities_filter: Callable[[str], bool] | None,
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+        context_id: str | None,
+    ) -> tuple[dt, list[EventAsRow]] | None:
+        """Return the retained rows matching a logbook request.
+
+        Returns the start of the retained part of the period and the rows
+        in it ordered by time, or None if no part of the period is retained.
+        """
+        start = start_day.timestamp()
+        end = end_day.timestamp()
+        covered_since = self.covered_since
+        if end <= covered_since:
+            return None
+        if start < covered_since:
+            start = covered_since
+            start_day = self.covered_since_dt
+        events: Iterable[Event[Any]]
+        if context_id is not None:
+            events = self._contexts.get(context_id, ())
+        else:
+            events = (event for _, event in self._events)
+        matched: list[Event[Any]] = []
+        forward_event = event_forwarder_filtered(
+            matched.append, entities_filter, entity_ids, device_ids
+        )
+        entity_ids_set = set(entity_ids) if entity_ids else None
+        include_states = bool(context_id or entity_ids or not device_ids)
+        for event in events:
+            if event.event_type != EVENT_STATE_CHANGED:
+                if event.event_type in event_types and (
+                    start <= event.time_fired_timestamp < end
+                ):
+                    if context_id is not None:
+                        matched.append(event)
+                    else:
+                        forward_event(event)
+                continue
+            if not include_states:
+                continue
+            new_state = event.data["new_state"]
+            if not start <= new_state.last_updated_timestamp < end:
+                continue
+            if context_id is None and (
+                (
+                    entity_ids_set is not None
+                    and new_state.entity_id not in entity_ids_set
+                )
+                or (
+                    entity_ids_set is None
+                    and entities_filter is not None
+                    and not entities_filter(new_state.entity_id)
+                )
+            ):
+                continue
+            matched.append(event)
+        rows = [async_event_to_row(event) for event in matched]
+        if context_id is None and (entity_ids or device_ids):
+            rows.extend(self._async_context_only_rows(matched))
+        rows.sort(key=lambda row: row.time_fired_ts)
+        return start_day, rows
+
+    @callback
+    def _async_context_only_rows(self, matched: list[Event[Any]]) -> list[EventAsRow]:
+        """Return the rows which describe the contexts of the matched events.
+
+        Like the context only rows of the entity and device queries, they
+        are not shown but let the context augmenter find the event that
+        started each context.
+        """
+        seen: set[int] = {id(event) for event in matched}
+        rows: list[EventAsRow] = []
+        for context in {event.context.id: event.context for event in matched}.values():
+            linked = self._contexts.get(context.id, [])
+            if (origin_event := context.origin_event) is not None and self._is_linkable(
+                origin_event
+            ):
+                linked = [origin_event, *linked]
+            for event in linked:
+                if id(event) in seen:
+                    continue
+                seen.add(id(event))
+                rows.append(async_event_to_row(event)._replace(context_only=True))
+        return rows
+
+
+def _is_state_filtered(new_state: State, old_state: State) -> bool:
+    """Check if the logbook would not find a state change in the database.
+
+    Mirrors the states filters of the logbook queries, which unlike the
+    live stream only treat sensors with a unit of measurement as continuous.
+    """
+    return bool(
+        new_state.state == old_state.state
+        or new_state.last_changed != new_state.last_updated
+        or new_state.domain in ALWAYS_CONTINUOUS_DOMAINS
+        or (
+            new_state.domain in CONDITIONALLY_CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        )
+    )
+
+
+def _ceil_to_datetime(timestamp: float) -> dt:
+    """Convert a timestamp to the first datetime at or after it.
+
+    Datetimes have microsecond resolution; rounding the start of the
+    retained window down would lose rows between the database query
+    and the retained rows.
+    """
+    when = dt_util.utc_from_timestamp(timestamp)
+    if when.timestamp() < timestamp:
+        when += timedelta(microseconds=1)
+    return when
@@ -7,8 +7,8 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
-from itertools import chain, groupby
+from functools import partial
+from itertools import chain, count, groupby
 import logging
 from operator import attrgetter
 import socket
@@ -17,6 +17,7 @@ import time
 from typing import TYPE_CHECKING, Any
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -116,6 +117,11 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Number of topics for which the matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
+SHARED_SUBSCRIPTION_PREFIX = "$share/"
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt._WebsocketWrapper | Any  # noqa: SLF001
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -265,12 +271,121 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+def _topic_filter(topic: str) -> str:
+    """Return the topic filter used for matching a subscription.
+
+    Shared subscriptions (`$share/<group>/<filter>`) receive messages
+    on the topics matched by the filter without the share prefix.
+    """
+    if topic.startswith(SHARED_SUBSCRIPTION_PREFIX):
+        _, _, topic_filter = topic[len(SHARED_SUBSCRIPTION_PREFIX) :].partition("/")
+        return topic_filter
+    return topic
+
+
+def _filter_matches_topic(filter_levels: list[str], topic: str) -> bool:
+    """Return True if the split topic filter matches the topic."""
+    topic_levels = topic.split("/")
+    if topic.startswith("$") and filter_levels[0] in ("+", "#"):
+        return False
+    for idx, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if idx >= len(topic_levels) or (level not in ("+", topic_levels[idx])):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class _SubscriptionTrieNode:
+    """Node of the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # Subscriptions ending at this node, mapped to their insertion order
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class SubscriptionTrie:
+    """Prefix tree of topic filters.
+
+    Supports the `+` and `#` wildcards and shared subscriptions,
+    and returns all subscriptions matching a topic in O(topic depth).
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._sequence = count()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in _topic_filter(subscription.topic).split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions[subscription] = next(self._sequence)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in _topic_filter(subscription.topic).split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the branch up to the first node still in use
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in insertion order."""
+        matches: dict[Subscription, int] = {}
+        nodes = [self._root]
+        # Wildcards at the first level do not match topics starting with $
+        wildcards = not topic.startswith("$")
+        for level in topic.split("/"):
+            next_nodes: list[_SubscriptionTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+                if (child := children.get("#")) is not None:
+                    matches.update(child.subscriptions)
+            wildcards = True
+            if not (nodes := next_nodes):
+                break
+        else:
+            for node in nodes:
+                matches.update(node.subscriptions)
+                # A `#` wildcard also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.update(child.subscriptions)
+        if len(matches) < 2:
+            return list(matches)
+        return sorted(matches, key=matches.__getitem__)
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -378,6 +493,10 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscription_trie = SubscriptionTrie()
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -745,28 +864,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscription_trie.add(subscription)
+        self._async_invalidate_matching_subscriptions(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -777,12 +893,32 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="mqtt_not_setup_cannot_unsubscribe_twice",
                 translation_placeholders={"topic": topic},
             ) from exc
+        self._async_invalidate_matching_subscriptions(subscription)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(
+        self, subscription: Subscription
+    ) -> None:
+        """Invalidate the cached matches of topics affected by a subscription."""
+        cache = self._matching_subscriptions_cache
+        if subscription.is_simple_match:
+            cache.pop(subscription.topic, None)
+            return
+        filter_levels = _topic_filter(subscription.topic).split("/")
+        # The LRU cache itself is not iterable, so we iterate over a copy of its keys
+        for topic in [
+            topic
+            for topic in cache.keys()  # noqa: SIM118
+            if _filter_matches_topic(filter_levels, topic)
+        ]:
+            del cache[topic]
 
     @callback
     def _async_queue_subscriptions(
@@ -846,12 +982,12 @@ class MQTT:
             )
 
         job = HassJob(msg_callback, job_type=job_type)
-        is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
+        is_simple_match = not (
+            "+" in topic or "#" in topic or topic.startswith(SHARED_SUBSCRIPTION_PREFIX)
+        )
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -863,7 +999,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1056,18 +1191,16 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscription_trie.match(topic))
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -1267,13 +1400,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()  # type: ignore[no-untyped-call]
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)  # type: ignore[no-untyped-call]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import astuple, dataclass
@@ -62,7 +63,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import (
     config_validation as cv,
     entityfilter,
@@ -126,8 +133,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -141,6 +146,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
+        hass,
         entity_filter,
         namespace,
         climate_units,
@@ -148,6 +154,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -158,6 +165,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     for state in hass.states.all():
         if entity_filter(state.entity_id):
             metrics.handle_state(state)
+            metrics.exported_entity_ids.add(state.entity_id)
 
     return True
 
@@ -178,11 +186,24 @@ class MetricNameWithLabelValues:
     label_values: tuple[str, ...]
 
 
+@dataclass(slots=True)
+class PendingStateChanges:
+    """State changes of an entity which were not exported yet."""
+
+    state: State | None = None
+    changes: int = 0
+    # Changes to a state which is not unavailable or unknown
+    available_changes: int = 0
+    # Remove the labelsets of the entity before exporting the changes
+    remove_labelsets: bool = False
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
     def __init__(
         self,
+        hass: HomeAssistant,
         entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
@@ -191,6 +212,7 @@ class PrometheusMetrics:
         default_metric: str | None,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self._hass = hass
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -214,28 +236,97 @@ class PrometheusMetrics:
         self._metrics_by_entity_id: dict[str, set[MetricNameWithLabelValues]] = (
             defaultdict(set)
         )
+        # Labeled metrics by metric name and label values
+        self._labeled_metrics: dict[tuple[str, tuple[str, ...]], Any] = {}
+        # Labels of each entity, which are rebuilt if its friendly name changes
+        self._entity_labels: dict[str, dict[str, Any]] = {}
+        self._domain_handlers: dict[str, Callable[[State], None] | None] = {}
         self._climate_units = climate_units
-
+        # State changes are only collected when they happen and they are
+        # exported when the metrics are requested, which avoids exporting
+        # every state change of an entity between two scrapes
+        self._pending: dict[str, PendingStateChanges] = {}
+        self._update_lock = asyncio.Lock()
+        self._update_scheduled = False
+        # Entities which are exported, or which will be by the scheduled update
+        self.exported_entity_ids: set[str] = set()
+
+    @callback
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
         if (state := event.data.get("new_state")) is None:
             return
 
-        if not self._filter(state.entity_id):
-            _LOGGER.debug("Filtered out entity %s", state.entity_id)
+        entity_id = state.entity_id
+        if not self._filter(entity_id):
+            _LOGGER.debug("Filtered out entity %s", entity_id)
             return
 
+        if (pending := self._pending.get(entity_id)) is None:
+            pending = self._pending[entity_id] = PendingStateChanges()
+
         if (
             old_state := event.data.get("old_state")
         ) is not None and old_state.attributes.get(
             ATTR_FRIENDLY_NAME
         ) != state.attributes.get(ATTR_FRIENDLY_NAME):
-            self._remove_labelsets(old_state.entity_id)
+            # The labelsets with the old name are removed together with
+            # the changes which were counted for them
+            pending.remove_labelsets = True
+            pending.changes = pending.available_changes = 0
+
+        pending.state = state
+        pending.changes += 1
+        if state.state not in IGNORED_STATES:
+            pending.available_changes += 1
+
+        if entity_id not in self.exported_entity_ids:
+            # Export new entities right away
+            self.exported_entity_ids.add(entity_id)
+            self._async_schedule_update()
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Schedule exporting the pending state changes."""
+        if self._update_scheduled:
+            return
+        self._update_scheduled = True
+        self._hass.async_create_task(
+            self.async_update(), "prometheus update", eager_start=False
+        )
 
-        self.handle_state(state)
+    async def async_update(self) -> None:
+        """Export the pending state changes."""
+        async with self._update_lock:
+            self._update_scheduled = False
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            await self._hass.async_add_executor_job(
+                self._export_pending_state_changes, pending
+            )
 
-    def handle_state(self, state: State) -> None:
-        """Add/update a state in Prometheus."""
+    def _export_pending_state_changes(
+        self, pending: dict[str, PendingStateChanges]
+    ) -> None:
+        """Export the pending state changes of entities."""
+        for entity_id, changes in pending.items():
+            if changes.remove_labelsets:
+                self._remove_labelsets(entity_id)
+            if changes.state is not None:
+                self.handle_state(
+                    changes.state, changes.changes, changes.available_changes
+                )
+
+    def handle_state(
+        self, state: State, changes: int = 1, available_changes: int = 1
+    ) -> None:
+        """Add/update a state in Prometheus.
+
+        changes is the number of state changes of the entity since it was
+        last exported, available_changes the number of those changes to a
+        state which is not unavailable or unknown.
+        """
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
 
@@ -246,7 +337,7 @@ class PrometheusMetrics:
             prometheus_client.Counter,
             "The number of state changes",
             labels,
-        ).inc()
+        ).inc(changes)
 
         self._metric(
             "entity_available",
@@ -267,12 +358,24 @@ class PrometheusMetrics:
                 entity_id,
                 {"state_change", "entity_available", "last_updated_time_seconds"},
             )
-        else:
+        elif state.state:
             domain, _ = hacore.split_entity_id(entity_id)
-            handler = f"_handle_{domain}"
-            if hasattr(self, handler) and state.state:
-                getattr(self, handler)(state)
+            if domain == "automation":
+                self._handle_automation(state, available_changes)
+            elif (handler := self._domain_handler(domain)) is not None:
+                handler(state)
 
+    def _domain_handler(self, domain: str) -> Callable[[State], None] | None:
+        """Return the handler for the states of a domain."""
+        try:
+            return self._domain_handlers[domain]
+        except KeyError:
+            handler = self._domain_handlers[domain] = getattr(
+                self, f"_handle_{domain}", None
+            )
+            return handler
+
+    @callback
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -296,7 +399,11 @@ class PrometheusMetrics:
                 metrics_entity_id = entity_id
 
         if metrics_entity_id:
-            self._remove_labelsets(metrics_entity_id)
+            # State changes before the update are not exported anymore
+            self._pending[metrics_entity_id] = PendingStateChanges(
+                remove_labelsets=True
+            )
+            self.exported_entity_ids.discard(metrics_entity_id)
 
     def _remove_labelsets(
         self,
@@ -321,9 +428,11 @@ class PrometheusMetrics:
             )
             removed_metrics.add(metric)
             self._metrics[metric_name].remove(*label_values)
+            del self._labeled_metrics[metric_name, label_values]
         metric_set -= removed_metrics
         if not metric_set:
             del self._metrics_by_entity_id[entity_id]
+            self._entity_labels.pop(entity_id, None)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -346,6 +455,11 @@ class PrometheusMetrics:
         documentation: str,
         labels: dict[str, str],
     ) -> _MetricBaseT:
+        label_values = tuple(labels.values())
+        try:
+            return cast(_MetricBaseT, self._labeled_metrics[metric_name, label_values])
+        except KeyError:
+            pass
         try:
             metric = cast(_MetricBaseT, self._metrics[metric_name])
         except KeyError:
@@ -360,9 +474,12 @@ class PrometheusMetrics:
             )
             metric = cast(_MetricBaseT, self._metrics[metric_name])
         self._metrics_by_entity_id[labels["entity"]].add(
-            MetricNameWithLabelValues(metric_name, tuple(labels.values()))
+            MetricNameWithLabelValues(metric_name, label_values)
         )
-        return metric.labels(**labels)
+        labeled_metric = self._labeled_metrics[metric_name, label_values] = (
+            metric.labels(**labels)
+        )
+        return labeled_metric
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -383,18 +500,22 @@ class PrometheusMetrics:
             value = None
         return value
 
-    @staticmethod
     def _labels(
+        self,
         state: State,
         extra_labels: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        if extra_labels is None:
-            extra_labels = {}
-        labels = {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (labels := self._entity_labels.get(state.entity_id)) is None or labels[
+            "friendly_name"
+        ] != friendly_name:
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        if not extra_labels:
+            return labels
         if not labels.keys().isdisjoint(extra_labels.keys()):
             conflicting_keys = labels.keys() & extra_labels.keys()
             raise ValueError(
@@ -811,13 +932,13 @@ class PrometheusMetrics:
     def _handle_zwave(self, state: State) -> None:
         self._battery(state)
 
-    def _handle_automation(self, state: State) -> None:
+    def _handle_automation(self, state: State, triggers: int) -> None:
         self._metric(
             "automation_triggered_count",
             prometheus_client.Counter,
             "Count of times an automation has been triggered",
             self._labels(state),
-        ).inc()
+        ).inc(triggers)
 
     def _handle_counter(self, state: State) -> None:
         if (value := self.state_as_number(state)) is None:
@@ -860,15 +981,17 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self.metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
+        await self.metrics.async_update()
         body = await hass.async_add_executor_job(
             prometheus_client.generate_latest, prometheus_client.REGISTRY
         )
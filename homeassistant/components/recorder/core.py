@@ -16,7 +16,15 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    Table,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -203,6 +211,13 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events and States are not added to the event session, they are
+        # written with executemany statements when the session is committed
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
+        # States can only be bulk inserted if the database can return the
+        # state_ids of an executemany INSERT in order
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -687,6 +702,23 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, session: Session, dbevent: Events) -> None:
+        """Add an event to be bulk inserted on the next commit."""
+        # Rows are only bulk inserted once the schema is fully migrated
+        if self.schema_version != SCHEMA_VERSION:
+            self._add_to_session(session, dbevent)
+            return
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
+    def _add_pending_state(self, session: Session, dbstate: States) -> None:
+        """Add a state to be bulk inserted on the next commit."""
+        if not self._bulk_insert_states or self.schema_version != SCHEMA_VERSION:
+            self._add_to_session(session, dbstate)
+            return
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(dbstate)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1053,7 +1085,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1078,7 +1110,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1160,7 +1192,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_pending_state(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1208,6 +1240,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            self._bulk_insert_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1226,6 +1261,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._pending_events.clear()
+        self._pending_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1243,6 +1280,47 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _bulk_insert_pending(self, session: Session) -> None:
+        """Insert the pending events and states with executemany statements.
+
+        This avoids the overhead of the unit of work for the rows we write
+        the most. New rows for the deduplicated tables (event types, event
+        data, states meta and state attributes) are still added to the
+        session and flushed first, so their ids are known.
+        """
+        session.flush()
+        if pending_events := self._pending_events:
+            session.execute(
+                insert(cast(Table, Events.__table__)),
+                [_event_row(dbevent) for dbevent in pending_events],
+            )
+        pending_states = self._pending_states
+        states_table = cast(Table, States.__table__)
+        insert_states = insert(states_table).returning(
+            states_table.c.state_id, sort_by_parameter_order=True
+        )
+        # A state can only be inserted once the state it links to
+        # with old_state_id has been inserted and has a state_id, which is
+        # only the case when an entity changed multiple times before a commit.
+        while pending_states:
+            seen: set[int] = set()
+            batch: list[States] = []
+            deferred: list[States] = []
+            for dbstate in pending_states:
+                seen.add(id(dbstate))
+                if (old_state := dbstate.old_state) is not None and id(
+                    old_state
+                ) in seen:
+                    deferred.append(dbstate)
+                else:
+                    batch.append(dbstate)
+            result = session.execute(
+                insert_states, [_state_row(dbstate) for dbstate in batch]
+            )
+            for dbstate, state_id in zip(batch, result.scalars(), strict=True):
+                dbstate.state_id = state_id
+            pending_states = deferred
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1257,6 +1335,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events.clear()
+        self._pending_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1425,6 +1505,9 @@ class Recorder(threading.Thread):
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1490,3 +1573,49 @@ class Recorder(threading.Thread):
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+
+
+def _event_row(dbevent: Events) -> dict[str, Any]:
+    """Return the values to insert for a pending event."""
+    event_type_id = dbevent.event_type_id
+    if event_type_id is None and (event_type_rel := dbevent.event_type_rel):
+        event_type_id = event_type_rel.event_type_id
+    data_id = dbevent.data_id
+    if data_id is None and (event_data_rel := dbevent.event_data_rel):
+        data_id = event_data_rel.data_id
+    return {
+        "origin_idx": dbevent.origin_idx,
+        "time_fired_ts": dbevent.time_fired_ts,
+        "context_id_bin": dbevent.context_id_bin,
+        "context_user_id_bin": dbevent.context_user_id_bin,
+        "context_parent_id_bin": dbevent.context_parent_id_bin,
+        "event_type_id": event_type_id,
+        "data_id": data_id,
+    }
+
+
+def _state_row(dbstate: States) -> dict[str, Any]:
+    """Return the values to insert for a pending state."""
+    metadata_id = dbstate.metadata_id
+    if metadata_id is None and (states_meta_rel := dbstate.states_meta_rel):
+        metadata_id = states_meta_rel.metadata_id
+    attributes_id = dbstate.attributes_id
+    if attributes_id is None and (state_attributes := dbstate.state_attributes):
+        attributes_id = state_attributes.attributes_id
+    old_state_id = dbstate.old_state_id
+    if old_state_id is None and (old_state := dbstate.old_state):
+        old_state_id = old_state.state_id
+    return {
+        "entity_id": dbstate.entity_id,
+        "state": dbstate.state,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "origin_idx": dbstate.origin_idx,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
@@ -7,15 +7,18 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    ColumnarStates,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +27,11 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "ColumnarStates",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +120,51 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, ColumnarStates]:
+    """Return a dict of significant states during a time period as columns."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+        )
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    result: dict[str, ColumnarStates] = {}
+    for entity_id, states in _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        True,
+        True,
+        True,
+    ).items():
+        columns = result[entity_id] = ColumnarStates()
+        for state in states:
+            assert isinstance(state, dict)
+            columns.append(
+                state[COMPRESSED_STATE_STATE], state[COMPRESSED_STATE_LAST_UPDATED]
+            )
+    return result
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from array import array
+from base64 import b64encode
 from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import groupby
+from math import isfinite, nan
 from operator import itemgetter
+import sys
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -56,6 +61,67 @@ _FIELD_MAP = {
 }
 
 
+@dataclass(slots=True)
+class ColumnarStates:
+    """History of an entity as parallel columns.
+
+    timestamps holds the last_updated timestamp of each state. values
+    holds the numeric value of the state, or NaN if the state is not
+    numeric. codes holds the index of non numeric states in dictionary,
+    or -1 if the state is numeric.
+    """
+
+    timestamps: array[float] = field(default_factory=lambda: array("d"))
+    values: array[float] = field(default_factory=lambda: array("d"))
+    codes: array[int] = field(default_factory=lambda: array("i"))
+    dictionary: list[str] = field(default_factory=list)
+    _dictionary_codes: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self.timestamps)
+
+    def append(self, state: str, timestamp: float) -> None:
+        """Append a state."""
+        self.timestamps.append(timestamp)
+        if (code := self._dictionary_codes.get(state)) is None:
+            try:
+                value = float(state)
+            except (TypeError, ValueError):
+                value = nan
+            if isfinite(value):
+                self.values.append(value)
+                self.codes.append(-1)
+                return
+            code = self._dictionary_codes[state] = len(self.dictionary)
+            self.dictionary.append(state)
+        self.values.append(nan)
+        self.codes.append(code)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the columns in a form that can be serialized to JSON.
+
+        The timestamps and values are sent as base64 encoded little endian
+        64 bit floats, the codes as little endian 32 bit integers. Each
+        column is encoded from its buffer at once, without creating an
+        object per state.
+        """
+        return {
+            "lu": _encode_column(self.timestamps),
+            "v": _encode_column(self.values),
+            "c": _encode_column(self.codes),
+            "d": self.dictionary,
+        }
+
+
+def _encode_column(column: array[Any]) -> str:
+    """Encode a column as base64 in little endian byte order."""
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return b64encode(column).decode()
+
+
 def _stmt_and_join_attributes(
     no_attributes: bool,
     include_last_changed: bool,
@@ -139,6 +205,27 @@ def get_significant_states(
         )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, ColumnarStates]:
+    """Wrap get_significant_states_columnar_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+        )
+
+
 def _significant_states_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -232,6 +319,84 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columnar_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, ColumnarStates]:
+    """Return state changes during UTC period start_time - end_time as columns.
+
+    Attributes are not included and, like with minimal_response, states
+    that are the same as the previous state of the entity are left out.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_columns(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+    )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], dict[str, int | None], float | None] | None:
+    """Return the rows of the significant states query.
+
+    Also returns the entity_id to metadata_id mapping and the start time
+    timestamp if the start time state is included.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +405,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,14 +443,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -814,3 +975,35 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+) -> dict[str, ColumnarStates]:
+    """Convert SQL results into columns per entity.
+
+    States must be sorted by entity_id and last_updated.
+    """
+    result: dict[str, ColumnarStates] = {
+        entity_id: ColumnarStates() for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        columns = result[metadata_id_to_entity_id[metadata_id]]
+        append = columns.append
+        prev_state: str | None = None
+        for row in group:
+            if (state := row[state_idx]) == prev_state:
+                continue
+            prev_state = state
+            # The start time state has a last_updated_ts of 0
+            append(state, row[last_updated_ts_idx] or start_time_ts or 0.0)
+
+    return {key: val for key, val in result.items() if val}
@@ -26,12 +26,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,6 +86,151 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Recent states of the sensors for which statistics are compiled
+STATES_BUFFER: HassKey[StatesBuffer] = HassKey(f"{DOMAIN}_statistics_states_buffer")
+# Buffered states per sensor, half of them are dropped when exceeded
+MAX_BUFFERED_STATES = 4096
+
+
+class StatesBuffer:
+    """Buffer the states of sensors until their statistics are compiled.
+
+    compile_statistics reads the states of a period from the buffer instead of
+    reading back the states the recorder just wrote. The states of a sensor are
+    only used when the buffer knows its state during the whole period, else the
+    states are read from the database.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the buffer."""
+        self._hass = hass
+        self._states: dict[str, list[State]] = {}
+        self._covered_since = 0.0
+        self._recording = True
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start buffering states."""
+        if self._unsub is not None:
+            return
+        self._covered_since = dt_util.utcnow().timestamp()
+        self._async_seed()
+        self._unsub = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_sensor_event_filter,
+        )
+
+    @callback
+    def _async_seed(self) -> None:
+        """Start with the current state of the sensors."""
+        self._states = {
+            state.entity_id: [state]
+            for state in self._hass.states.async_all(DOMAIN)
+            if ATTR_STATE_CLASS in state.attributes
+        }
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Buffer a new state."""
+        if not get_instance(self._hass).enabled:
+            # States are not recorded, the database has a gap
+            self._recording = False
+            self._states.clear()
+            return
+        if not self._recording:
+            self._recording = True
+            self._covered_since = event.time_fired_timestamp
+            self._async_seed()
+            return
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._states.pop(entity_id, None)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            if ATTR_STATE_CLASS in new_state.attributes:
+                self._states[entity_id] = [new_state]
+            return
+        states.append(new_state)
+        if len(states) > MAX_BUFFERED_STATES:
+            del states[: MAX_BUFFERED_STATES // 2]
+
+    @callback
+    def async_prune(self, timestamp: float) -> None:
+        """Drop states which are not needed for periods starting at timestamp."""
+        for states in self._states.values():
+            keep = 0
+            for idx, state in enumerate(states):
+                if state.last_updated_timestamp > timestamp:
+                    break
+                keep = idx
+            if keep:
+                del states[:keep]
+
+    def get_states(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entity_ids: list[str],
+        significant_changes_only: bool,
+    ) -> dict[str, list[State]]:
+        """Return the states of the sensors the buffer covers during start-end.
+
+        The states match what history returns from the database: the state at
+        the start of the period followed by the states during the period.
+        """
+        start_time = start - datetime.timedelta.resolution
+        start_ts = start_time.timestamp()
+        end_ts = end.timestamp()
+        if start_ts < self._covered_since:
+            return {}
+        result: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            # Copy as states are added in the event loop
+            states = list(self._states.get(entity_id, ()))
+            if not states or states[0].last_updated_timestamp > start_ts:
+                continue
+            start_state: State | None = None
+            period_states: list[State] = []
+            for state in states:
+                if (last_updated_ts := state.last_updated_timestamp) <= start_ts:
+                    start_state = state
+                elif last_updated_ts < end_ts and (
+                    not significant_changes_only
+                    or state.last_changed_timestamp == last_updated_ts
+                ):
+                    period_states.append(state)
+            if start_state is not None:
+                # The database returns the start state at the start of the period
+                period_states.insert(
+                    0,
+                    State(
+                        entity_id,
+                        start_state.state,
+                        start_state.attributes,
+                        start_time,
+                        start_time,
+                        start_time,
+                        validate_entity_id=False,
+                    ),
+                )
+            result[entity_id] = period_states
+        return result
+
+
+@callback
+def _async_sensor_event_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes of sensors."""
+    return event_data["entity_id"].startswith("sensor.")
+
+
+def _get_states_buffer(hass: HomeAssistant) -> StatesBuffer:
+    """Return the states buffer, it starts buffering in the event loop."""
+    if (states_buffer := hass.data.get(STATES_BUFFER)) is None:
+        states_buffer = hass.data[STATES_BUFFER] = StatesBuffer(hass)
+        hass.loop.call_soon_threadsafe(states_buffer.async_start)
+    return states_buffer
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -413,34 +566,53 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    states_buffer = _get_states_buffer(hass)
+    # Get history between start and end, from the buffer when it has the states
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+    history_list = states_buffer.get_states(start, end, entities_full_history, False)
+    if entities_full_history := [
+        entity_id
+        for entity_id in entities_full_history
+        if entity_id not in history_list
+    ]:
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+    history_list.update(
+        states_buffer.get_states(start, end, entities_significant_history, True)
+    )
+    if entities_significant_history := [
+        entity_id
+        for entity_id in entities_significant_history
+        if entity_id not in history_list
+    ]:
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
+    # The states before the end are no longer needed for the next period
+    hass.loop.call_soon_threadsafe(
+        states_buffer.async_prune, (end - datetime.timedelta.resolution).timestamp()
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -0,0 +1,199 @@
+"""Incremental aggregation of the statistics sample window."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Collection
+import math
+
+
+class SlidingWindowAggregator:
+    """Maintain aggregates of a FIFO window of numeric samples.
+
+    Samples are appended at the end of the window and evicted from the
+    front, mirroring the states and ages deques of the statistics sensor.
+    Every update is O(1) amortized for the moments and extremes and
+    O(log n) search plus a memmove for the order statistics, so the cost
+    of a new sample no longer grows with the configured buffer size.
+    """
+
+    __slots__ = (
+        "_count",
+        "_head_seq",
+        "_m2",
+        "_max_deque",
+        "_mean",
+        "_min_deque",
+        "_removals_since_resync",
+        "_sorted",
+        "_sum",
+        "_sum_compensation",
+        "_tail_seq",
+    )
+
+    def __init__(self, *, track_extremes: bool, track_order: bool) -> None:
+        """Initialize the aggregator."""
+        self._count = 0
+        # Neumaier compensated running sum
+        self._sum = 0.0
+        self._sum_compensation = 0.0
+        # Welford running mean and sum of squared deviations
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removals_since_resync = 0
+        # Sequence numbers of the oldest and the next sample
+        self._head_seq = 0
+        self._tail_seq = 0
+        # Monotonic deques of (seq, value, age), front is the current extreme
+        self._max_deque: deque[tuple[int, float, float]] | None = (
+            deque() if track_extremes else None
+        )
+        self._min_deque: deque[tuple[int, float, float]] | None = (
+            deque() if track_extremes else None
+        )
+        self._sorted: list[float] | None = [] if track_order else None
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    def append(self, value: float, age: float) -> None:
+        """Add a sample at the end of the window."""
+        seq = self._tail_seq
+        self._tail_seq += 1
+        self._count += 1
+        self._add_to_sum(value)
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if (max_deque := self._max_deque) is not None:
+            # Strict comparisons keep the oldest of equal extremes at the front
+            while max_deque and max_deque[-1][1] < value:
+                max_deque.pop()
+            max_deque.append((seq, value, age))
+            min_deque = self._min_deque
+            assert min_deque is not None
+            while min_deque and min_deque[-1][1] > value:
+                min_deque.pop()
+            min_deque.append((seq, value, age))
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+    def popleft(self, value: float, remaining: Collection[float]) -> None:
+        """Evict the oldest sample from the window.
+
+        The caller passes the evicted value and the values left in the
+        window; the latter are only read when the running moments are
+        periodically recomputed to shed accumulated rounding errors.
+        """
+        seq = self._head_seq
+        self._head_seq += 1
+        self._count -= 1
+        if (max_deque := self._max_deque) is not None:
+            if max_deque and max_deque[0][0] == seq:
+                max_deque.popleft()
+            min_deque = self._min_deque
+            assert min_deque is not None
+            if min_deque and min_deque[0][0] == seq:
+                min_deque.popleft()
+        if (sorted_values := self._sorted) is not None:
+            idx = bisect_left(sorted_values, value)
+            if idx < len(sorted_values) and sorted_values[idx] == value:
+                del sorted_values[idx]
+            else:
+                # NaN does not bisect, fall back to a linear identity lookup
+                sorted_values.remove(value)
+        if not self._count:
+            self._reset_moments()
+            return
+        self._removals_since_resync += 1
+        if self._removals_since_resync >= self._count:
+            # Resyncing once per window length keeps eviction O(1) amortized
+            self._resync_moments(remaining)
+            return
+        self._add_to_sum(-value)
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def _add_to_sum(self, value: float) -> None:
+        """Add a value to the compensated running sum."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._sum_compensation += (self._sum - total) + value
+        else:
+            self._sum_compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _reset_moments(self) -> None:
+        """Reset the running moments of an empty window."""
+        self._sum = self._sum_compensation = 0.0
+        self._mean = self._m2 = 0.0
+        self._removals_since_resync = 0
+
+    def _resync_moments(self, values: Collection[float]) -> None:
+        """Recompute the running moments from the samples in the window."""
+        self._reset_moments()
+        for value in values:
+            self._add_to_sum(value)
+        self._mean = self.sum / self._count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum + self._sum_compensation
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, 0 for a single sample."""
+        if self._count < 2:
+            return 0.0
+        # Rounding can push the running m2 slightly below zero
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    @property
+    def max(self) -> tuple[float, float]:
+        """Return the maximum value and the age of its oldest occurrence."""
+        if self._max_deque is not None:
+            _, value, age = self._max_deque[0]
+            return value, age
+        raise RuntimeError("Extremes are not tracked")
+
+    @property
+    def min(self) -> tuple[float, float]:
+        """Return the minimum value and the age of its oldest occurrence."""
+        if self._min_deque is not None:
+            _, value, age = self._min_deque[0]
+            return value, age
+        raise RuntimeError("Extremes are not tracked")
+
+    @property
+    def median(self) -> float:
+        """Return the median of the samples."""
+        if (data := self._sorted) is None:
+            raise RuntimeError("Order statistics are not tracked")
+        mid = self._count // 2
+        if self._count % 2:
+            return data[mid]
+        return (data[mid - 1] + data[mid]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of two or more samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        if (data := self._sorted) is None:
+            raise RuntimeError("Order statistics are not tracked")
+        count = self._count
+        m = count + 1
+        j = percentile * m // 100
+        j = max(1, min(j, count - 1))
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
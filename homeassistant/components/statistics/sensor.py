@@ -59,6 +59,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregation import SlidingWindowAggregator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -362,6 +363,103 @@ def _stat_variance(
     return None
 
 
+# Statistics for numeric sensor computed from the incremental aggregator
+
+
+def _window_datetime_value_max(
+    window: SlidingWindowAggregator, percentile: int
+) -> datetime | None:
+    if len(window) > 0:
+        return dt_util.utc_from_timestamp(window.max[1])
+    return None
+
+
+def _window_datetime_value_min(
+    window: SlidingWindowAggregator, percentile: int
+) -> datetime | None:
+    if len(window) > 0:
+        return dt_util.utc_from_timestamp(window.min[1])
+    return None
+
+
+def _window_distance_95_percent_of_values(
+    window: SlidingWindowAggregator, percentile: int
+) -> float | None:
+    if len(window) >= 1:
+        return 2 * 1.96 * math.sqrt(window.variance)
+    return None
+
+
+def _window_distance_99_percent_of_values(
+    window: SlidingWindowAggregator, percentile: int
+) -> float | None:
+    if len(window) >= 1:
+        return 2 * 2.58 * math.sqrt(window.variance)
+    return None
+
+
+def _window_distance_absolute(
+    window: SlidingWindowAggregator, percentile: int
+) -> float | None:
+    if len(window) > 0:
+        return window.max[0] - window.min[0]
+    return None
+
+
+def _window_mean(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.mean
+    return None
+
+
+def _window_median(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.median
+    return None
+
+
+def _window_percentile(
+    window: SlidingWindowAggregator, percentile: int
+) -> float | None:
+    if len(window) == 1:
+        return window.median
+    if len(window) >= 2:
+        return window.percentile(percentile)
+    return None
+
+
+def _window_standard_deviation(
+    window: SlidingWindowAggregator, percentile: int
+) -> float | None:
+    if len(window) > 0:
+        return math.sqrt(window.variance)
+    return None
+
+
+def _window_sum(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.sum
+    return None
+
+
+def _window_value_max(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.max[0]
+    return None
+
+
+def _window_value_min(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.min[0]
+    return None
+
+
+def _window_variance(window: SlidingWindowAggregator, percentile: int) -> float | None:
+    if len(window) > 0:
+        return window.variance
+    return None
+
+
 # Statistics for binary sensor
 
 
@@ -455,6 +553,40 @@ STATS_NUMERIC_SUPPORT = {
     STAT_VARIANCE: _stat_variance,
 }
 
+# Numeric statistics maintained incrementally instead of scanning the buffer
+STATS_NUMERIC_INCREMENTAL: dict[
+    str, Callable[[SlidingWindowAggregator, int], float | datetime | None]
+] = {
+    STAT_AVERAGE_TIMELESS: _window_mean,
+    STAT_DATETIME_VALUE_MAX: _window_datetime_value_max,
+    STAT_DATETIME_VALUE_MIN: _window_datetime_value_min,
+    STAT_DISTANCE_95P: _window_distance_95_percent_of_values,
+    STAT_DISTANCE_99P: _window_distance_99_percent_of_values,
+    STAT_DISTANCE_ABSOLUTE: _window_distance_absolute,
+    STAT_MEAN: _window_mean,
+    STAT_MEDIAN: _window_median,
+    STAT_PERCENTILE: _window_percentile,
+    STAT_STANDARD_DEVIATION: _window_standard_deviation,
+    STAT_SUM: _window_sum,
+    STAT_TOTAL: _window_sum,
+    STAT_VALUE_MAX: _window_value_max,
+    STAT_VALUE_MIN: _window_value_min,
+    STAT_VARIANCE: _window_variance,
+}
+
+# Incremental statistics which need the window extremes or its sort order
+STATS_INCREMENTAL_EXTREMES = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+STATS_INCREMENTAL_ORDER = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+
 # Statistics supported by a binary_sensor source
 STATS_BINARY_SUPPORT = {
     STAT_AVERAGE_STEP: _stat_binary_average_step,
@@ -695,6 +827,18 @@ class StatisticsSensor(SensorEntity):
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        self._aggregator: SlidingWindowAggregator | None = None
+        self._incremental_characteristic_fn: (
+            Callable[[SlidingWindowAggregator, int], float | datetime | None] | None
+        ) = None
+        if not self.is_binary and state_characteristic in STATS_NUMERIC_INCREMENTAL:
+            self._aggregator = SlidingWindowAggregator(
+                track_extremes=state_characteristic in STATS_INCREMENTAL_EXTREMES,
+                track_order=state_characteristic in STATS_INCREMENTAL_ORDER,
+            )
+            self._incremental_characteristic_fn = STATS_NUMERIC_INCREMENTAL[
+                state_characteristic
+            ]
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -799,7 +943,12 @@ class StatisticsSensor(SensorEntity):
                 assert new_state.state in ("on", "off")
                 self.states.append(new_state.state == "on")
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+                if len(self.states) == self._samples_max_buffer_size:
+                    self._popleft_sample()
+                self.states.append(value)
+                if self._aggregator is not None:
+                    self._aggregator.append(value, new_state.last_reported_timestamp)
             self.ages.append(new_state.last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
@@ -944,8 +1093,14 @@ class StatisticsSensor(SensorEntity):
                     dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft_sample()
+
+    def _popleft_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if self._aggregator is not None:
+            self._aggregator.popleft(value, self.states)
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
@@ -1091,7 +1246,16 @@ class StatisticsSensor(SensorEntity):
         One of the _stat_*() functions is represented by self._state_characteristic_fn().
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        value: float | int | datetime | None
+        if self._incremental_characteristic_fn is not None:
+            assert self._aggregator is not None
+            value = self._incremental_characteristic_fn(
+                self._aggregator, self._percentile
+            )
+        else:
+            value = self._state_characteristic_fn(
+                self.states, self.ages, self._percentile
+            )
         _LOGGER.debug(
             "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
         )
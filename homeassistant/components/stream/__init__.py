@@ -611,7 +611,17 @@ class Stream:
 
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        diagnostics = self._diagnostics.as_dict()
+        # Segments are shared by the outputs
+        segments = {
+            id(segment): segment
+            for output in self._outputs.values()
+            for segment in output.get_segments()
+        }
+        diagnostics["segment_bytes"] = sum(
+            segment.data_size_with_init for segment in segments.values()
+        )
+        return diagnostics
 
 
 def _should_retry() -> bool:
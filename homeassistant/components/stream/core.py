@@ -77,8 +77,9 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), which is a view of the segment data once the
+    # segment is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +103,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts, set when the segment is complete
+    _data: memoryview | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -128,18 +131,31 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        data: memoryview | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part, which also comes with
+        the data of all parts.
         """
         self.parts.append(part)
         self.duration = duration
+        if data is not None:
+            # Keep the data of the parts only once as views of the segment
+            # data, which can then be served without joining the parts
+            offset = 0
+            for segment_part in self.parts:
+                end = offset + len(segment_part.data)
+                segment_part.data = data[offset:end]
+                offset = end
+            self._data = data
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init."""
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
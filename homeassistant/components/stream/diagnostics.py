@@ -18,9 +18,9 @@ class Diagnostics:
         self._counter: Counter = Counter()
         self._values: dict[str, Any] = {}
 
-    def increment(self, key: str) -> None:
+    def increment(self, key: str, count: int = 1) -> None:
         """Increment a counter for the specified key/event."""
-        self._counter.update(Counter({key: 1}))
+        self._counter.update(Counter({key: count}))
 
     def set_value(self, key: str, value: Any) -> None:
         """Update a key/value pair."""
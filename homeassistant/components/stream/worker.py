@@ -130,6 +130,8 @@ class StreamMuxer:
     # the following 2 member variables are used for Part formation
     _memory_file_pos: int
     _part_start_dts: float
+    # the position of the data of the first part in the memory_file
+    _segment_data_pos: int
 
     def __init__(
         self,
@@ -292,7 +294,7 @@ class StreamMuxer:
             _stream_outputs=self._stream_state.outputs,
             start_time=self._start_time,
         )
-        self._memory_file_pos = self._memory_file.tell()
+        self._memory_file_pos = self._segment_data_pos = self._memory_file.tell()
         self._memory_file.seek(0, SEEK_END)
 
     def check_flush_part(self, packet: av.Packet) -> None:
@@ -355,7 +357,22 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        segment_data: memoryview | None = None
+        if last_part:
+            # The memory_file is not written anymore, so the last part and the
+            # data of the whole segment are views of its buffer
+            segment_data = memoryview(self._memory_file.getvalue())[
+                self._segment_data_pos :
+            ]
+            part_data: bytes | memoryview = segment_data[
+                self._memory_file_pos - self._segment_data_pos :
+            ]
+        else:
+            self._memory_file.seek(self._memory_file_pos)
+            part_data = self._memory_file.read()
+            self._stream_state.diagnostics.increment(
+                "part_bytes_copied", len(part_data)
+            )
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -363,7 +380,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=part_data,
             ),
             (
                 (
@@ -374,6 +391,7 @@ class StreamMuxer:
                 if last_part
                 else 0
             ),
+            segment_data,
         )
         if last_part:
             # If we've written the last part, we can close the memory_file.
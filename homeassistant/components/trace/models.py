@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
+import sys
 from typing import Any
 
 from homeassistant.core import Context
@@ -106,6 +107,7 @@ class ActionTrace(BaseTrace):
                 "config": self._config,
                 "blueprint_inputs": self._blueprint_inputs,
                 "context": self.context,
+                "memory_usage": self.memory_usage(),
             }
         )
 
@@ -114,6 +116,16 @@ class ActionTrace(BaseTrace):
             self._dict = result
         return result
 
+    def memory_usage(self) -> int:
+        """Return the approximate number of bytes retained by the trace steps."""
+        if not self._trace:
+            return 0
+        return sum(
+            sys.getsizeof(trace_list)
+            + sum(element.memory_usage() for element in trace_list)
+            for trace_list in self._trace.values()
+        )
+
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
         if self._short_dict:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +61,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +69,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTION_FANOUT: HassKey[EntitySubscriptionFanout] = HassKey(
+    "websocket_api_entity_subscription_fanout"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +372,154 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
+class _EntitySubscription:
+    """A subscribe_entities subscription registered with the fan-out hub."""
+
+    __slots__ = (
+        "entity_filter",
+        "entity_ids",
+        "message_id_as_bytes",
+        "send_message",
+        "user",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+
+
+class EntitySubscriptionFanout:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every subscription. Subscriptions
+    limited to entity_ids are indexed by entity_id so a state change only
+    visits the subscriptions interested in it, the permission check runs
+    once per user and state change, and the serialized diff message is
+    shared by all receiving connections.
+    """
+
+    __slots__ = (
+        "_by_entity_id",
+        "_hass",
+        "_listener",
+        "_unfiltered",
+        "candidates",
+        "deliveries",
+        "events",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fan-out hub."""
+        self._hass = hass
+        self._by_entity_id: dict[str, dict[_EntitySubscription, None]] = {}
+        self._unfiltered: dict[_EntitySubscription, None] = {}
+        self._listener: CALLBACK_TYPE | None = None
+        # State changes seen, subscriptions visited and messages sent
+        self.events = 0
+        self.candidates = 0
+        self.deliveries = 0
+
+    @property
+    def subscriptions(self) -> int:
+        """Return the number of active subscriptions."""
+        return len(self._unfiltered) + len(
+            {sub for subs in self._by_entity_id.values() for sub in subs}
+        )
+
+    @callback
+    def async_subscribe(self, subscription: _EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if subscription.entity_ids is None:
+            self._unfiltered[subscription] = None
+        else:
+            for entity_id in subscription.entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        if self._listener is None:
+            self._listener = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        if subscription.entity_ids is None:
+            self._unfiltered.pop(subscription, None)
+        else:
+            for entity_id in subscription.entity_ids:
+                if (subs := self._by_entity_id.get(entity_id)) is not None:
+                    subs.pop(subscription, None)
+                    if not subs:
+                        del self._by_entity_id[entity_id]
+        if not self._unfiltered and not self._by_entity_id and self._listener:
+            self._listener()
+            self._listener = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        self.events += 1
+        entity_id = event.data["entity_id"]
+        if (subs := self._by_entity_id.get(entity_id)) is not None:
+            candidates: Iterable[_EntitySubscription] = (*subs, *self._unfiltered)
+        else:
+            candidates = self._unfiltered
+        # Subscriptions of the same user share the permission outcome
+        allowed_by_user: dict[str, bool] = {}
+        for subscription in candidates:
+            self.candidates += 1
+            if (entity_filter := subscription.entity_filter) and not entity_filter(
+                entity_id
+            ):
+                continue
+            user = subscription.user
+            if (allowed := allowed_by_user.get(user.id)) is None:
+                allowed = allowed_by_user[user.id] = _async_user_can_read_entity(
+                    user, entity_id
+                )
+            if not allowed:
+                continue
+            self.deliveries += 1
+            subscription.send_message(
+                messages.cached_state_diff_message(
+                    subscription.message_id_as_bytes, event
+                )
+            )
+
+
+def _async_user_can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if a user may read the state of an entity."""
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+@callback
+def async_get_entity_subscription_fanout(
+    hass: HomeAssistant,
+) -> EntitySubscriptionFanout:
+    """Return the fan-out hub for subscribe_entities subscriptions."""
+    if (fanout := hass.data.get(ENTITY_SUBSCRIPTION_FANOUT)) is None:
+        fanout = hass.data[ENTITY_SUBSCRIPTION_FANOUT] = EntitySubscriptionFanout(hass)
+    return fanout
 
 
 @callback
@@ -415,16 +543,16 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    connection.subscriptions[msg_id] = async_get_entity_subscription_fanout(
+        hass
+    ).async_subscribe(
+        _EntitySubscription(
             connection.send_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
+        )
     )
     connection.send_result(msg_id)
 
@@ -25,6 +25,7 @@ import functools
 import inspect
 import logging
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -40,6 +41,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache.api import cached_property, under_cached_property
 import voluptuous as vol
@@ -47,6 +49,7 @@ import voluptuous as vol
 from . import util
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -1459,7 +1462,15 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch_plans",
+        "_hass",
+        "_keyed_listeners",
+        "_listener_fanout",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1479,16 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Immutable tuple of the jobs to run per event type, including the
+        # match all listeners. Rebuilt on first fire after a listener change.
+        self._dispatch_plans: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        # Listeners only interested in events for a specific entity_id
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, tuple[_FilterableJobType[Any], ...]]
+        ] = {}
+        self._listener_fanout: defaultdict[EventType[Any] | str, int] = defaultdict(int)
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1483,7 +1504,20 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for jobs in keyed_listeners.values()
+            )
+        return listeners
+
+    @callback
+    def async_listener_fanout(self) -> dict[EventType[Any] | str, int]:
+        """Return dictionary with events and the number of listeners run.
+
+        This method must be run in the event loop.
+        """
+        return dict(self._listener_fanout)
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1548,14 +1582,21 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (jobs := self._dispatch_plans.get(event_type)) is None:
+            jobs = self._async_build_dispatch_plan(event_type)
+        if (
+            event_data is not None
+            and (keyed_listeners := self._keyed_listeners.get(event_type))
+            and type(key := event_data.get(ATTR_ENTITY_ID)) is str
+            and (keyed_jobs := keyed_listeners.get(key))
+        ):
+            jobs = jobs + keyed_jobs
+        if not jobs:
+            return
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        dispatched = 0
+        for job, event_filter in jobs:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1573,11 +1614,36 @@ class EventBus:
                     context,
                 )
 
+            dispatched += 1
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if dispatched:
+            self._listener_fanout[event_type] += dispatched
+
+    @callback
+    def _async_build_dispatch_plan(
+        self, event_type: EventType[_DataT] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build and store the jobs to run when an event type is fired."""
+        jobs = tuple(self._listeners.get(event_type, EMPTY_LIST))
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            jobs += tuple(self._match_all_listeners)
+        self._dispatch_plans[event_type] = jobs
+        return jobs
+
+    @callback
+    def _async_invalidate_dispatch_plan(
+        self, event_type: EventType[_DataT] | str
+    ) -> None:
+        """Invalidate the dispatch plan after a listener change."""
+        if event_type == MATCH_ALL:
+            self._dispatch_plans.clear()
+        else:
+            self._dispatch_plans.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1605,6 +1671,8 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        *,
+        entity_id: str | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1615,6 +1683,10 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        If entity_id is passed, the listener only runs for events with
+        a matching entity_id in the event data. The bus looks up these
+        listeners by entity_id instead of calling a filter for each one.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1634,6 +1706,14 @@ class EventBus:
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
+        if entity_id is not None:
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    "Listening for a specific entity_id requires an event type"
+                )
+            return self._async_listen_keyed_filterable_job(
+                event_type, entity_id, filterable_job
+            )
         if event_type == EVENT_STATE_REPORTED:
             if not event_filter:
                 raise HomeAssistantError(
@@ -1649,10 +1729,28 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_dispatch_plan(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def _async_listen_keyed_filterable_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_id: str,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for a specific entity_id."""
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        keyed_listeners[entity_id] = (
+            *keyed_listeners.get(entity_id, ()),
+            filterable_job,
+        )
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, entity_id, filterable_job
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1740,6 +1838,36 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+        else:
+            self._async_invalidate_dispatch_plan(event_type)
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_id: str,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type and entity_id.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            jobs = list(keyed_listeners[entity_id])
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if jobs:
+            keyed_listeners[entity_id] = tuple(jobs)
+            return
+        del keyed_listeners[entity_id]
+        if not keyed_listeners:
+            del self._keyed_listeners[event_type]
 
 
 class CompressedState(TypedDict):
@@ -1752,6 +1880,82 @@ class CompressedState(TypedDict):
     lu: NotRequired[float]  # COMPRESSED_STATE_LAST_UPDATED
 
 
+class _InternedAttributes(ReadOnlyDict[str, Any]):
+    """Attributes shared by all states with the same attributes.
+
+    The JSON of the attributes is cached as it is the same for all states.
+    """
+
+    __slots__ = ("_json_fragment",)
+
+    @property
+    def json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes."""
+        try:
+            return self._json_fragment
+        except AttributeError:
+            self._json_fragment = json_fragment(json_bytes(self))
+            return self._json_fragment
+
+
+class _AttributesInterner:
+    """Share one attributes mapping between states with the same attributes.
+
+    Many entities and the history of an entity have identical attributes. The
+    mappings are keyed by their items and only kept alive by the states which
+    use them. Only attributes with None, string and number values are shared.
+    Other values, like lists which can be mutated by their owner or datetimes
+    which compare equal across timezones, are not.
+
+    The type of each value is part of the key since True == 1 == 1.0, and
+    floats are keyed by their exact representation since -0.0 == 0.0.
+    """
+
+    __slots__ = ("_interned", "bytes_saved", "hits", "misses", "skipped")
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._interned: weakref.WeakValueDictionary[
+            tuple[tuple[str, type, Any], ...], _InternedAttributes
+        ] = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.bytes_saved = 0
+
+    def intern(self, attributes: Mapping[str, Any]) -> ReadOnlyDict[str, Any]:
+        """Return the shared mapping of the attributes."""
+        key_items: list[tuple[str, type, Any]] = []
+        for name, value in attributes.items():
+            if isinstance(value, float):
+                key_items.append((name, type(value), float.hex(value)))
+            elif value is None or isinstance(value, (str, int)):
+                key_items.append((name, type(value), value))
+            else:
+                self.skipped += 1
+                return ReadOnlyDict(attributes)
+        key = tuple(key_items)
+        if (interned := self._interned.get(key)) is not None:
+            self.hits += 1
+            self.bytes_saved += sys.getsizeof(interned)
+            return interned
+        self.misses += 1
+        interned = self._interned[key] = _InternedAttributes(attributes)
+        return interned
+
+    def stats(self) -> dict[str, float]:
+        """Return the interning statistics."""
+        interned = self.hits + self.misses
+        return {
+            "interned": len(self._interned),
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "hit_rate": self.hits / interned if interned else 0.0,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1811,7 +2015,10 @@ class State:
         # State only creates and expects a ReadOnlyDict so
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
-        if type(attributes) is not ReadOnlyDict:
+        if (
+            type(attributes) is not ReadOnlyDict
+            and type(attributes) is not _InternedAttributes
+        ):
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
@@ -1912,6 +2119,8 @@ class State:
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
+        if type(attributes := self.attributes) is _InternedAttributes:
+            return json_bytes({**self._as_dict, "attributes": attributes.json_fragment})
         return json_bytes(self._as_dict)
 
     @under_cached_property
@@ -1955,7 +2164,13 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state: Mapping[str, Any] = self.as_compressed_state
+        if type(attributes := self.attributes) is _InternedAttributes:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: attributes.json_fragment,
+            }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2066,10 +2281,18 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_attributes_interner",
+        "_bus",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
+        self._attributes_interner = _AttributesInterner()
         self._states = States()
         # _states_data is used to access the States backing dict directly to speed
         # up read operations
@@ -2357,6 +2580,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._attributes_interner.intern(attributes or {})
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2387,6 +2612,14 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_attributes_interning_stats(self) -> dict[str, float]:
+        """Return how often states shared their attributes and the bytes saved.
+
+        This method must be run in the event loop.
+        """
+        return self._attributes_interner.stats()
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
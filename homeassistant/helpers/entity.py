@@ -514,6 +514,13 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # If True, writes within the same event loop iteration are coalesced into
+    # a single state write at the end of the iteration. The first write after
+    # the entity is added is never delayed.
+    _coalesce_state_writes = False
+    __state_written = False
+    __coalesced_write_pending = False
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -1020,6 +1027,27 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if self._coalesce_state_writes:
+            if self.__state_written:
+                self.__async_coalesce_write_ha_state()
+                return
+            self.__state_written = True
+        self._async_write_ha_state()
+
+    @callback
+    def __async_coalesce_write_ha_state(self) -> None:
+        """Write the state at the end of the event loop iteration."""
+        if self.__coalesced_write_pending:
+            if self.platform is not None:
+                self.platform.coalesced_state_writes += 1
+            return
+        self.__coalesced_write_pending = True
+        self.hass.loop.call_soon(self.__async_write_coalesced_ha_state)
+
+    @callback
+    def __async_write_coalesced_ha_state(self) -> None:
+        """Write the state of the coalesced writes."""
+        self.__coalesced_write_pending = False
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -1358,6 +1386,7 @@ class Entity(
         self.platform = platform
         self.parallel_updates = parallel_updates
         self._platform_state = EntityPlatformState.ADDED
+        self.__state_written = False
 
     def _call_on_remove_callbacks(self) -> None:
         """Call callbacks registered by async_on_remove."""
@@ -157,6 +157,9 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Number of state writes of entities which coalesce their state writes
+        # which were merged into an already pending write
+        self.coalesced_state_writes = 0
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -1091,3 +1094,15 @@ def async_get_platforms(
         return []
 
     return hass.data[DATA_ENTITY_PLATFORM][integration_name]
+
+
+@callback
+def async_get_coalesced_state_writes(hass: HomeAssistant) -> dict[str, int]:
+    """Return the number of coalesced state writes by domain and platform."""
+    result: dict[str, int] = {}
+    for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values():
+        for platform in platforms:
+            if platform.coalesced_state_writes:
+                key = f"{platform.domain}.{platform.platform_name}"
+                result[key] = result.get(key, 0) + platform.coalesced_state_writes
+    return result
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from heapq import heappop, heappush
 import logging
 from random import randint
 import time
@@ -75,6 +76,12 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TIME_PATTERN_SCHEDULER: HassKey[_TimePatternScheduler] = HassKey(
+    "time_pattern_scheduler"
+)
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -171,6 +178,20 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for keeping track of how expensive a tracked template is.
+
+    render_count
+        Number of times the template was rendered.
+    render_time
+        Cumulative time in seconds spent rendering the template.
+    """
+
+    render_count: int = 0
+    render_time: float = 0
+
+
 def threaded_listener_factory[**_P](
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any],
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -971,6 +992,146 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Dispatch state changes to template trackers and coalesce re-renders.
+
+    A single state_changed listener looks up the interested trackers in a
+    reverse index from entity_id and domain. Trackers only mark their
+    affected templates as pending; all pending trackers are refreshed
+    together from one call_soon so a template which depends on several
+    entities that change in the same loop iteration is rendered once.
+    """
+
+    __slots__ = (
+        "_all_states",
+        "_domains",
+        "_entities",
+        "_hass",
+        "_listener",
+        "_pending",
+        "_scheduled",
+        "_tracked",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._all_states: dict[TrackTemplateResultInfo, None] = {}
+        self._entities: defaultdict[str, dict[TrackTemplateResultInfo, None]] = (
+            defaultdict(dict)
+        )
+        self._domains: defaultdict[str, dict[TrackTemplateResultInfo, None]] = (
+            defaultdict(dict)
+        )
+        self._tracked: dict[TrackTemplateResultInfo, TrackStates] = {}
+        self._listener: CALLBACK_TYPE | None = None
+        self._pending: dict[TrackTemplateResultInfo, None] = {}
+        self._scheduled = False
+
+    @property
+    def trackers(self) -> Iterable[TrackTemplateResultInfo]:
+        """Return the active template trackers."""
+        return self._tracked
+
+    @callback
+    def async_track(
+        self, tracker: TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Route the state changes described by track_states to a tracker."""
+        self._async_remove_from_index(tracker)
+        self._tracked[tracker] = track_states
+        if track_states.all_states:
+            self._all_states[tracker] = None
+        for entity_id in track_states.entities:
+            self._entities[entity_id][tracker] = None
+        for domain in track_states.domains:
+            self._domains[domain][tracker] = None
+        if self._listener is None:
+            self._listener = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+    @callback
+    def async_untrack(self, tracker: TrackTemplateResultInfo) -> None:
+        """Stop routing state changes to a tracker."""
+        self._async_remove_from_index(tracker)
+        self._tracked.pop(tracker, None)
+        self._pending.pop(tracker, None)
+        if not self._tracked and self._listener is not None:
+            self._listener()
+            self._listener = None
+
+    @callback
+    def _async_remove_from_index(self, tracker: TrackTemplateResultInfo) -> None:
+        """Remove a tracker from the reverse index."""
+        if (track_states := self._tracked.get(tracker)) is None:
+            return
+        self._all_states.pop(tracker, None)
+        for index, keys in (
+            (self._entities, track_states.entities),
+            (self._domains, track_states.domains),
+        ):
+            for key in keys:
+                trackers = index[key]
+                trackers.pop(tracker, None)
+                if not trackers:
+                    del index[key]
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the trackers interested in a state change."""
+        entity_id = event.data["entity_id"]
+        trackers = self._all_states.copy()
+        if entity_id in self._entities:
+            trackers.update(self._entities[entity_id])
+        if (domain := split_entity_id(entity_id)[0]) in self._domains:
+            trackers.update(self._domains[domain])
+        for tracker in trackers:
+            if tracker.async_mark_pending(event):
+                self._pending[tracker] = None
+        if self._pending and not self._scheduled:
+            self._scheduled = True
+            self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Refresh all pending trackers."""
+        self._scheduled = False
+        pending = self._pending
+        self._pending = {}
+        for tracker in pending:
+            tracker.async_refresh_pending()
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
+@callback
+def async_get_template_render_stats(
+    hass: HomeAssistant,
+) -> dict[str, TemplateRenderStats]:
+    """Return the render stats of all tracked templates keyed by template."""
+    result: dict[str, TemplateRenderStats] = {}
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        return result
+    for tracker in scheduler.trackers:
+        for template, stats in tracker.render_stats.items():
+            if (total := result.get(template.template)) is None:
+                total = result[template.template] = TemplateRenderStats()
+            total.render_count += stats.render_count
+            total.render_time += stats.render_time
+    return result
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1003,8 +1164,19 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
-        self._track_state_changes: _TrackStateChangeFiltered | None = None
+        self._last_track_states: TrackStates | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._scheduler = _async_get_template_render_scheduler(hass)
+        self._render_stats: dict[Template, TemplateRenderStats] = {}
+        # Reverse index from entity_id and domain to the positions of the
+        # track templates which need to consider a state change of them
+        self._entity_index: defaultdict[str, set[int]] = defaultdict(set)
+        self._domain_index: defaultdict[str, set[int]] = defaultdict(set)
+        self._all_states_index: set[int] = set()
+        self._indexed_info: dict[int, RenderInfo] = {}
+        # Track templates waiting for the scheduler, with their triggering event
+        self._pending: dict[int, Event[EventStateChangedData]] = {}
+        self._pending_events: dict[Event[EventStateChangedData], None] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1021,11 +1193,7 @@ class TrackTemplateResultInfo:
 
         # Render the super template first
         if super_template is not None:
-            template = super_template.template
-            variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
-            )
+            info = self._async_render_to_info(super_template, strict, log_fn)
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -1042,11 +1210,7 @@ class TrackTemplateResultInfo:
         for track_template_ in self._track_templates:
             if block_render or track_template_ == super_template:
                 continue
-            template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
-            )
+            info = self._async_render_to_info(track_template_, strict, log_fn)
 
             if info.exception:
                 if not log_fn:
@@ -1058,9 +1222,8 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
-        )
+        self._last_track_states = _render_infos_to_track_states(self._info.values())
+        self._scheduler.async_track(self, self._last_track_states)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1075,12 +1238,113 @@ class TrackTemplateResultInfo:
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
-        assert self._track_state_changes
+        assert self._last_track_states
+        track_states = self._last_track_states
         return {
-            **self._track_state_changes.listeners,
+            _ALL_LISTENER: track_states.all_states,
+            _ENTITIES_LISTENER: track_states.entities,
+            _DOMAINS_LISTENER: track_states.domains,
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> dict[Template, TemplateRenderStats]:
+        """Render count and cumulative render time per template."""
+        return self._render_stats
+
+    @callback
+    def _async_render_to_info(
+        self,
+        track_template_: TrackTemplate,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template, record its stats and index what it depends on."""
+        template = track_template_.template
+        start = time.perf_counter()
+        self._info[template] = info = template.async_render_to_info(
+            track_template_.variables, strict=strict, log_fn=log_fn
+        )
+        if (stats := self._render_stats.get(template)) is None:
+            stats = self._render_stats[template] = TemplateRenderStats()
+        stats.render_count += 1
+        stats.render_time += time.perf_counter() - start
+        for position, indexed_template in enumerate(self._track_templates):
+            if indexed_template.template == template:
+                self._async_index_render_info(position, info)
+        return info
+
+    @callback
+    def _async_index_render_info(self, position: int, info: RenderInfo) -> None:
+        """Replace the reverse index entries of a track template."""
+        if (old_info := self._indexed_info.get(position)) is not None:
+            for entity_id in old_info.entities:
+                self._entity_index[entity_id].discard(position)
+            for domain in (*old_info.domains, *old_info.domains_lifecycle):
+                self._domain_index[domain].discard(position)
+            self._all_states_index.discard(position)
+        self._indexed_info[position] = info
+        # A template that failed to render is re-rendered on any state change
+        if info.exception or info.all_states or info.all_states_lifecycle:
+            self._all_states_index.add(position)
+        for entity_id in info.entities:
+            self._entity_index[entity_id].add(position)
+        for domain in (*info.domains, *info.domains_lifecycle):
+            self._domain_index[domain].add(position)
+
+    @callback
+    def async_mark_pending(self, event: Event[EventStateChangedData]) -> bool:
+        """Mark the templates affected by a state change for a coalesced refresh.
+
+        Returns True if a template needs to be refreshed.
+        """
+        entity_id = event.data["entity_id"]
+        positions = self._all_states_index.union(
+            self._entity_index.get(entity_id, ()),
+            self._domain_index.get(split_entity_id(entity_id)[0], ()),
+        )
+        pending = self._pending
+        scheduled = False
+        for position in positions:
+            info = self._info.get(self._track_templates[position].template)
+            if info is None or not _event_triggers_rerender(event, info):
+                continue
+            # Keep an event for a specifically referenced entity since those
+            # are excluded from the rate limit
+            if (
+                (pending_event := pending.get(position)) is None
+                or entity_id in info.entities
+                or pending_event.data["entity_id"] not in info.entities
+            ):
+                pending[position] = event
+            scheduled = True
+        if scheduled:
+            self._pending_events[event] = None
+        return scheduled
+
+    @callback
+    def async_refresh_pending(self) -> None:
+        """Refresh the templates marked by state changes since the last refresh."""
+        pending = self._pending
+        self._pending = {}
+        # Refresh in the order the state changes happened so templates
+        # observe them in the same order as without coalescing
+        by_event: dict[Event[EventStateChangedData], list[TrackTemplate]] = {
+            event: [] for event in self._pending_events
+        }
+        self._pending_events = {}
+        for position in sorted(pending):
+            by_event[pending[position]].append(self._track_templates[position])
+        for event, track_templates in by_event.items():
+            if not track_templates:
+                continue
+            try:
+                self._refresh(event, track_templates=track_templates)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while refreshing templates for %s", event.data["entity_id"]
+                )
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1114,9 +1378,11 @@ class TrackTemplateResultInfo:
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
-        assert self._track_state_changes
-        self._track_state_changes.async_remove()
+        assert self._last_track_states
+        self._scheduler.async_untrack(self)
         self._rate_limit.async_remove()
+        self._pending.clear()
+        self._pending_events.clear()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1169,9 +1435,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        info = self._async_render_to_info(track_template_)
 
         try:
             result: str | TemplateError = info.result()
@@ -1282,17 +1546,17 @@ class TrackTemplateResultInfo:
                 )
 
         if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
+            new_track_states = _render_infos_to_track_states(
+                [
+                    _suppress_domain_all_in_render_info(info)
+                    if self._rate_limit.async_has_timer(template)
+                    else info
+                    for template, info in self._info.items()
+                ]
             )
+            if new_track_states != self._last_track_states:
+                self._last_track_states = new_track_states
+                self._scheduler.async_track(self, new_track_states)
             _LOGGER.debug(
                 (
                     "Template group %s listens for %s, re-render blocked by super"
@@ -1787,60 +2051,207 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
-@dataclass(slots=True)
+class _TimePatternScheduler:
+    """Fire time pattern listeners from a single timer.
+
+    Listeners are bucketed by the UTC second they fire next. One timer is
+    armed for the earliest bucket; when it fires, all due listeners are run
+    with the same UTC and local time and the next fire time of each distinct
+    time pattern is calculated once.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_dispatch_time",
+        "_hass",
+        "_heap",
+        "_last_dispatch_time",
+        "_offset",
+        "_ticks",
+        "_timer",
+        "_timer_second",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._buckets: dict[int, dict[_TrackUTCTimeChange, None]] = {}
+        self._heap: list[int] = []
+        # Avoid aligning the timer to the start of the second since it can
+        # create a thundering herd problem with other timers
+        # https://github.com/home-assistant/core/issues/82231
+        self._offset = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX) / 10**6
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_second = 0
+        self._ticks = 0
+        self._dispatch_time = 0.0
+        self._last_dispatch_time = 0.0
+
+    @callback
+    def async_add(self, track: _TrackUTCTimeChange, second: int) -> None:
+        """Schedule a listener to fire at a UTC second."""
+        self._async_insert(track, second)
+        if self._timer is None or second < self._timer_second:
+            self._async_arm()
+
+    @callback
+    def async_remove(self, track: _TrackUTCTimeChange) -> None:
+        """Stop firing a listener."""
+        if (bucket := self._buckets.get(track.next_second)) is None:
+            return
+        bucket.pop(track, None)
+        if bucket:
+            return
+        del self._buckets[track.next_second]
+        if not self._buckets and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._heap.clear()
+
+    @callback
+    def async_stats(self) -> dict[str, float]:
+        """Return the number of listeners and timers and the dispatch cost."""
+        return {
+            "listeners": sum(len(bucket) for bucket in self._buckets.values()),
+            "timers": 0 if self._timer is None else 1,
+            "ticks": self._ticks,
+            "dispatch_time": self._dispatch_time,
+            "last_dispatch_time": self._last_dispatch_time,
+        }
+
+    def _async_insert(self, track: _TrackUTCTimeChange, second: int) -> None:
+        """Add a listener to the bucket of a second."""
+        track.next_second = second
+        if (bucket := self._buckets.get(second)) is None:
+            bucket = self._buckets[second] = {}
+            heappush(self._heap, second)
+        bucket[track] = None
+
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest bucket."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        heap = self._heap
+        while heap and heap[0] not in self._buckets:
+            heappop(heap)
+        if not heap:
+            return
+        second = self._timer_second = heap[0]
+        loop = self._hass.loop
+        self._timer = loop.call_at(
+            loop.time() + second + self._offset - time.time(), self._async_tick
+        )
+
+    @callback
+    def _async_tick(self) -> None:
+        """Fire the due listeners and schedule their next fire time."""
+        self._timer = None
+        start = time.perf_counter()
+        try:
+            self._async_fire_due()
+        finally:
+            self._async_arm()
+            self._ticks += 1
+            self._last_dispatch_time = time.perf_counter() - start
+            self._dispatch_time += self._last_dispatch_time
+
+    def _async_fire_due(self) -> None:
+        """Fire the due listeners and move them to their next bucket."""
+        # Fetch time again because we want the actual time, not the
+        # time when the timer was scheduled
+        utc_now = time_tracker_utcnow()
+        timestamp = time_tracker_timestamp() - self._offset
+        heap = self._heap
+        due: list[_TrackUTCTimeChange] = []
+        while heap and heap[0] <= timestamp:
+            if (bucket := self._buckets.pop(heappop(heap), None)) is not None:
+                due.extend(bucket)
+        if due:
+            local_now = dt_util.as_local(utc_now)
+            utc_next = utc_now + timedelta(seconds=1)
+            local_next = dt_util.as_local(utc_next)
+            next_seconds: dict[Hashable, int] = {}
+            for track in due:
+                if (next_second := next_seconds.get(track.pattern_key)) is None:
+                    next_second = next_seconds[track.pattern_key] = (
+                        track.calculate_next(local_next if track.local else utc_next)
+                    )
+                self._async_insert(track, next_second)
+            hass = self._hass
+            for track in due:
+                # A listener can be cancelled by a listener which fired before it
+                if track.cancelled:
+                    continue
+                try:
+                    hass.async_run_hass_job(
+                        track.job,
+                        local_now if track.local else utc_now,
+                        background=True,
+                    )
+                except Exception:
+                    _LOGGER.exception(
+                        "Error while dispatching time pattern to %s", track.job
+                    )
+
+
+@callback
+def _async_get_time_pattern_scheduler(hass: HomeAssistant) -> _TimePatternScheduler:
+    """Return the time pattern scheduler."""
+    if (scheduler := hass.data.get(_TIME_PATTERN_SCHEDULER)) is None:
+        scheduler = hass.data[_TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(hass)
+    return scheduler
+
+
+@callback
+def async_get_time_pattern_stats(hass: HomeAssistant) -> dict[str, float]:
+    """Return the listener, timer and dispatch statistics of time patterns."""
+    if (scheduler := hass.data.get(_TIME_PATTERN_SCHEDULER)) is None:
+        return {
+            "listeners": 0,
+            "timers": 0,
+            "ticks": 0,
+            "dispatch_time": 0.0,
+            "last_dispatch_time": 0.0,
+        }
+    return scheduler.async_stats()
+
+
+@dataclass(slots=True, eq=False)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
     time_match_expression: tuple[list[int], list[int], list[int]]
-    microsecond: int
+    pattern_key: Hashable
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
-    listener_job_name: str
-    _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
-    _cancel_callback: CALLBACK_TYPE | None = None
+    next_second: int = 0
+    cancelled: bool = False
+    _scheduler: _TimePatternScheduler | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._pattern_time_change_listener_job = HassJob(
-            self._pattern_time_change_listener,
-            self.listener_job_name,
-            job_type=HassJobType.Callback,
-        )
-        self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
+        utc_now = dt_util.utcnow()
+        self._scheduler = _async_get_time_pattern_scheduler(self.hass)
+        self._scheduler.async_add(
+            self,
+            self.calculate_next(dt_util.as_local(utc_now) if self.local else utc_now),
         )
 
-    def _calculate_next(self, utc_now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
-
-    @callback
-    def _pattern_time_change_listener(self, _: datetime) -> None:
-        """Listen for matching time_changed events."""
-        hass = self.hass
-        # Fetch time again because we want the actual time, not the
-        # time when the timer was scheduled
-        utc_now = time_tracker_utcnow()
-        localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
+    def calculate_next(self, now: datetime) -> int:
+        """Calculate the next UTC second the time pattern matches."""
+        return int(
+            dt_util.find_next_time_expression_time(
+                now, *self.time_match_expression
+            ).timestamp()
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Remove the listener from the scheduler."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback()
+            assert self._scheduler is not None
+        self.cancelled = True
+        self._scheduler.async_remove(self)
 
 
 @callback
@@ -1871,18 +2282,17 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
     track = _TrackUTCTimeChange(
         hass,
         (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+        (
+            tuple(matching_seconds),
+            tuple(matching_minutes),
+            tuple(matching_hours),
+            local,
+        ),
         local,
         job,
-        listener_job_name,
     )
     track.async_attach()
     return track.async_cancel
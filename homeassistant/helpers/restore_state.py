@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+from propcache.api import cached_property
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -17,7 +19,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -113,7 +115,7 @@ class RestoreStateData:
     @classmethod
     async def async_save_persistent_states(cls, hass: HomeAssistant) -> None:
         """Dump states now."""
-        await async_get(hass).async_dump_states()
+        await async_get(hass).async_dump_states(refresh_extra_data=True)
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
@@ -123,6 +125,11 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and serialized extra data of each entity at the last dump
+        self._dumped: dict[str, tuple[State, _DumpedExtraData | None]] = {}
+        # Entities which wrote their state or marked their extra data as
+        # changed since the last dump
+        self._dirty: set[str] = set()
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -198,15 +205,70 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    @callback
+    def _async_get_states_to_dump(
+        self, refresh_extra_data: bool
+    ) -> list[dict[str, Any]]:
+        """Get the states which should be dumped.
+
+        Same as async_get_stored_states, except that the extra data of
+        entities which did not change since the last dump is reused unless
+        refresh_extra_data is set. The states and the extra data are
+        serialized when the store is written in the executor, and the
+        serialized extra data is cached.
+        """
+        now = dt_util.utcnow()
+        states = self.hass.states
+        dumped = self._dumped
+        dirty = self._dirty
+        self._dirty = set()
+        stored_states: list[dict[str, Any]] = []
+        for entity_id, entity in self.entities.items():
+            if (state := states.get(entity_id)) is None or state.attributes.get(
+                ATTR_RESTORED
+            ):
+                continue
+            if (
+                refresh_extra_data
+                or entity_id in dirty
+                or (last_dump := dumped.get(entity_id)) is None
+                or last_dump[0] is not state
+            ):
+                extra_data = entity.extra_restore_state_data
+                last_dump = (
+                    state,
+                    _DumpedExtraData(extra_data.as_dict()) if extra_data else None,
+                )
+                dumped[entity_id] = last_dump
+            stored_states.append(
+                {"state": state, "extra_data": last_dump[1], "last_seen": now}
+            )
+
+        expiration_time = now - STATE_EXPIRATION
+        stored_states.extend(
+            stored_state.as_dict()
+            for entity_id, stored_state in self.last_states.items()
+            # Don't save old states that have entities in the current run
+            # or have expired
+            if (
+                (state := states.get(entity_id)) is None
+                or state.attributes.get(ATTR_RESTORED)
+            )
+            and stored_state.last_seen >= expiration_time
+        )
+        return stored_states
+
+    async def async_dump_states(self, refresh_extra_data: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        The extra data is only collected again from entities which wrote their
+        state or marked their extra data as changed since the last dump,
+        unless refresh_extra_data is set.
+        """
         _LOGGER.debug("Dumping states")
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                self._async_get_states_to_dump(refresh_extra_data)
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -235,7 +297,7 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_states(refresh_extra_data=True)
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -246,6 +308,12 @@ class RestoreStateData:
     def async_restore_entity_added(self, entity: RestoreEntity) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entities[entity.entity_id] = entity
+        self._dumped.pop(entity.entity_id, None)
+
+    @callback
+    def async_restore_entity_changed(self, entity_id: str) -> None:
+        """Mark the extra data of an entity as changed since the last dump."""
+        self._dirty.add(entity_id)
 
     @callback
     def async_restore_entity_removed(
@@ -266,6 +334,20 @@ class RestoreStateData:
             )
 
         del self.entities[entity_id]
+        self._dumped.pop(entity_id, None)
+
+
+class _DumpedExtraData:
+    """Extra data of an entity which is serialized when it is first saved."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize the dumped extra data."""
+        self.data = data
+
+    @cached_property
+    def json_fragment(self) -> json_fragment:
+        """Return the extra data as a JSON fragment."""
+        return json_fragment(json_bytes(self.data))
 
 
 class RestoreEntity(Entity):
@@ -283,6 +365,22 @@ class RestoreEntity(Entity):
         )
         await super().async_internal_will_remove_from_hass()
 
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+        super()._async_write_ha_state()
+        async_get(self.hass).async_restore_entity_changed(self.entity_id)
+
+    @callback
+    def async_extra_restore_state_data_changed(self) -> None:
+        """Mark the extra data to be restored as changed.
+
+        Entities which change their extra_restore_state_data without writing
+        their state must call this for the change to be saved before
+        Home Assistant stops.
+        """
+        async_get(self.hass).async_restore_entity_changed(self.entity_id)
+
     @callback
     def _async_get_restored_data(self) -> StoredState | None:
         """Get data stored for an entity, if any."""
@@ -310,6 +408,8 @@ class RestoreEntity(Entity):
     def extra_restore_state_data(self) -> ExtraStoredData | None:
         """Return entity specific state data to be restored.
 
-        Implemented by platform classes.
+        Implemented by platform classes. The data is read again when the
+        entity writes its state, see async_extra_restore_state_data_changed
+        for changes without a state write.
         """
         return None
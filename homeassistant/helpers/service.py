@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -80,6 +81,14 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[_TargetResolutionCache] = HassKey(
+    "target_resolution_cache"
+)
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 1024
+
+type TargetResolutionKey = tuple[
+    frozenset[str], frozenset[str], frozenset[str], frozenset[str]
+]
 
 
 @cache
@@ -503,6 +512,98 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+class _TargetResolutionCache:
+    """Cache the entities, devices and areas targeted by registry ids.
+
+    Resolved targets are keyed by the device, area, floor and label ids of
+    a selector. The cache is cleared and its generation bumped whenever one
+    of the registries involved changes, or is replaced.
+    """
+
+    __slots__ = ("_entries", "_registries", "generation", "hits", "misses")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._entries: dict[TargetResolutionKey, SelectedEntities] = {}
+        self._registries: tuple[Any, ...] = ()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_invalidate)
+
+    @callback
+    def _async_invalidate(self, event: Event[Any] | None = None) -> None:
+        """Forget all resolved targets."""
+        self._entries.clear()
+        self.generation += 1
+
+    @callback
+    def async_validate(self, registries: tuple[Any, ...]) -> None:
+        """Invalidate the cache if a registry was replaced."""
+        if self._registries != registries:
+            self._registries = registries
+            self._async_invalidate()
+
+    @callback
+    def async_get(self, key: TargetResolutionKey) -> SelectedEntities | None:
+        """Return the resolved targets for a key."""
+        if (resolved := self._entries.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resolved
+
+    @callback
+    def async_set(self, key: TargetResolutionKey, resolved: SelectedEntities) -> None:
+        """Store the resolved targets for a key."""
+        if len(self._entries) >= MAX_TARGET_RESOLUTION_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = resolved
+
+    @callback
+    def async_stats(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+
+@callback
+def _async_get_target_resolution_cache(hass: HomeAssistant) -> _TargetResolutionCache:
+    """Return the target resolution cache, validated against the registries."""
+    if (target_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        target_cache = hass.data[TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+    target_cache.async_validate(
+        (
+            entity_registry.async_get(hass),
+            device_registry.async_get(hass),
+            area_registry.async_get(hass),
+            floor_registry.async_get(hass),
+            label_registry.async_get(hass),
+        )
+    )
+    return target_cache
+
+
+@callback
+def async_get_target_resolution_cache_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return hit and miss statistics of the target resolution cache."""
+    if (target_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        return {"generation": 0, "hits": 0, "misses": 0, "size": 0}
+    return target_cache.async_stats()
+
+
 @bind_hass
 def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
@@ -528,6 +629,33 @@ def async_extract_referenced_entity_ids(
     ):
         return selected
 
+    target_cache = _async_get_target_resolution_cache(hass)
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := target_cache.async_get(key)) is None:
+        resolved = _async_resolve_registry_targets(hass, selector)
+        target_cache.async_set(key, resolved)
+
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a selector."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -6,6 +6,8 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -30,9 +32,10 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
-from homeassistant.util import dt as dt_util, json as json_util
+from homeassistant.util import dt as dt_util, json as json_util, uuid as uuid_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS
 
 from . import json as json_helper
 
@@ -48,6 +51,14 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# The journal is compacted into the base file once it has grown
+# to this fraction of the size of the base file
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_MIN_COMPACT_SIZE = 64 * 1024
+JOURNAL_SUFFIX = ".journal"
+# Key of the base file and of the journal records which pairs them
+JOURNAL_GENERATION = "journal_generation"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +237,330 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+@dataclass(slots=True)
+class _JournaledList:
+    """The items of a journaled list which are known to be on disk."""
+
+    items: list[Any]
+    keys: list[Any]
+    digests: list[bytes]
+    key_set: set[Any]
+    digest_to_key: dict[bytes, Any]
+
+
+class _StoreJournal:
+    """Append only journal of the changes to the keyed item lists of a store.
+
+    A store in journaled mode keeps the last fully written document as the
+    base file and appends one compact delta record per write to a sidecar
+    journal. Each record holds the items which were added or changed and the
+    keys of the items which were removed from the journaled lists. The
+    journal is replayed on load and compacted into the base file once it has
+    grown too large or when anything outside the journaled lists changes.
+
+    Every compaction writes a new generation id into the base file, which is
+    also stored in each record appended after it. Only records of the
+    generation of the base file are replayed, so a journal which was not
+    removed after a compaction, or which was left behind by a version
+    without journaling, is never applied to a newer base file.
+
+    Items are compared with the previous write by position and identity
+    first, so unchanged items which are cached as JSON fragments are neither
+    serialized nor hashed again.
+
+    All methods except the constructor run in the executor and are
+    serialized by the write lock of the store.
+    """
+
+    def __init__(self, item_keys: Mapping[str, str]) -> None:
+        """Initialize the journal.
+
+        item_keys maps the name of each journaled list in the stored data
+        to the key which identifies an item of that list.
+        """
+        self._item_keys = item_keys
+        self._lists: dict[str, _JournaledList] | None = None
+        self._generation: str | None = None
+        # Last written document, to compact the journal on shutdown
+        self._last_data: dict[str, Any] | None = None
+        # JSON of everything outside the journaled lists
+        self._other: bytes | None = None
+        self._base_size = 0
+        self._journal_size = 0
+        self.bytes_written = 0
+        self.records_written = 0
+        self.compactions = 0
+
+    def replay(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the base file."""
+        self._lists = None
+        self._generation = generation = data.pop(JOURNAL_GENERATION, None)
+        self._base_size = _file_size(path)
+        self._journal_size = _file_size(journal_path := path + JOURNAL_SUFFIX)
+        stored = data.get("data")
+        # Ignored records stay in the journal until the next write compacts it
+        ignored = False
+        if self._journal_size and isinstance(stored, dict):
+            with open(journal_path, "rb") as journal:
+                for line in journal:
+                    try:
+                        record = json_util.json_loads_object(line)
+                    except JSON_DECODE_EXCEPTIONS:
+                        # A record which was only partially written when
+                        # Home Assistant stopped and everything after it
+                        # is ignored.
+                        _LOGGER.warning("Ignoring incomplete journal of %s", path)
+                        ignored = True
+                        break
+                    if generation is None or record.get(JOURNAL_GENERATION) != (
+                        generation
+                    ):
+                        # Written before the base file was compacted
+                        ignored = True
+                        continue
+                    if not self._is_valid(record):
+                        _LOGGER.warning("Ignoring invalid journal of %s", path)
+                        ignored = True
+                        break
+                    if record["version"] != data["version"] or record.get(
+                        "minor_version", 1
+                    ) != data.get("minor_version", 1):
+                        ignored = True
+                        break
+                    self._apply(stored, record)
+        if not ignored and (diff := self._diff(data)) is not None:
+            self._lists, self._other, _, _ = diff
+
+    def _is_valid(self, record: dict[str, Any]) -> bool:
+        """Return if a journal record has the structure _apply expects."""
+        if "version" not in record:
+            return False
+        upserts = record.get("upsert")
+        deletes = record.get("delete")
+        if not isinstance(upserts, dict) or not isinstance(deletes, dict):
+            return False
+        for name, id_key in self._item_keys.items():
+            items = upserts.get(name, ())
+            if not isinstance(items, list | tuple) or not all(
+                isinstance(item, dict) and id_key in item for item in items
+            ):
+                return False
+            if not isinstance(deletes.get(name, ()), list | tuple):
+                return False
+        return True
+
+    def _apply(self, stored: dict[str, Any], record: dict[str, Any]) -> None:
+        """Apply a journal record to stored data."""
+        for name, id_key in self._item_keys.items():
+            upserts = record["upsert"].get(name, ())
+            deletes = record["delete"].get(name, ())
+            if not upserts and not deletes:
+                continue
+            items = {item[id_key]: item for item in stored.get(name, ())}
+            for key in deletes:
+                items.pop(key, None)
+            for item in upserts:
+                items[item[id_key]] = item
+            stored[name] = list(items.values())
+
+    def _diff(
+        self, data: dict[str, Any]
+    ) -> (
+        tuple[
+            dict[str, _JournaledList],
+            bytes,
+            dict[str, list[json_helper.json_fragment]],
+            dict[str, list[Any]],
+        ]
+        | None
+    ):
+        """Compare data with the data which is on disk.
+
+        Returns the new index, the JSON outside the journaled lists, the
+        changed items and the removed keys, or None if the data can't be
+        journaled.
+        """
+        stored = data.get("data")
+        if not isinstance(stored, dict) or not all(
+            isinstance(stored.get(name), list) for name in self._item_keys
+        ):
+            return None
+        other = json_helper.json_bytes(
+            {
+                **{key: value for key, value in data.items() if key != "data"},
+                "data": {
+                    key: value
+                    for key, value in stored.items()
+                    if key not in self._item_keys
+                },
+            }
+        )
+        lists: dict[str, _JournaledList] = {}
+        upserts: dict[str, list[json_helper.json_fragment]] = {}
+        deletes: dict[str, list[Any]] = {}
+        for name, id_key in self._item_keys.items():
+            items: list[Any] = stored[name]
+            if self._lists is None:
+                old = _JournaledList([], [], [], set(), {})
+            else:
+                old = self._lists[name]
+            old_count = len(old.items)
+            changed = [
+                idx
+                for idx, (item, old_item) in enumerate(
+                    zip(items, old.items, strict=False)
+                )
+                if item is not old_item
+            ]
+            changed.extend(range(old_count, len(items)))
+            if not changed and len(items) == old_count:
+                lists[name] = old
+                continue
+            keys = old.keys[: len(items)]
+            digests = old.digests[: len(items)]
+            digest_to_key = dict(old.digest_to_key)
+            for digest in old.digests[len(items) :]:
+                del digest_to_key[digest]
+            for idx in changed:
+                if idx < old_count:
+                    del digest_to_key[old.digests[idx]]
+            replaced = set(old.keys[len(items) :])
+            added = set()
+            changed_items: list[json_helper.json_fragment] = []
+            for idx in changed:
+                item = items[idx]
+                item_json = json_helper.json_bytes(item)
+                digest = hashlib.blake2b(item_json, digest_size=16).digest()
+                if (key := old.digest_to_key.get(digest)) is None:
+                    if isinstance(item, dict):
+                        key = item[id_key]
+                    else:
+                        key = json_util.json_loads_object(item_json)[id_key]
+                    changed_items.append(json_helper.json_fragment(item_json))
+                if idx < old_count:
+                    replaced.add(keys[idx])
+                    keys[idx] = key
+                    digests[idx] = digest
+                else:
+                    keys.append(key)
+                    digests.append(digest)
+                digest_to_key[digest] = key
+                added.add(key)
+            key_set = (old.key_set - replaced) | added
+            if len(key_set) != len(items):
+                # Duplicate keys can't be journaled
+                return None
+            if removed := replaced - key_set:
+                deletes[name] = list(removed)
+            if changed_items:
+                upserts[name] = changed_items
+            lists[name] = _JournaledList(items, keys, digests, key_set, digest_to_key)
+        return lists, other, upserts, deletes
+
+    @property
+    def has_records(self) -> bool:
+        """Return if the base file misses changes which are in the journal."""
+        return self._journal_size > 0
+
+    def write(
+        self,
+        path: str,
+        data: dict[str, Any],
+        private: bool,
+        atomic_writes: bool,
+        compact: bool = False,
+    ) -> None:
+        """Write data as a journal record or compact it into the base file.
+
+        With compact the data is written to the base file unless it is
+        complete already.
+        """
+        self._last_data = data
+        if (diff := self._diff(data)) is None:
+            self._lists = None
+            self._write_base(path, data, private, atomic_writes)
+            return
+        lists, other, upserts, deletes = diff
+        if (
+            self._lists is None
+            or other != self._other
+            or (compact and (self._journal_size or upserts or deletes))
+        ):
+            self._write_base(path, data, private, atomic_writes)
+        elif upserts or deletes:
+            record = json_helper.json_bytes(
+                {
+                    JOURNAL_GENERATION: self._generation,
+                    "version": data["version"],
+                    "minor_version": data["minor_version"],
+                    "upsert": upserts,
+                    "delete": deletes,
+                }
+            )
+            if self._journal_size + len(record) > max(
+                self._base_size * JOURNAL_COMPACT_RATIO, JOURNAL_MIN_COMPACT_SIZE
+            ):
+                self._write_base(path, data, private, atomic_writes)
+            else:
+                self._append(path, record, atomic_writes)
+        self._lists, self._other = lists, other
+
+    def compact(self, path: str, private: bool, atomic_writes: bool) -> None:
+        """Write the last written data to the base file if it is incomplete."""
+        if self._journal_size and self._last_data is not None:
+            self._write_base(path, self._last_data, private, atomic_writes)
+
+    def _append(self, path: str, record: bytes, atomic_writes: bool) -> None:
+        """Append a record to the journal."""
+        _LOGGER.debug("Appending %s bytes to the journal of %s", len(record), path)
+        try:
+            with open(path + JOURNAL_SUFFIX, "ab") as journal:
+                journal.write(record + b"\n")
+                if atomic_writes:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving journal failed: %s", path)
+            raise WriteError(error) from error
+        self._journal_size += len(record) + 1
+        self.bytes_written += len(record) + 1
+        self.records_written += 1
+
+    def _write_base(
+        self, path: str, data: dict[str, Any], private: bool, atomic_writes: bool
+    ) -> None:
+        """Write the whole document and empty the journal."""
+        _LOGGER.debug("Compacting the journal of %s", path)
+        generation = uuid_util.random_uuid_hex()
+        json_helper.save_json(
+            path,
+            {**data, JOURNAL_GENERATION: generation},
+            private,
+            atomic_writes=atomic_writes,
+        )
+        # Records of older generations are not replayed on top of the new
+        # base file, even if the journal can't be removed.
+        self._generation = generation
+        try:
+            os.unlink(path + JOURNAL_SUFFIX)
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            _LOGGER.warning("Could not remove journal of %s: %s", path, error)
+        self._base_size = _file_size(path)
+        self._journal_size = 0
+        self.bytes_written += self._base_size
+        self.compactions += 1
+
+
+def _file_size(path: str) -> int:
+    """Return the size of a file or 0 if it does not exist."""
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +576,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Passing journal_keys enables the journaled mode. It maps the name of
+        each list in the stored data which should be journaled to the key
+        identifying its items. Changes to these lists are then appended to a
+        journal instead of rewriting the whole file. Only the default encoder
+        is supported in journaled mode.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +601,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal(journal_keys) if journal_keys else None
 
     @cached_property
     def path(self):
@@ -311,7 +655,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_load_data(self):
         """Load the data."""
         # Check if we have a pending write
-        if self._data is not None:
+        if pending := self._data is not None:
             data = self._data
 
             # If we didn't generate data yet, do it now.
@@ -387,6 +731,12 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        # Changes to the base file are only in the journal
+        if self._journal is not None and not pending:
+            await self.hass.async_add_executor_job(
+                self._journal.replay, self.path, data
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,9 +867,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        # Leave a complete base file for anything which does not read the
+        # journal, like older versions and backups restored into them
+        await self._async_handle_write_data(compact=True)
 
-    async def _async_handle_write_data(self, *_args):
+    async def _async_handle_write_data(self, *_args, compact: bool = False):
         """Handle writing the config."""
         async with self._write_lock:
             self._manager.async_invalidate(self.key)
@@ -528,6 +880,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if self._data is None:
                 # Another write already consumed the data
+                if compact and self._journal is not None and not self._read_only:
+                    await self._async_compact_journal()
                 return
 
             data = self._data
@@ -537,20 +891,41 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 return
 
             try:
-                await self._async_write_data(self.path, data)
+                await self._async_write_data(self.path, data, compact)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
-    async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+            if self._journal is not None and self._journal.has_records:
+                self._async_ensure_final_write_listener()
+
+    async def _async_compact_journal(self) -> None:
+        """Write the journal into the base file."""
+        assert self._journal is not None
+        try:
+            await self.hass.async_add_executor_job(
+                self._journal.compact, self.path, self._private, self._atomic_writes
+            )
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
-    def _write_data(self, path: str, data: dict) -> None:
+    async def _async_write_data(
+        self, path: str, data: dict, compact: bool = False
+    ) -> None:
+        await self.hass.async_add_executor_job(
+            self._write_data, self.path, data, compact
+        )
+
+    def _write_data(self, path: str, data: dict, compact: bool = False) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None:
+            self._journal.write(path, data, self._private, self._atomic_writes, compact)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -572,3 +947,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, self.path + JOURNAL_SUFFIX
+                )
@@ -5,6 +5,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+import binascii
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
@@ -12,8 +13,12 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
+from itertools import islice
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -22,6 +27,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -58,6 +64,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -94,6 +101,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +122,15 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+# Compiled templates which were not used for this many boots are dropped
+BYTECODE_CACHE_MAX_UNUSED_BOOTS = 5
+# Least recently used compiled templates beyond this are not persisted
+BYTECODE_CACHE_MAX_ENTRIES = 2048
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -196,6 +213,7 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
 
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
+    hass.data[_BYTECODE_CACHE] = TemplateBytecodeCache(hass)
 
     @callback
     def _async_adjust_lru_sizes(_: Any) -> None:
@@ -2808,6 +2826,12 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled templates of the previous boots."""
+    if (bytecode_cache := hass.data.get(_BYTECODE_CACHE)) is not None:
+        await bytecode_cache.async_load()
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2862,6 +2886,120 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class TemplateBytecodeCache:
+    """Persistent cache of the code of compiled templates.
+
+    Compiled code is keyed by the environment flavor and the hash of the
+    template source. The whole cache is invalidated when Home Assistant,
+    Jinja or the Python bytecode format changes. Entries are kept in least
+    recently used order and only the most recently used ones are persisted.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._store = Store[dict[str, Any]](
+            hass, BYTECODE_CACHE_STORAGE_VERSION, BYTECODE_CACHE_STORAGE_KEY
+        )
+        self._boot = 0
+        # Key -> [base64 encoded marshalled code, last boot it was used]
+        self._entries: dict[str, list[Any]] = {}
+        self._dirty = False
+
+    @staticmethod
+    def _versions() -> list[str]:
+        """Return the versions the compiled code depends on."""
+        return [HA_VERSION, jinja2.__version__, MAGIC_NUMBER.hex()]
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        data = await self._store.async_load()
+        if data is None or data.get("versions") != self._versions():
+            return
+        self._boot = data["boot"] + 1
+        self._entries = {
+            key: entry
+            for key, entry in data["entries"].items()
+            if self._boot - entry[1] <= BYTECODE_CACHE_MAX_UNUSED_BOOTS
+        } | self._entries
+
+    @staticmethod
+    def key(flavor: str, source: str) -> str:
+        """Return the cache key of a template source."""
+        return f"{flavor}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code of a template or None if not cached."""
+        if (entry := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(entry[0]))
+        except (binascii.Error, EOFError, TypeError, ValueError):
+            code = None
+        if not isinstance(code, CodeType):
+            # Corrupt entry, compile the template again
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Move to the end to keep the entries in least recently used order
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+        if entry[1] != self._boot:
+            entry[1] = self._boot
+            self._mark_dirty()
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        self._entries.pop(key, None)
+        self._entries[key] = [
+            base64.b64encode(marshal.dumps(code)).decode(),
+            self._boot,
+        ]
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Schedule a save as templates may be compiled outside the loop."""
+        if self._dirty:
+            return
+        self._dirty = True
+        if self.hass.loop_thread_id == threading.get_ident():
+            self._async_schedule_save()
+        else:
+            self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        if (excess := len(self._entries) - BYTECODE_CACHE_MAX_ENTRIES) > 0:
+            for key in list(islice(self._entries, excess)):
+                self._entries.pop(key, None)
+        return {
+            "versions": self._versions(),
+            "boot": self._boot,
+            "entries": dict(self._entries),
+        }
+
+    @callback
+    def async_get_stats(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2875,6 +3013,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._bytecode_flavor = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3230,7 +3371,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+        else:
+            key = bytecode_cache.key(self._bytecode_flavor, source)
+            if (compiled := bytecode_cache.get(key)) is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -7,6 +7,7 @@ from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
+import sys
 from typing import Any
 
 from homeassistant.core import ServiceResponse
@@ -14,6 +15,8 @@ from homeassistant.util import dt as dt_util
 
 from .typing import TemplateVarsType
 
+_MISSING = object()
+
 
 class TraceElement:
     """Container for trace data."""
@@ -66,17 +69,38 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
+        """Update variables.
+
+        Only references to the changed values are kept, and the snapshot used
+        to diff the next step is shared with the previous step when no variable
+        changed, so large trigger payloads are neither copied nor compared again
+        at every step.
+        """
         if variables is None:
             variables = {}
         last_variables = self._last_variables
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if (last_value := last_variables.get(key, _MISSING)) is not value
+            and (last_value is _MISSING or last_value != value)
         }
         self._variables = changed_variables
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
+        else:
+            variables_cv.set(last_variables)
+
+    def memory_usage(self) -> int:
+        """Return the approximate number of bytes retained by this TraceElement.
+
+        Variable values are shared with the running script and other steps, so
+        only the containers owned by this element are counted.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self._variables)
+        if self._result is not None:
+            size += sys.getsizeof(self._result)
+        return size
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -29,8 +29,8 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_STARTED, Platform, __version__
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -133,6 +133,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[_ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 30
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -653,30 +657,50 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
+            top_level_files: set[str] | None
 
-            if not manifest_path.is_file():
-                continue
+            if manifest_cache is not None and (
+                cached := manifest_cache.get_manifest(manifest_path)
+            ):
+                manifest, top_level_files = cached
+            else:
+                start = time.perf_counter()
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                if manifest.get("integration_type") == "virtual":
+                    top_level_files = None
+                else:
+                    top_level_files = set(os.listdir(file_path))
+
+                if manifest_cache is not None:
+                    manifest_cache.set_manifest(
+                        manifest_path,
+                        manifest,
+                        top_level_files,
+                        time.perf_counter() - start,
+                    )
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -947,6 +971,18 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        manifest_cache = self.hass.data.get(DATA_MANIFEST_CACHE)
+        if (
+            manifest_cache is not None
+            and (
+                cached_dependencies := await manifest_cache.async_get_dependencies(self)
+            )
+            is not None
+        ):
+            self._all_dependencies = cached_dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         self._all_dependencies_resolved = False
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
@@ -973,6 +1009,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if manifest_cache is not None:
+                manifest_cache.async_set_dependencies(self, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -1338,6 +1376,224 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+class _ManifestCache:
+    """Persistent cache of parsed manifests and resolved dependencies.
+
+    Manifests are stored together with the mtime and size of the manifest.json
+    and the mtime of the integration directory, so an entry can be validated
+    with two stat calls instead of reading, parsing and listing the directory.
+    Dependency closures are stored with the manifest stamps of every
+    integration that took part in the resolution and are only reused when all
+    of them still resolve to the same, unchanged manifests.
+
+    The whole cache is discarded when the Home Assistant version changes.
+    Stale entries are replaced as integrations are resolved and the cache is
+    written back in the background once Home Assistant has started.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        self._hass = hass
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._dependencies: dict[str, dict[str, list[Any]]] = {}
+        # Stamps of the manifests validated or parsed during this run
+        self._stamps: dict[str, list[Any]] = {}
+        self._dirty = False
+        self.manifest_hits = 0
+        self.manifest_misses = 0
+        self.dependency_hits = 0
+        self.dependency_misses = 0
+        self.hit_time = 0.0
+        self.miss_time = 0.0
+
+    @callback
+    def async_restore(self, data: dict[str, Any] | None) -> None:
+        """Restore the cache from stored data."""
+        if not data or data.get("ha_version") != __version__:
+            self._dirty = data is not None
+            return
+        self._manifests = data["manifests"]
+        self._dependencies = data["dependencies"]
+
+    @callback
+    def async_data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        return {
+            "ha_version": __version__,
+            # Copies as entries can still be added from the executor
+            # while the data is being serialized.
+            "manifests": dict(self._manifests),
+            "dependencies": dict(self._dependencies),
+        }
+
+    @property
+    def dirty(self) -> bool:
+        """Return if the cache has changed since it was loaded or saved."""
+        return self._dirty
+
+    def get_manifest(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return a cached manifest and top level files if still valid.
+
+        This method must be thread-safe as it's called from the executor.
+        """
+        key = str(manifest_path)
+        if (entry := self._manifests.get(key)) is None:
+            return None
+        start = time.perf_counter()
+        try:
+            stamp = _manifest_stamp(manifest_path, entry["files"] is not None)
+        except OSError:
+            return None
+        if stamp != entry["stamp"]:
+            return None
+        self._stamps[key] = stamp
+        self.manifest_hits += 1
+        self.hit_time += time.perf_counter() - start
+        files = entry["files"]
+        # Integration.__init__ adds keys to the manifest so hand out a copy
+        return cast(Manifest, dict(entry["manifest"])), (
+            None if files is None else set(files)
+        )
+
+    def set_manifest(
+        self,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+        elapsed: float,
+    ) -> None:
+        """Store a freshly parsed manifest.
+
+        This method must be thread-safe as it's called from the executor.
+        """
+        self.manifest_misses += 1
+        self.miss_time += elapsed
+        try:
+            stamp = _manifest_stamp(manifest_path, top_level_files is not None)
+        except OSError:
+            return
+        key = str(manifest_path)
+        self._stamps[key] = stamp
+        self._manifests[key] = {
+            "stamp": stamp,
+            "manifest": dict(manifest),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        self._dirty = True
+
+    def _integration_stamp(self, integration: Integration) -> list[Any] | None:
+        """Return the stamp of the manifest an integration was loaded from."""
+        return self._stamps.get(str(integration.file_path / "manifest.json"))
+
+    async def async_get_dependencies(self, integration: Integration) -> set[str] | None:
+        """Return the cached dependency closure of an integration if still valid."""
+        if (stamps := self._dependencies.get(integration.domain)) is None:
+            return None
+        # Load all integrations of the closure in a single batch instead of
+        # one round trip to the executor per level of the dependency tree.
+        integrations = await async_get_integrations(self._hass, stamps)
+        for domain, int_or_exc in integrations.items():
+            if (
+                not isinstance(int_or_exc, Integration)
+                or self._integration_stamp(int_or_exc) != stamps[domain]
+            ):
+                self.dependency_misses += 1
+                return None
+        self.dependency_hits += 1
+        return {domain for domain in stamps if domain != integration.domain}
+
+    @callback
+    def async_set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Store the resolved dependency closure of an integration."""
+        cache = self._hass.data[DATA_INTEGRATIONS]
+        stamps: dict[str, list[Any]] = {}
+        for domain in (integration.domain, *dependencies):
+            if (
+                type(dep_integration := cache.get(domain)) is not Integration
+                or (stamp := self._integration_stamp(dep_integration)) is None
+            ):
+                return
+            stamps[domain] = stamp
+        self._dependencies[integration.domain] = stamps
+        self._dirty = True
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics about the work saved by the cache."""
+        avg_miss_time = (
+            self.miss_time / self.manifest_misses if self.manifest_misses else 0.0
+        )
+        return {
+            "manifest_hits": self.manifest_hits,
+            "manifest_misses": self.manifest_misses,
+            "dependency_hits": self.dependency_hits,
+            "dependency_misses": self.dependency_misses,
+            "hit_time": round(self.hit_time, 4),
+            "miss_time": round(self.miss_time, 4),
+            "estimated_saved_time": round(
+                max(avg_miss_time * self.manifest_hits - self.hit_time, 0.0), 4
+            ),
+        }
+
+
+def _manifest_stamp(manifest_path: pathlib.Path, with_files: bool) -> list[Any]:
+    """Return the stamp used to detect changes to an integration on disk.
+
+    The directory mtime changes when top level files are added or removed.
+    """
+    manifest_stat = os.stat(manifest_path)
+    return [
+        manifest_stat.st_mtime_ns,
+        manifest_stat.st_size,
+        os.stat(manifest_path.parent).st_mtime_ns if with_files else None,
+    ]
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persistent manifest cache.
+
+    The cache is written back once Home Assistant has started if any manifest
+    or dependency closure had to be resolved from scratch.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[dict[str, Any]] = Store(
+        hass,
+        MANIFEST_CACHE_STORAGE_VERSION,
+        MANIFEST_CACHE_STORAGE_KEY,
+        private=True,
+        atomic_writes=True,
+    )
+    manifest_cache = _ManifestCache(hass)
+    manifest_cache.async_restore(await store.async_load())
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+
+    @callback
+    def _async_save_if_dirty(_: Event) -> None:
+        """Write back the cache if it was rebuilt during startup."""
+        _LOGGER.debug("Integration manifest cache: %s", manifest_cache.async_stats())
+        if manifest_cache.dirty:
+            store.async_delay_save(
+                manifest_cache.async_data_to_save, MANIFEST_CACHE_SAVE_DELAY
+            )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_if_dirty)
+
+
+@callback
+def async_get_manifest_cache_stats(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return statistics of the manifest cache or None if it is not loaded."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        return None
+    return manifest_cache.async_stats()
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
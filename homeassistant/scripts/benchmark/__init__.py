@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -17,6 +20,8 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.storage import Store
+from homeassistant.util.collection import chunked_or_all
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +313,481 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_subscription_matching(hass: core.HomeAssistant) -> float:
+    """Match 100k topics against 10k wildcard MQTT subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    for idx in range(10**4):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}/+", False, job))
+        if idx % 10 == 0:
+            trie.add(Subscription(f"tasmota/discovery/{idx}/#", False, job))
+
+    topics = [f"zigbee2mqtt/device_{idx % 10**4}/state" for idx in range(10**5)]
+    matches = 0
+
+    start = timer()
+    for topic in topics:
+        matches += len(trie.match(topic))
+    runtime = timer() - start
+
+    assert matches == 10**5
+
+    return runtime
+
+
+def _recorder_write_states(bulk_insert: bool) -> float:
+    """Write 100k states to an in memory recorder database."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.core import _state_row
+    from homeassistant.components.recorder.db_schema import Base, States
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    dbstates = [
+        States(
+            state="on",
+            last_updated_ts=1700000000.0 + idx,
+            metadata_id=idx % 1000,
+            attributes_id=idx % 100,
+            origin_idx=0,
+            context_id_bin=idx.to_bytes(16),
+        )
+        for idx in range(10**5)
+    ]
+    states_table = States.__table__
+
+    start = timer()
+    with Session(engine) as session:
+        for batch in chunked_or_all(dbstates, 300):
+            if bulk_insert:
+                session.execute(
+                    insert(states_table).returning(
+                        states_table.c.state_id, sort_by_parameter_order=True
+                    ),
+                    [_state_row(dbstate) for dbstate in batch],
+                )
+            else:
+                session.add_all(batch)
+            session.commit()
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states_orm(hass: core.HomeAssistant) -> float:
+    """Write 100k states with the ORM unit of work in commits of 300 states."""
+    return await hass.async_add_executor_job(_recorder_write_states, False)
+
+
+@benchmark
+async def recorder_write_states_executemany(hass: core.HomeAssistant) -> float:
+    """Write 100k states with executemany in commits of 300 states."""
+    return await hass.async_add_executor_job(_recorder_write_states, True)
+
+
+def _statistics_window_updates(window_size: int) -> float:
+    """Push 100k samples through a full statistics sample window."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.aggregation import SlidingWindowAggregator
+
+    aggregator = SlidingWindowAggregator(track_extremes=True, track_order=True)
+    window: deque[float] = deque()
+    values = [float(idx * 7919 % 10007) for idx in range(10**5 + window_size)]
+    for idx, value in enumerate(values[:window_size]):
+        window.append(value)
+        aggregator.append(value, idx)
+
+    start = timer()
+    for idx, value in enumerate(values[window_size:], window_size):
+        aggregator.popleft(window.popleft(), window)
+        window.append(value)
+        aggregator.append(value, idx)
+        _ = (
+            aggregator.mean,
+            aggregator.variance,
+            aggregator.max,
+            aggregator.min,
+            aggregator.median,
+            aggregator.percentile(95),
+        )
+    return timer() - start
+
+
+@benchmark
+async def statistics_window_100(hass: core.HomeAssistant) -> float:
+    """Update statistics of a 100 sample window 100k times."""
+    return _statistics_window_updates(100)
+
+
+@benchmark
+async def statistics_window_10000(hass: core.HomeAssistant) -> float:
+    """Update statistics of a 10k sample window 100k times."""
+    return _statistics_window_updates(10**4)
+
+
+def _registry_updates(store: Store) -> float:
+    """Save 1000 single entity updates of a 10k entity registry."""
+    entities = [
+        {"id": f"{idx:032x}", "entity_id": f"sensor.sensor_{idx}", "name": None}
+        for idx in range(10**4)
+    ]
+
+    def _data() -> dict:
+        return {"version": 1, "minor_version": 1, "data": {"entities": list(entities)}}
+
+    os.makedirs(os.path.dirname(store.path))
+    store._write_data(store.path, _data())  # noqa: SLF001
+    journal = store._journal  # noqa: SLF001
+    bytes_written = -journal.bytes_written if journal else 0
+    start = timer()
+    for idx in range(1000):
+        entities[idx] = {**entities[idx], "name": f"Sensor {idx}"}
+        store._write_data(store.path, _data())  # noqa: SLF001
+        if not journal:
+            bytes_written += os.path.getsize(store.path)
+    runtime = timer() - start
+    if journal:
+        bytes_written += journal.bytes_written
+    print(f"Wrote {bytes_written // 1000} bytes per registry update")
+    return runtime
+
+
+@benchmark
+async def registry_updates(hass: core.HomeAssistant) -> float:
+    """Save 1000 single entity updates of a 10k entity registry."""
+    with TemporaryDirectory() as hass.config.config_dir:
+        store = Store(hass, 1, "core.entity_registry")
+        return await hass.async_add_executor_job(_registry_updates, store)
+
+
+@benchmark
+async def registry_updates_journaled(hass: core.HomeAssistant) -> float:
+    """Save 1000 single entity updates of a journaled 10k entity registry."""
+    with TemporaryDirectory() as hass.config.config_dir:
+        store = Store(hass, 1, "core.entity_registry", journal_keys={"entities": "id"})
+        return await hass.async_add_executor_job(_registry_updates, store)
+
+
+@benchmark
+async def bluetooth_matching(hass: core.HomeAssistant) -> float:
+    """Match 100k advertisements of 600 devices against the integration matchers."""
+    # pylint: disable=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+
+    from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+    from homeassistant.components.bluetooth.match import IntegrationMatcher
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    matcher = IntegrationMatcher(BLUETOOTH)  # type: ignore[arg-type]
+    matcher.async_setup()
+
+    def _advertisement(idx: int, seq: int) -> BluetoothServiceInfoBleak:
+        address = f"AA:BB:CC:{idx >> 16 & 255:02X}:{idx >> 8 & 255:02X}:{idx & 255:02X}"
+        counter = bytes([seq & 255])
+        name = f"Device {idx}"
+        manufacturer_data: dict[int, bytes] = {}
+        service_data: dict[str, bytes] = {}
+        service_uuids: list[str] = []
+        if idx % 3 == 0:
+            # Apple devices advertising nearby and continuity messages
+            manufacturer_data[76] = b"\x10\x05" + counter + b"\x1c\x8a\x12"
+        elif idx % 3 == 1:
+            # Devices with a name close to the names integrations match
+            manufacturer_data[idx % 64] = counter * 6
+            name = f"GV5130_{idx:04X}"
+        else:
+            service_data["0000feaa-0000-1000-8000-00805f9b34fb"] = counter * 8
+            service_uuids.append("0000feaa-0000-1000-8000-00805f9b34fb")
+        device = BLEDevice(address, name, None, -60)
+        return BluetoothServiceInfoBleak(
+            name=name,
+            address=address,
+            rssi=-60,
+            manufacturer_data=manufacturer_data,
+            service_data=service_data,
+            service_uuids=service_uuids,
+            source="local",
+            device=device,
+            advertisement=AdvertisementData(
+                local_name=name,
+                manufacturer_data=manufacturer_data,
+                service_data=service_data,
+                service_uuids=service_uuids,
+                tx_power=-127,
+                rssi=-60,
+                platform_data=(),
+            ),
+            connectable=bool(idx % 2),
+            time=0,
+            tx_power=-127,
+        )
+
+    advertisements = [_advertisement(idx % 600, idx // 600) for idx in range(10**5)]
+
+    start = timer()
+    for service_info in advertisements:
+        matcher.match_domains(service_info)
+    return timer() - start
+
+
+async def _sensor_statistics_compile(hass: core.HomeAssistant, buffered: bool) -> float:
+    """Compile statistics of 500 sensors which changed 50 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+    from homeassistant.util import dt as dt_util
+
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    recorder_helper.async_initialize_recorder(hass)
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": f"sqlite:///{config_dir}/db.sqlite"}},
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+        entity_ids = [f"sensor.power_{idx}" for idx in range(500)]
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0", attributes)
+        if buffered:
+            # The buffer starts with the first compile
+            sensor_recorder._get_states_buffer(hass)  # noqa: SLF001
+        await asyncio.sleep(0.01)
+        start_time = dt_util.utcnow()
+        for value in range(50):
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value), attributes)
+        await asyncio.sleep(0.01)
+        end_time = dt_util.utcnow()
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+
+        def _compile() -> float:
+            with session_scope(session=instance.get_session()) as session:
+                start = timer()
+                sensor_recorder.compile_statistics(hass, session, start_time, end_time)
+                return timer() - start
+
+        runtime = await instance.async_add_executor_job(_compile)
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def sensor_statistics_compile_history(hass: core.HomeAssistant) -> float:
+    """Compile statistics of 500 sensors from the recorded history."""
+    return await _sensor_statistics_compile(hass, False)
+
+
+@benchmark
+async def sensor_statistics_compile_buffered(hass: core.HomeAssistant) -> float:
+    """Compile statistics of 500 sensors from the buffered states."""
+    return await _sensor_statistics_compile(hass, True)
+
+
+@benchmark
+async def time_pattern_listeners(hass: core.HomeAssistant) -> float:
+    """Fire 1200 time pattern listeners during 10 simulated minutes."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+    import time
+
+    from homeassistant.helpers import event as event_helper
+    from homeassistant.util import dt as dt_util
+    from homeassistant.util.async_ import get_scheduled_timer_handles
+
+    count = 0
+
+    @core.callback
+    def listener(now) -> None:
+        nonlocal count
+        count += 1
+
+    for idx in range(1200):
+        event_helper.async_track_utc_time_change(
+            hass, listener, second=idx % 60, local=bool(idx % 2)
+        )
+    timers = sum(
+        not handle.cancelled() for handle in get_scheduled_timer_handles(hass.loop)
+    )
+
+    loop = hass.loop
+    utc_now = dt_util.utcnow().replace(microsecond=0)
+    runtime = 0.0
+    for _ in range(600):
+        utc_now += timedelta(seconds=1)
+        timestamp = utc_now.timestamp() + 0.5
+        event_helper.time_tracker_utcnow = lambda now=utc_now: now
+        event_helper.time_tracker_timestamp = lambda now=timestamp: now
+        loop_time = loop.time() + timestamp - time.time()
+        due = [
+            handle
+            for handle in get_scheduled_timer_handles(loop)
+            if not handle.cancelled() and handle.when() <= loop_time
+        ]
+        start = timer()
+        for handle in due:
+            handle._run()  # noqa: SLF001
+            handle.cancel()
+        runtime += timer() - start
+    print(f"Fired {count} listeners from {timers} timers")
+    return runtime
+
+
+async def _entity_state_writes(hass: core.HomeAssistant, coalesce: bool) -> float:
+    """Write the state of 1000 entities in bursts of 5 updates 20 times."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity_registry as er,
+        translation,
+    )
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    class BenchmarkEntity(Entity):
+        _attr_should_poll = False
+        _coalesce_state_writes = coalesce
+
+    with TemporaryDirectory() as hass.config.config_dir:
+        translation.async_setup(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain="sensor",
+            platform_name="benchmark",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        entities = [BenchmarkEntity() for _ in range(1000)]
+        for idx, entity in enumerate(entities):
+            entity.entity_id = f"sensor.benchmark_{idx}"
+        await platform.async_add_entities(entities)
+        count = 0
+
+        @core.callback
+        def listener(event: core.Event) -> None:
+            nonlocal count
+            count += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+        start = timer()
+        for value in range(20):
+            for entity in entities:
+                for burst in range(5):
+                    entity._attr_state = value * 5 + burst  # noqa: SLF001
+                    entity.async_write_ha_state()
+            await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        print(f"Fired {count} state_changed events")
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def entity_state_writes(hass: core.HomeAssistant) -> float:
+    """Write the state of 1000 entities in bursts of 5 updates."""
+    return await _entity_state_writes(hass, False)
+
+
+@benchmark
+async def entity_state_writes_coalesced(hass: core.HomeAssistant) -> float:
+    """Write the coalesced state of 1000 entities in bursts of 5 updates."""
+    return await _entity_state_writes(hass, True)
+
+
+@benchmark
+async def state_attributes_memory(hass: core.HomeAssistant) -> float:
+    """Set and keep 100k states of 1000 sensors with 10 distinct attribute sets."""
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    attribute_sets = [
+        {
+            "state_class": "measurement",
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "icon": f"mdi:flash-{idx}",
+        }
+        for idx in range(10)
+    ]
+    states = []
+    tracemalloc.start()
+    start = timer()
+    for value in range(100):
+        for idx in range(1000):
+            entity_id = f"sensor.power_{idx}"
+            attributes = dict(attribute_sets[(idx + value) % 10])
+            hass.states.async_set(entity_id, str(value), attributes)
+            states.append(hass.states.get(entity_id))
+    runtime = timer() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Kept {len(states)} states in {memory // 1024} KiB")
+    return runtime
+
+
+@benchmark
+async def conversation_slot_lists_update(hass: core.HomeAssistant) -> float:
+    """Update conversation slot lists of 6000 entities after 100 changes."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+    )
+    from homeassistant.setup import async_setup_component
+
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    with TemporaryDirectory() as hass.config.config_dir:
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        await fr.async_load(hass)
+        await ar.async_load(hass)
+        await async_setup_component(hass, "homeassistant", {})
+        agent = DefaultAgent(hass, {})
+        for idx in range(6000):
+            hass.states.async_set(
+                f"light.benchmark_{idx}", "off", {"friendly_name": f"Light {idx}"}
+            )
+        agent._make_slot_lists()  # noqa: SLF001
+
+        start = timer()
+        for idx in range(100):
+            hass.states.async_set(f"light.benchmark_new_{idx}", "off")
+            await hass.async_block_till_done()
+            agent._make_slot_lists()  # noqa: SLF001
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
@@ -204,6 +204,9 @@ def check(config_dir, secrets=False):
         mock_function = locals()[f"mock_{key.replace('*', '')}"]
         PATCHES[key] = patch(val[0], side_effect=mock_function)
 
+    # Parse all files again to record every loaded file and secret
+    yaml_loader.clear_yaml_cache()
+
     # Start all patches
     for pat in PATCHES.values():
         pat.start()
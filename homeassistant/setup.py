@@ -72,6 +72,13 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is a list, indicating when each phase of setting up
+# a component started and how long it took: (integration, group, phase,
+# started, duration)
+DATA_SETUP_TIMELINE: HassKey[list[tuple[str, str | None, str, float, float]]] = HassKey(
+    "setup_timeline"
+)
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -83,6 +90,9 @@ NOTIFY_FOR_TRANSLATION_KEYS = [
     "platform_config_validation_err",
 ]
 
+TIMELINE_IMPORT = "import"
+TIMELINE_CONFIG_VALIDATION = "config_validation"
+
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
@@ -337,14 +347,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with _async_timeline_span(hass, domain, TIMELINE_IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration, component
-    )
+    with _async_timeline_span(hass, domain, TIMELINE_CONFIG_VALIDATION):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration, component
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -719,6 +731,7 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        _setup_timeline(hass).append((integration, group, phase, started, time_taken))
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -736,6 +749,35 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(
+    hass: core.HomeAssistant,
+) -> list[tuple[str, str | None, str, float, float]]:
+    """Return the setup timeline list."""
+    return []
+
+
+@contextlib.contextmanager
+def _async_timeline_span(
+    hass: core.HomeAssistant, integration: str, phase: str
+) -> Generator[None]:
+    """Record a phase of setting up an integration in the startup timeline.
+
+    Unlike async_start_setup, the span is not counted in the setup timings.
+    """
+    if hass.is_stopping or hass.state is core.CoreState.running:
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _setup_timeline(hass).append(
+            (integration, None, phase, started, time.monotonic() - started)
+        )
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -782,6 +824,7 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        _setup_timeline(hass).append((integration, group, phase, started, time_taken))
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -828,3 +871,42 @@ def async_get_domain_setup_times(
 ) -> Mapping[str | None, dict[SetupPhases, float]]:
     """Return timing data for each integration."""
     return _setup_times(hass).get(domain, {})
+
+
+@callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> list[dict[str, Any]]:
+    """Return the startup timeline as Chrome trace events.
+
+    Every integration gets its own track, and each import, config validation,
+    setup and wait phase is a complete event on that track.
+    """
+    timeline = _setup_timeline(hass)
+    if not timeline:
+        return []
+    origin = min(started for _, _, _, started, _ in timeline)
+    track_ids: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+    for integration, group, phase, started, duration in timeline:
+        if (track_id := track_ids.get(integration)) is None:
+            track_id = track_ids[integration] = len(track_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 0,
+                    "tid": track_id,
+                    "args": {"name": integration},
+                }
+            )
+        events.append(
+            {
+                "name": str(phase) if group is None else f"{phase} ({group})",
+                "cat": str(phase),
+                "ph": "X",
+                "pid": 0,
+                "tid": track_id,
+                "ts": round((started - origin) * 1_000_000),
+                "dur": round(duration * 1_000_000),
+            }
+        )
+    return events
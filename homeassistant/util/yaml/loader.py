@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, overload
 
 import yaml
@@ -40,6 +44,57 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+@dataclass(slots=True)
+class _CachedYaml:
+    """A parsed YAML file and everything its parsed content depends on."""
+
+    stamp: tuple[int, int, int] | None
+    digest: bytes
+    data: JSON_TYPE | None
+    parse_time: float
+    # Files loaded while parsing, with the entry they were loaded from
+    files: list[tuple[str, _CachedYaml]] = field(default_factory=list)
+    # Directory listings of !include_dir_* tags
+    dirs: list[tuple[str, list[str]]] = field(default_factory=list)
+    # Secrets with the requesting file and their value
+    secrets: list[tuple[str, str, str]] = field(default_factory=list)
+    # Environment variables with their default and their value
+    env_vars: list[tuple[str, str | None, str]] = field(default_factory=list)
+    hits: int = 0
+
+
+class _LoadSession(threading.local):
+    """State of the YAML files being loaded by a thread."""
+
+    def __init__(self) -> None:
+        """Initialize the session."""
+        # Entries of files which are being parsed, innermost last
+        self.parsing: list[_CachedYaml] = []
+        # Files which were already validated by the outermost load
+        self.validated: dict[str, _CachedYaml | None] | None = None
+
+
+# Parsed YAML files by the path they were loaded with. A parsed file is
+# reused as long as the content of the file and everything it includes
+# is unchanged, which avoids parsing an unchanged configuration again
+# on reloads.
+_YAML_CACHE: dict[str, _CachedYaml] = {}
+_SESSION = _LoadSession()
+
+
+def clear_yaml_cache() -> None:
+    """Clear the cache of parsed YAML files."""
+    _YAML_CACHE.clear()
+
+
+def get_yaml_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return the parse time and number of cache hits of each YAML file."""
+    return {
+        fname: {"parse_time": entry.parse_time, "hits": entry.hits}
+        for fname, entry in _YAML_CACHE.items()
+    }
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -165,7 +220,7 @@ def load_yaml(
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _load_yaml_file(os.fspath(fname), conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -175,6 +230,141 @@ def load_yaml(
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_file(
+    fname: str, conf_file: TextIO, secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Load an opened YAML file from the cache or parse it."""
+    if (validated := _SESSION.validated) is None:
+        _SESSION.validated = {}
+    try:
+        entry, content = _get_cached_yaml(fname, conf_file, secrets)
+        if entry is None:
+            entry = _parse_yaml_file(fname, conf_file, content, secrets)
+        else:
+            entry.hits += 1
+        _SESSION.validated[fname] = entry
+    finally:
+        if validated is None:
+            _SESSION.validated = None
+    if _SESSION.parsing:
+        _SESSION.parsing[-1].files.append((fname, entry))
+    return _copy_node(entry.data)
+
+
+def _file_stamp(conf_file: TextIO) -> tuple[int, int, int] | None:
+    """Return the modification time, size and inode of an opened file."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        # Not a real file
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _get_cached_yaml(
+    fname: str, conf_file: TextIO, secrets: Secrets | None
+) -> tuple[_CachedYaml | None, str | None]:
+    """Return the cached entry of a file if it is still valid.
+
+    Returns the content of the file if it had to be read.
+    """
+    if (entry := _YAML_CACHE.get(fname)) is None:
+        return None, None
+    stamp = _file_stamp(conf_file)
+    content: str | None = None
+    if stamp is None or stamp != entry.stamp:
+        # The file was touched, check if the content changed
+        content = conf_file.read()
+        if _digest(content) != entry.digest:
+            return None, content
+        entry.stamp = stamp
+    if not _is_valid(entry, secrets):
+        return None, content
+    return entry, content
+
+
+def _digest(content: str) -> bytes:
+    """Return the digest of the content of a file."""
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _is_valid(entry: _CachedYaml, secrets: Secrets | None) -> bool:
+    """Check if everything the parsed content depends on is unchanged."""
+    validated = _SESSION.validated
+    assert validated is not None
+    for fname, file_entry in entry.files:
+        if fname not in validated:
+            try:
+                with open(fname, encoding="utf-8") as conf_file:
+                    validated[fname], _ = _get_cached_yaml(fname, conf_file, secrets)
+            except (OSError, UnicodeDecodeError):
+                validated[fname] = None
+        if validated[fname] is not file_entry:
+            return False
+    for loc, files in entry.dirs:
+        if list(_find_files(loc, "*.yaml")) != files:
+            return False
+    if entry.secrets:
+        if secrets is None:
+            return False
+        for requester, secret, value in entry.secrets:
+            try:
+                if secrets.get(requester, secret) != value:
+                    return False
+            except HomeAssistantError:
+                return False
+    return all(
+        _get_env_var(name, default) == value for name, default, value in entry.env_vars
+    )
+
+
+def _parse_yaml_file(
+    fname: str, conf_file: TextIO, content: str | None, secrets: Secrets | None
+) -> _CachedYaml:
+    """Parse a YAML file and cache the result."""
+    if content is None:
+        content = conf_file.read()
+    stream = StringIO(content)
+    # Keep the file name for the file references of the nodes
+    stream.name = getattr(conf_file, "name", fname)  # type: ignore[misc]
+    entry = _CachedYaml(_file_stamp(conf_file), _digest(content), None, 0)
+    start = time.perf_counter()
+    _SESSION.parsing.append(entry)
+    try:
+        entry.data = parse_yaml(stream, secrets)
+    finally:
+        _SESSION.parsing.pop()
+    entry.parse_time = time.perf_counter() - start
+    _LOGGER.debug("Parsed %s in %.3f seconds", fname, entry.parse_time)
+    _YAML_CACHE[fname] = entry
+    return entry
+
+
+def _copy_node(obj: Any) -> Any:
+    """Copy the mutable containers of parsed YAML, keeping file references."""
+    copy: NodeDictClass | NodeListClass
+    if (obj_type := type(obj)) is NodeDictClass:
+        copy = NodeDictClass({key: _copy_node(value) for key, value in obj.items()})
+    elif obj_type is NodeListClass:
+        copy = NodeListClass([_copy_node(value) for value in obj])
+    elif obj_type is dict:
+        return {key: _copy_node(value) for key, value in obj.items()}
+    elif obj_type is list:
+        return [_copy_node(value) for value in obj]
+    elif obj_type is set:
+        return set(obj)
+    else:
+        return obj
+    try:  # suppress is much slower
+        copy.__config_file__ = obj.__config_file__
+        copy.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return copy
+
+
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> dict:
@@ -341,12 +531,20 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Find the YAML files of a directory and record them as a dependency."""
+    files = list(_find_files(directory, "*.yaml"))
+    if _SESSION.parsing:
+        _SESSION.parsing[-1].dirs.append((directory, files))
+    return files
+
+
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -366,7 +564,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -383,7 +581,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -396,7 +594,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -467,12 +665,18 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     args = node.value.split()
 
     # Check for a default value
-    if len(args) > 1:
-        return os.getenv(args[0], " ".join(args[1:]))
-    if args[0] in os.environ:
-        return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    default = " ".join(args[1:]) if len(args) > 1 else None
+    if (value := _get_env_var(args[0], default)) is None:
+        _LOGGER.error("Environment variable %s not defined", node.value)
+        raise HomeAssistantError(node.value)
+    if _SESSION.parsing:
+        _SESSION.parsing[-1].env_vars.append((args[0], default, value))
+    return value
+
+
+def _get_env_var(name: str, default: str | None) -> str | None:
+    """Return the value of an environment variable or its default."""
+    return os.getenv(name, default)
 
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
@@ -480,7 +684,10 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    value = loader.secrets.get(loader.get_name, node.value)
+    if _SESSION.parsing:
+        _SESSION.parsing[-1].secrets.append((loader.get_name, node.value, value))
+    return value
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
@@ -2160,6 +2160,60 @@ async def test_register_callback_by_local_name(
     assert service_info.manufacturer_id == 21
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+@pytest.mark.parametrize(
+    ("local_name", "matched_names"),
+    [
+        ("rtx2", ["rtx2"]),
+        ("rtx*", ["rtx", "rtx2", "rtx22"]),
+        ("rtx?", ["rtx2"]),
+        ("rtx[12]*", ["rtx2", "rtx22"]),
+    ],
+)
+async def test_register_callback_by_local_name_pattern(
+    hass: HomeAssistant,
+    mock_bleak_scanner_start: MagicMock,
+    local_name: str,
+    matched_names: list[str],
+) -> None:
+    """Test registering a callback by a local_name pattern."""
+    mock_bt = []
+    callbacks = []
+
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append((service_info, change))
+
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init"):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        cancel = bluetooth.async_register_callback(
+            hass,
+            _fake_subscriber,
+            {LOCAL_NAME: local_name},
+            BluetoothScanningMode.ACTIVE,
+        )
+
+        for idx, name in enumerate(["rtx", "rtx2", "rtx22", "rt", "other"]):
+            device = generate_ble_device(f"44:44:33:11:23:4{idx}", name)
+            adv = generate_advertisement_data(local_name=name)
+            inject_advertisement(hass, device, adv)
+
+        await hass.async_block_till_done()
+
+        cancel()
+
+    assert [service_info.name for service_info, _ in callbacks] == matched_names
+
+
 @pytest.mark.usefixtures("enable_bluetooth")
 async def test_register_callback_by_local_name_overly_broad(
     hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
@@ -1,6 +1,7 @@
 """Test for the default agent."""
 
 from collections import defaultdict
+import logging
 import os
 import tempfile
 from typing import Any
@@ -2907,10 +2908,18 @@ async def test_intent_cache_all_entities(hass: HomeAssistant) -> None:
     assert result is not None
     assert getattr(result, mark, None) is True
 
-    # Adding a new entity clears the cache
+    # Adding an entity with an unrelated name keeps the cache
     hass.states.async_set("light.new_light", "off")
     result = await agent.async_recognize_intent(user_input)
     assert result is not None
+    assert getattr(result, mark, None) is True
+
+    # Adding an entity with a name in the input text clears the cache
+    hass.states.async_set(
+        "light.test_light_2", "off", attributes={ATTR_FRIENDLY_NAME: "test light"}
+    )
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
     assert getattr(result, mark, None) is None
 
 
@@ -3016,6 +3025,79 @@ async def test_entities_filtered_by_input(hass: HomeAssistant) -> None:
         assert name_list.values[1].text_in.text == "test light"
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_entity_names_updated_incrementally(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that entity name changes are applied without rebuilding slot lists."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    kitchen_light = entity_registry.async_update_entity(
+        kitchen_light.entity_id, aliases={"ceiling light"}
+    )
+    hass.states.async_set(
+        kitchen_light.entity_id,
+        "off",
+        attributes={ATTR_FRIENDLY_NAME: "kitchen light"},
+    )
+    expose_entity(hass, kitchen_light.entity_id, True)
+    await hass.async_block_till_done()
+
+    async def get_names(text: str) -> tuple[list[str], list[str]]:
+        """Get (exposed, unexposed) names considered for input text."""
+        user_input = ConversationInput(
+            text=text,
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            language=hass.config.language,
+            agent_id=None,
+        )
+        with patch(
+            "homeassistant.components.conversation.default_agent.recognize_best",
+            return_value=None,
+        ) as recognize_best:
+            await agent.async_recognize_intent(user_input, strict_intents_only=True)
+
+        slot_lists = recognize_best.call_args_list[0].kwargs["slot_lists"]
+        exposed_names = sorted(
+            value.text_in.text for value in slot_lists["name"].values
+        )
+        unexposed_names = sorted(
+            value.text_in.text
+            for value in agent._get_filtered_names(
+                agent._unexposed_names_trie, text.lower()
+            ).values
+        )
+        return exposed_names, unexposed_names
+
+    caplog.set_level(logging.DEBUG)
+    text = "turn on kitchen light ceiling light lamp"
+    assert await get_names(text) == (["ceiling light", "kitchen light"], [])
+
+    # Change alias
+    entity_registry.async_update_entity(kitchen_light.entity_id, aliases={"lamp"})
+    await hass.async_block_till_done()
+    assert await get_names(text) == (["kitchen light", "lamp"], [])
+
+    # Unexpose
+    expose_entity(hass, kitchen_light.entity_id, False)
+    assert await get_names(text) == ([], ["kitchen light", "lamp"])
+
+    # Remove
+    hass.states.async_remove(kitchen_light.entity_id)
+    await hass.async_block_till_done()
+    assert await get_names(text) == ([], [])
+
+    # Slot lists were only created once
+    assert caplog.text.count("Created slot lists") == 1
+    assert caplog.text.count("Updated names of 1 entities") == 3
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_entities_names_are_not_templates(hass: HomeAssistant) -> None:
     """Test that entities names are not treated as hassil templates."""
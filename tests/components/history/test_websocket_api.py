@@ -1,7 +1,12 @@
 """The tests the History component websocket_api."""
 
+from array import array
 import asyncio
+from base64 import b64decode
 from datetime import timedelta
+from math import isnan
+import sys
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -173,6 +178,81 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_columnar(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with the columnar result format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "1.5", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "unavailable")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "unavailable", attributes={"any": "new"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "2")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "unknown")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "unavailable")
+    hass.states.async_set("sensor.other", "nan")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other", "sensor.missing"],
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    def decode(columns: dict[str, Any]) -> dict[str, Any]:
+        timestamps = array("d", b64decode(columns["lu"]))
+        values = array("d", b64decode(columns["v"]))
+        codes = array("i", b64decode(columns["c"]))
+        if sys.byteorder != "little":
+            for column in (timestamps, values, codes):
+                column.byteswap()
+        return {
+            "lu": timestamps.tolist(),
+            "v": [None if isnan(value) else value for value in values],
+            "c": codes.tolist(),
+            "d": columns["d"],
+        }
+
+    result = {
+        entity_id: decode(columns) for entity_id, columns in response["result"].items()
+    }
+    assert result == {
+        "sensor.test": {
+            "lu": [ANY, ANY, ANY, ANY, ANY],
+            "v": [1.5, None, 2.0, None, None],
+            "c": [-1, 0, -1, 1, 0],
+            "d": ["unavailable", "unknown"],
+        },
+        "sensor.other": {
+            "lu": [ANY],
+            "v": [None],
+            "c": [0],
+            "d": ["nan"],
+        },
+    }
+    timestamps = result["sensor.test"]["lu"]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[-1] == pytest.approx(
+        hass.states.get("sensor.test").last_updated.timestamp()
+    )
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
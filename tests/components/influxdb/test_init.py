@@ -5,8 +5,11 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
+from influxdb.line_protocol import make_line
 import pytest
 
 from homeassistant.components import influxdb
@@ -65,21 +68,69 @@ def mock_client_fixture(
         yield client
 
 
+class LineProtocol:
+    """Compare written line protocol with points in the JSON format.
+
+    Timestamps are only compared for points with a time.
+    """
+
+    def __init__(self, points: list[dict[str, Any]], precision: str | None) -> None:
+        """Initialize the lines to compare with."""
+        self.lines = [
+            (
+                make_line(
+                    point["measurement"],
+                    point["tags"],
+                    {
+                        # Numbers are always written as floats
+                        key: float(value) if type(value) is int else value
+                        for key, value in point["fields"].items()
+                    },
+                    None if point["time"] is ANY else point["time"],
+                    # The client uses a different notation for the precision
+                    {"ns": "n", "us": "u"}.get(precision, precision),
+                ),
+                point["time"] is ANY,
+            )
+            for point in points
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with the written lines."""
+        if isinstance(other, bytes):
+            other = other.decode().split("\n")
+        if not isinstance(other, list) or len(other) != len(self.lines):
+            return False
+        return all(
+            (actual.rpartition(" ")[0] if without_time else actual) == line
+            for actual, (line, without_time) in zip(other, self.lines, strict=True)
+        )
+
+    def __repr__(self) -> str:
+        """Return the lines to compare with."""
+        return repr([line for line, _ in self.lines])
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
 
         return call(**data)
 
+    def v1_call(body, precision):
+        return call(
+            LineProtocol(body, precision), time_precision=precision, protocol="line"
+        )
+
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1427,6 +1478,46 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_queue_full(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test the event listener drops new events when the queue is full."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+
+    with patch(f"{INFLUX_PATH}.QUEUE_MAX_SIZE", 0):
+        hass.states.async_set("entity.id", 1)
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+
+    assert get_write_api(mock_client).call_count == 0
+    assert hass.data[influxdb.DOMAIN].events_dropped == 1
+
+    hass.states.async_set("entity.id", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert get_write_api(mock_client).call_count == 1
+    assert hass.data[influxdb.DOMAIN].events_written == 1
+
+
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
     [
@@ -1670,6 +1761,7 @@ async def test_invalid_inputs_error(
 )
 async def test_precision(
     hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
     mock_client,
     config_ext,
     get_write_api,
@@ -1682,13 +1774,15 @@ async def test_precision(
     }
     config.update(config_ext)
     await _setup(hass, mock_client, config, get_write_api)
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC)
+    freezer.move_to(now)
 
     value = "1.9"
     body = [
         {
             "measurement": "foobars",
             "tags": {"domain": "fake", "entity_id": "entity_id"},
-            "time": ANY,
+            "time": now,
             "fields": {"value": float(value)},
         }
     ]
@@ -0,0 +1,181 @@
+"""The tests for the logbook in memory index of recent events."""
+
+from datetime import timedelta
+
+from homeassistant.components import logbook
+from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.logbook.const import BUILT_IN_EVENTS
+from homeassistant.components.logbook.helpers import async_determine_event_types
+from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.recent import RecentEvents
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.script import EVENT_SCRIPT_STARTED
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_NAME,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_LOGBOOK_ENTRY,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+
+EVENT_TYPES = (*BUILT_IN_EVENTS, "mock_described")
+
+
+async def test_recent_events_rows(hass: HomeAssistant) -> None:
+    """Test the retained rows match the request."""
+    start = dt_util.utcnow()
+    recent = RecentEvents(
+        hass,
+        {"mock_described": ("mock", lambda event: {})},
+        {"excluded"},
+        lambda entity_id: entity_id != "light.filtered",
+    )
+    recent.async_start()
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.filtered", "off")
+    await hass.async_block_till_done()
+    context = Context()
+    hass.states.async_set("light.kitchen", "on", context=context)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.filtered", "on")
+    hass.bus.async_fire("mock_described", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("not_described")
+    hass.bus.async_fire("excluded")
+    hass.bus.async_fire(EVENT_LOGBOOK_ENTRY, {"name": "x"}, context=context)
+    await hass.async_block_till_done()
+    end = dt_util.utcnow() + timedelta(seconds=1)
+
+    recent_start, rows = recent.async_get_rows(
+        start - timedelta(hours=1), end, EVENT_TYPES, None, None, None, None
+    )
+    assert recent_start.timestamp() == recent.covered_since
+    assert [(row.entity_id, row.state, row.event_type) for row in rows] == [
+        ("light.kitchen", "on", None),
+        (None, None, "mock_described"),
+        (None, None, EVENT_LOGBOOK_ENTRY),
+    ]
+
+    _, rows = recent.async_get_rows(
+        start, end, EVENT_TYPES, None, ["light.kitchen"], None, None
+    )
+    assert [(row.entity_id, row.event_type, row.context_only) for row in rows] == [
+        ("light.kitchen", None, None),
+        (None, "mock_described", None),
+        (None, EVENT_LOGBOOK_ENTRY, True),
+    ]
+
+    _, rows = recent.async_get_rows(
+        start, end, EVENT_TYPES, None, None, None, context.id
+    )
+    assert [(row.entity_id, row.event_type) for row in rows] == [
+        ("light.kitchen", None),
+        (None, EVENT_LOGBOOK_ENTRY),
+    ]
+
+    assert (
+        recent.async_get_rows(
+            start - timedelta(hours=1), start, EVENT_TYPES, None, None, None, None
+        )
+        is None
+    )
+    recent.async_stop()
+
+
+async def test_recent_events_eviction(hass: HomeAssistant) -> None:
+    """Test evicting events moves the start of the retained window."""
+    recent = RecentEvents(hass, {}, set(), None, max_events=2)
+    recent.async_start()
+    covered_since = recent.covered_since
+
+    for idx in range(4):
+        hass.bus.async_fire(EVENT_LOGBOOK_ENTRY, {"name": str(idx)})
+    await hass.async_block_till_done()
+
+    assert recent.covered_since > covered_since
+    recent_start, rows = recent.async_get_rows(
+        dt_util.utcnow() - timedelta(hours=1),
+        dt_util.utcnow() + timedelta(seconds=1),
+        EVENT_TYPES,
+        None,
+        None,
+        None,
+        None,
+    )
+    assert recent_start.timestamp() == recent.covered_since
+    assert [row.data["name"] for row in rows] == ["2", "3"]
+    recent.async_stop()
+
+
+async def test_recent_events_match_database(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a request served from the ring gets the entries of the database."""
+    await hass.config.async_set_time_zone("UTC")
+    for domain in ("automation", "script", logbook.DOMAIN):
+        assert await async_setup_component(hass, domain, {})
+    await hass.async_block_till_done()
+    start = dt_util.utcnow()
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("sensor.power", "10", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.mode", "eco")
+    hass.states.async_set("climate.hall", "off", {ATTR_UNIT_OF_MEASUREMENT: "°C"})
+    await hass.async_block_till_done()
+    context = Context()
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.mock_automation"},
+        context=context,
+    )
+    hass.bus.async_fire(
+        EVENT_SCRIPT_STARTED,
+        {ATTR_NAME: "Mock script", ATTR_ENTITY_ID: "script.mock_script"},
+        context=context,
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 10})
+    hass.states.async_set("sensor.power", "20", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.mode", "boost", context=context)
+    hass.states.async_set("climate.hall", "heat", {ATTR_UNIT_OF_MEASUREMENT: "°C"})
+    hass.bus.async_fire(
+        EVENT_LOGBOOK_ENTRY, {ATTR_NAME: "Mock entry", "message": "is on"}
+    )
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow() + timedelta(seconds=1)
+
+    recent_events = hass.data[logbook.DOMAIN].recent_events
+    assert recent_events.covered_since <= start.timestamp()
+
+    for entity_ids, context_id in (
+        (None, None),
+        (["light.kitchen"], None),
+        (["sensor.power", "sensor.mode", "climate.hall"], None),
+        (None, context.id),
+    ):
+        event_types = async_determine_event_types(hass, entity_ids, None)
+
+        event_processor = EventProcessor(
+            hass, event_types, entity_ids, None, context_id
+        )
+        recent = event_processor.async_get_recent_rows(start, end)
+        assert recent is not None
+        from_ring = await hass.async_add_executor_job(
+            event_processor.get_events, start, end, recent
+        )
+
+        event_processor = EventProcessor(
+            hass, event_types, entity_ids, None, context_id
+        )
+        from_database = await hass.async_add_executor_job(
+            event_processor.get_events, start, end
+        )
+
+        assert from_ring
+        assert from_ring == from_database
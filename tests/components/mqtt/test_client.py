@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 import socket
 import ssl
 import time
@@ -13,7 +14,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -635,6 +640,101 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_shared_subscription(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the subscription of shared subscription topics."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "$share/group/test-topic/+/on", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "$share/group/test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/bier/off", "test-payload")
+
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 1
+    assert recorded_calls[0].topic == "test-topic/bier/on"
+
+
+async def test_matching_subscriptions_cache_invalidation(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test cached matching subscriptions are updated on (un)subscribe."""
+    await mqtt_mock_entry()
+    calls: list[str] = []
+
+    @callback
+    def _record(name: str, msg: ReceiveMessage) -> None:
+        calls.append(name)
+
+    unsub_level = await mqtt.async_subscribe(
+        hass, "test-topic/+", partial(_record, "level")
+    )
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == ["level"]
+
+    unsub_subtree = await mqtt.async_subscribe(
+        hass, "test-topic/#", partial(_record, "subtree")
+    )
+    unsub_simple = await mqtt.async_subscribe(
+        hass, "test-topic/bier", partial(_record, "simple")
+    )
+    calls.clear()
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == ["simple", "level", "subtree"]
+
+    unsub_level()
+    unsub_simple()
+    calls.clear()
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == ["subtree"]
+
+    unsub_subtree()
+    calls.clear()
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "ab/c", False),
+        ("#", "a/b/c", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("+/+", "/b", True),
+        ("$share/group/a/+", "a/b", True),
+        ("$share/group/a/+", "$share/group/a/b", False),
+    ],
+)
+def test_subscription_trie_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against the wildcard subscription trie."""
+    trie = SubscriptionTrie()
+    subscription = Subscription(topic_filter, False, Mock())
+    trie.add(subscription)
+    assert trie.match(topic) == ([subscription] if matches else [])
+
+    trie.remove(subscription)
+    assert trie.match(topic) == []
+    with pytest.raises(KeyError):
+        trie.remove(subscription)
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
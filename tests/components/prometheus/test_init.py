@@ -1229,6 +1229,36 @@ async def test_counter(
     ).withValue(2.0).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_state_changes_exported_on_request(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    counter_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test state changes of exported entities are exported when requested."""
+    labels = {"domain": "counter", "friendly_name": "None", "entity": "counter.counter"}
+    for value in (3, 4, 5):
+        set_state_with_entry(hass, counter_entities["counter_1"], value)
+    await hass.async_block_till_done()
+
+    assert prometheus_client.REGISTRY.get_sample_value("counter_value", labels) == 2.0
+
+    body = await generate_latest_metrics(client)
+
+    EntityMetric(
+        metric_name="counter_value",
+        domain="counter",
+        friendly_name="None",
+        entity="counter.counter",
+    ).withValue(5.0).assert_in_metrics(body)
+    EntityMetric(
+        metric_name="state_change_total",
+        domain="counter",
+        friendly_name="None",
+        entity="counter.counter",
+    ).withValue(4.0).assert_in_metrics(body)
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_update(
     client: ClientSessionGenerator, update_entities: dict[str, er.RegistryEntry]
@@ -395,7 +395,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance._pending_states):
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
@@ -438,7 +439,8 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance._pending_states):
             if isinstance(obj, States):
                 raise SQLAlchemyError(
                     "insert the state", "fake params", "forced to fail"
@@ -1473,6 +1475,60 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_states_and_events_with_executemany(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states and events are written without adding them to the session."""
+    instance = get_instance(hass)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        instance.event_session, "add", wraps=instance.event_session.add
+    ) as session_add:
+        hass.states.async_set("test.one", "s1", {})
+        hass.states.async_set("test.one", "s2", {"attr": 1})
+        hass.states.async_set("test.one", "s3", {"attr": 1})
+        hass.states.async_set("test.two", "s4", {})
+        hass.bus.async_fire("test_event", {"data": 1})
+        hass.bus.async_fire("test_event")
+        await async_wait_recording_done(hass)
+
+    assert not any(
+        isinstance(call.args[0], (Events, States))
+        for call in session_add.call_args_list
+    )
+    assert not instance._pending_states
+    assert not instance._pending_events
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).filter(States.state.in_(("s1", "s2", "s3", "s4")))
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s4"].old_state_id is None
+        assert states_by_state["s2"].attributes_id is not None
+        assert (
+            states_by_state["s2"].attributes_id == states_by_state["s3"].attributes_id
+        )
+
+        events = list(
+            session.query(Events.data_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(events) == 2
+        assert {event.data_id is None for event in events} == {True, False}
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
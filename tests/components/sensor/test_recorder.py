@@ -306,6 +306,55 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_from_states_buffer(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compiling statistics from the buffered states instead of history."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass.states.async_set("sensor.test1", "20", attributes=attributes)
+        # The first compile starts buffering states
+        do_adhoc_statistics(hass, start=zero - timedelta(minutes=10))
+        await async_wait_recording_done(hass)
+        await hass.async_block_till_done()
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    get_history.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx((20 * 5 - 10 * 50 + 15 * 200 + 30 * 45) / 300),
+                "min": pytest.approx(-10),
+                "max": pytest.approx(30),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -492,6 +492,55 @@ async def test_sampling_size_1(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(1 / 1, 2)
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "expected_fn"),
+    [
+        ("mean", statistics.mean),
+        ("median", statistics.median),
+        ("percentile", lambda values: statistics.quantiles(values, n=100)[89]),
+        ("standard_deviation", statistics.stdev),
+        ("variance", statistics.variance),
+        ("sum", sum),
+        ("value_max", max),
+        ("value_min", min),
+        ("distance_absolute", lambda values: max(values) - min(values)),
+    ],
+)
+async def test_sliding_window_incremental(
+    hass: HomeAssistant, characteristic: str, expected_fn: Any
+) -> None:
+    """Test incrementally maintained characteristics over a sliding buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 7,
+                    "percentile": 90,
+                    "precision": 6,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    values = [(idx * 37 % 101) / 4 - 10 for idx in range(200)]
+    for idx, value in enumerate(values, 1):
+        hass.states.async_set("sensor.test_monitored", str(value))
+        await hass.async_block_till_done()
+        if idx % 50 == 0:
+            state = hass.states.get("sensor.test")
+            assert state is not None
+            assert float(state.state) == pytest.approx(
+                round(expected_fn(values[max(0, idx - 7) : idx]), 6)
+            )
+
+
 async def test_age_limit_expiry(hass: HomeAssistant) -> None:
     """Test that values are removed with given max age."""
     now = dt_util.utcnow()
@@ -20,7 +20,7 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import av
 import numpy as np
@@ -900,6 +900,12 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
             segment.duration,
             abs_tol=1e-6,
         )
+    # check that the parts of complete segments are views of the segment data
+    for segment in complete_segments:
+        data = segment.get_data()
+        assert isinstance(data, memoryview)
+        assert all(part.data.obj is data.obj for part in segment.parts)
+        assert b"".join(part.data for part in segment.parts) == data
 
     await stream.stop()
 
@@ -991,6 +997,8 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "container_format": "mov,mp4,m4a,3gp,3g2,mj2",
         "keepalive": False,
         "orientation": Orientation.NO_TRANSFORM,
+        "part_bytes_copied": ANY,
+        "segment_bytes": 0,
         "start_worker": 1,
         "video_codec": "hevc",
         "worker_error": 1,
@@ -217,6 +217,7 @@ async def test_get_trace(
     _assert_raw_config(domain, sun_config, trace)
     assert trace["blueprint_inputs"] is None
     assert trace["context"]
+    assert trace["memory_usage"] > 0
     assert trace["error"] == "Action test.automation not found"
     assert trace["state"] == "stopped"
     assert trace["script_execution"] == "error"
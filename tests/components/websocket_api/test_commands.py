@@ -17,9 +17,12 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import (
+    async_get_entity_subscription_fanout,
+)
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1310,6 +1313,52 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_fanout(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    hass.states.async_set("light.kitchen", "off")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    for msg_id, entity_ids in ((7, ["light.kitchen"]), (8, ["light.bedroom"])):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", "entity_ids": entity_ids}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    fanout = async_get_entity_subscription_fanout(hass)
+    assert fanout.subscriptions == 2
+    assert (
+        hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before + 1
+    )
+
+    hass.states.async_set("switch.unrelated", "on")
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    assert fanout.events == 2
+    assert fanout.candidates == 1
+    assert fanout.deliveries == 1
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert fanout.subscriptions == 0
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
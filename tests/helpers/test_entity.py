@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -35,7 +36,10 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_platform import (
+    AddEntitiesCallback,
+    async_get_coalesced_state_writes,
+)
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
 from tests.common import (
@@ -44,6 +48,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -652,6 +657,39 @@ async def test_async_remove_twice(hass: HomeAssistant) -> None:
     assert len(ent.remove_calls) == 1
 
 
+async def test_async_write_ha_state_coalesced(hass: HomeAssistant) -> None:
+    """Test coalescing state writes in the same event loop iteration."""
+
+    class CoalescingEntity(entity.Entity):
+        _coalesce_state_writes = True
+
+    platform = MockEntityPlatform(hass, domain="test", platform_name="coalesce")
+    platform.async_prepare()
+    ent = CoalescingEntity()
+    ent.entity_id = "test.test"
+    await platform.async_add_entities([ent])
+    # The state is written right away when the entity is added
+    assert hass.states.get("test.test").state == STATE_UNKNOWN
+    assert async_get_coalesced_state_writes(hass) == {}
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for state in ("one", "two", "three"):
+        ent._attr_state = state
+        ent.async_write_ha_state()
+    assert hass.states.get("test.test").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test").state == "three"
+    assert len(events) == 1
+    assert async_get_coalesced_state_writes(hass) == {"test.coalesce": 2}
+
+    # A pending write is dropped when the entity is removed
+    ent._attr_state = "four"
+    ent.async_write_ha_state()
+    await ent.async_remove()
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test") is None
+
+
 async def test_set_context(hass: HomeAssistant) -> None:
     """Test setting context."""
     context = Context()
@@ -30,6 +30,8 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
+    async_get_time_pattern_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3119,6 +3121,84 @@ async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None
     assert refresh_runs == ["duck"]
 
 
+async def test_track_template_result_coalesces_renders(hass: HomeAssistant) -> None:
+    """Test state changes in the same loop iteration render a template once."""
+    template_sum = Template(
+        "{{ states('sensor.one') | int(0) + states('sensor.two') | int(0) }}", hass
+    )
+    template_other = Template("{{ states('sensor.three') }}", hass)
+
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append([(update.template, update.result) for update in updates])
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None), TrackTemplate(template_other, None)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    assert info.render_stats[template_sum].render_count == 1
+    assert info.render_stats[template_other].render_count == 1
+
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    await hass.async_block_till_done()
+
+    assert runs == [[(template_sum, 3)]]
+    assert info.render_stats[template_sum].render_count == 2
+    assert info.render_stats[template_other].render_count == 1
+    assert info.render_stats[template_sum].render_time > 0
+
+    hass.states.async_set("sensor.unrelated", "on")
+    await hass.async_block_till_done()
+
+    assert len(runs) == 1
+    assert info.render_stats[template_sum].render_count == 2
+
+    hass.states.async_set("sensor.three", "x")
+    await hass.async_block_till_done()
+
+    assert runs[-1] == [(template_other, "x")]
+    assert info.render_stats[template_sum].render_count == 2
+    assert info.render_stats[template_other].render_count == 2
+
+    info.async_remove()
+    hass.states.async_set("sensor.one", "5")
+    await hass.async_block_till_done()
+
+    assert len(runs) == 2
+
+
+async def test_async_get_template_render_stats(hass: HomeAssistant) -> None:
+    """Test render stats are aggregated across trackers by template."""
+    assert async_get_template_render_stats(hass) == {}
+
+    unsubs = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('light.kitchen') }}", hass), None)],
+            lambda event, updates: None,
+        )
+        for _ in range(2)
+    ]
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    stats = async_get_template_render_stats(hass)
+    assert list(stats) == ["{{ states('light.kitchen') }}"]
+    assert stats["{{ states('light.kitchen') }}"].render_count == 4
+
+    for info in unsubs:
+        info.async_remove()
+    assert async_get_template_render_stats(hass) == {}
+
+
 async def test_async_track_template_result_multiple_templates(
     hass: HomeAssistant,
 ) -> None:
@@ -3887,6 +3967,112 @@ async def test_async_track_time_change(
     assert len(none_runs) == 3
 
 
+async def test_async_track_time_change_shared_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test time pattern listeners fire from a single timer."""
+    runs = []
+    cancelled_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+    assert async_get_time_pattern_stats(hass)["listeners"] == 0
+
+    @callback
+    def cancel_other(now: datetime) -> None:
+        runs.append(now)
+        unsub_cancelled()
+
+    unsubs = [
+        async_track_utc_time_change(hass, cancel_other, second=0),
+        async_track_time_change(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: runs.append(x)),
+            second=0,
+        ),
+    ]
+    unsub_cancelled = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: cancelled_runs.append(x)),
+        second=0,
+    )
+    stats = async_get_time_pattern_stats(hass)
+    assert stats["listeners"] == 3
+    assert stats["timers"] == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert runs[0].tzinfo is dt_util.UTC
+    assert runs[1] == dt_util.as_local(runs[0])
+    assert cancelled_runs == []
+    stats = async_get_time_pattern_stats(hass)
+    assert stats["listeners"] == 2
+    assert stats["timers"] == 1
+    assert stats["ticks"] == 1
+    assert stats["dispatch_time"] == stats["last_dispatch_time"]
+
+    for unsub in unsubs:
+        unsub()
+    stats = async_get_time_pattern_stats(hass)
+    assert stats["listeners"] == 0
+    assert stats["timers"] == 0
+
+
+async def test_async_track_time_change_shared_timer_listener_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a raising time pattern listener does not stop the others."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    @callback
+    def raise_error(now: datetime) -> None:
+        raise ValueError("listener failed")
+
+    unsubs = [
+        async_track_utc_time_change(hass, raise_error, second=0),
+        async_track_utc_time_change(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: runs.append(x)),
+            second=0,
+        ),
+    ]
+
+    for minute in (0, 1):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert caplog.text.count("Error while dispatching time pattern") == 2
+    stats = async_get_time_pattern_stats(hass)
+    assert stats["listeners"] == 2
+    assert stats["timers"] == 1
+
+    for unsub in unsubs:
+        unsub()
+
+
 async def test_periodic_task_minute(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -16,6 +16,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    ExtraStoredData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -342,6 +343,135 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_reuses_unchanged_extra_data(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the extra data is only collected for entities which changed."""
+
+    class MockExtraData(ExtraStoredData):
+        """Mock extra data."""
+
+        def __init__(self, value: int) -> None:
+            """Initialize the mock extra data."""
+            self.value = value
+
+        def as_dict(self) -> dict[str, Any]:
+            """Return a dict representation of the extra data."""
+            return {"value": self.value}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity."""
+
+        _attr_state = "on"
+        value = 1
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            """Return entity specific state data to be restored."""
+            return extra_data(self.value)
+
+    extra_data = Mock(side_effect=MockExtraData)
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [MockRestoreEntity() for _ in range(2)]
+    for idx, entity in enumerate(entities):
+        entity.entity_id = f"input_boolean.b{idx}"
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert extra_data.call_count == 2
+
+    # Nothing changed
+    await data.async_dump_states()
+    assert extra_data.call_count == 2
+
+    # Writing the state collects the extra data again
+    entities[0].value = 2
+    entities[0].async_write_ha_state()
+    await data.async_dump_states()
+    assert extra_data.call_count == 3
+
+    # A state set by someone else collects the extra data again
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+    assert extra_data.call_count == 4
+
+    storage_data = hass_storage[STORAGE_KEY]["data"]
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"], item["extra_data"])
+        for item in storage_data
+    ] == [
+        ("input_boolean.b0", "on", {"value": 2}),
+        ("input_boolean.b1", "off", {"value": 1}),
+    ]
+
+
+async def test_dump_extra_data_changed_without_state_write(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test extra data changed without a state write is saved."""
+
+    class MockExtraData(ExtraStoredData):
+        """Mock extra data."""
+
+        def __init__(self, value: int) -> None:
+            """Initialize the mock extra data."""
+            self.value = value
+
+        def as_dict(self) -> dict[str, Any]:
+            """Return a dict representation of the extra data."""
+            return {"value": self.value}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity."""
+
+        _attr_state = "on"
+        value = 1
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            """Return entity specific state data to be restored."""
+            return MockExtraData(self.value)
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [MockRestoreEntity() for _ in range(2)]
+    for idx, entity in enumerate(entities):
+        entity.entity_id = f"input_boolean.b{idx}"
+    await platform.async_add_entities(entities)
+
+    def stored_extra_data() -> list[tuple[str, dict[str, Any]]]:
+        return [
+            (item["state"]["entity_id"], item["extra_data"])
+            for item in hass_storage[STORAGE_KEY]["data"]
+        ]
+
+    data = async_get(hass)
+    data.async_setup_dump()
+    await hass.async_block_till_done()
+    assert stored_extra_data() == [
+        ("input_boolean.b0", {"value": 1}),
+        ("input_boolean.b1", {"value": 1}),
+    ]
+
+    # Marking the extra data as changed collects it again
+    entities[0].value = 2
+    entities[0].async_extra_restore_state_data_changed()
+    entities[1].value = 2
+    await data.async_dump_states()
+    assert stored_extra_data() == [
+        ("input_boolean.b0", {"value": 2}),
+        ("input_boolean.b1", {"value": 1}),
+    ]
+
+    # The extra data of all entities is collected again when stopping
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert stored_extra_data() == [
+        ("input_boolean.b0", {"value": 2}),
+        ("input_boolean.b1", {"value": 2}),
+    ]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
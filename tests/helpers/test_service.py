@@ -46,6 +46,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -1928,6 +1929,47 @@ async def test_extract_from_service_area_id(
     ]
 
 
+async def test_extract_referenced_entity_ids_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test resolved targets are cached until a registry changes."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    area = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    call = ServiceCall(hass, "light", "turn_on", {"area_id": area.id})
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.referenced_devices == set()
+    assert service.async_get_target_resolution_cache_stats(hass) == {
+        "generation": 1,
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+    }
+
+    # The cached result is not shared with the caller
+    selected.referenced_devices.add("mutated")
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.referenced_devices == set()
+    assert service.async_get_target_resolution_cache_stats(hass)["hits"] == 1
+
+    device_registry.async_update_device(device.id, area_id=area.id)
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.referenced_devices == {device.id}
+    assert service.async_get_target_resolution_cache_stats(hass) == {
+        "generation": 2,
+        "hits": 1,
+        "misses": 2,
+        "size": 1,
+    }
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_from_service_label_id(hass: HomeAssistant) -> None:
     """Test the extraction using label ID as reference."""
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -667,6 +668,219 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test changes to journaled lists are appended to the journal."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id"}
+        items = [{"id": str(idx), "value": idx} for idx in range(100)]
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+
+        await store.async_save({"items": list(items), "other": 1})
+        base = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        assert not await hass.async_add_executor_job(journal_path.exists)
+
+        # Unchanged items are not written again
+        await store.async_save({"items": list(items), "other": 1})
+        assert not await hass.async_add_executor_job(journal_path.exists)
+
+        items[5] = {"id": "5", "value": "changed"}
+        del items[10]
+        items.append({"id": "new", "value": 100})
+        await store.async_save({"items": list(items), "other": 1})
+        items[5] = {"id": "5", "value": 5}
+        await store.async_save({"items": list(items), "other": 1})
+
+        assert await hass.async_add_executor_job(Path(store.path).read_bytes) == base
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert journal.count(b"\n") == 2
+        assert len(journal) < len(base) / 10
+
+        replayed = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys
+        )
+        data = await replayed.async_load()
+        assert sorted(data["items"], key=lambda item: item["id"]) == sorted(
+            items, key=lambda item: item["id"]
+        )
+        assert data["other"] == 1
+
+        # Changes outside the journaled lists compact the journal
+        await replayed.async_save({"items": list(items), "other": 2})
+        assert not await hass.async_add_executor_job(journal_path.exists)
+        assert await replayed.async_load() == {"items": items, "other": 2}
+
+        await replayed.async_save({"items": items[1:], "other": 2})
+        assert await hass.async_add_executor_job(journal_path.exists)
+        await replayed.async_remove()
+        assert not await hass.async_add_executor_job(journal_path.exists)
+        assert not await hass.async_add_executor_job(Path(store.path).exists)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_incomplete_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an incomplete journal record is ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        await store.async_save({"items": [{"id": "1", "value": 1}]})
+        await store.async_save({"items": [{"id": "1", "value": 2}]})
+
+        def _append_incomplete_record() -> None:
+            with open(f"{store.path}{storage.JOURNAL_SUFFIX}", "ab") as journal:
+                journal.write(b'{"version":1,"minor_version":1,"ups')
+
+        await hass.async_add_executor_job(_append_incomplete_record)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == {"items": [{"id": "1", "value": 2}]}
+        assert "Ignoring incomplete journal" in caplog.text
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compacted_on_stop(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the base file on shutdown."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        delayed_store = storage.Store(
+            hass, MOCK_VERSION, "delayed", journal_keys=journal_keys
+        )
+        for journaled in (store, delayed_store):
+            await journaled.async_save({"items": [{"id": "1", "value": 1}]})
+            await journaled.async_save({"items": [{"id": "1", "value": 2}]})
+        delayed_store.async_delay_save(lambda: {"items": [{"id": "1", "value": 3}]})
+        for journaled in (store, delayed_store):
+            journal_path = Path(f"{journaled.path}{storage.JOURNAL_SUFFIX}")
+            assert await hass.async_add_executor_job(journal_path.exists)
+
+        await hass.async_stop(force=True)
+
+    for journaled, value in ((store, 2), (delayed_store, 3)):
+        journal_path = Path(f"{journaled.path}{storage.JOURNAL_SUFFIX}")
+        assert not await loop.run_in_executor(None, journal_path.exists)
+        base = json.loads(
+            await loop.run_in_executor(None, Path(journaled.path).read_text)
+        )
+        assert base["data"] == {"items": [{"id": "1", "value": value}]}
+
+
+async def test_journaled_store_stale_journal(tmpdir: py.path.local) -> None:
+    """Test a journal left behind by a compaction is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        await store.async_save({"items": [{"id": "a", "value": "v0"}], "other": 1})
+        await store.async_save(
+            {
+                "items": [{"id": "a", "value": "v1"}, {"id": "b", "value": "v1"}],
+                "other": 1,
+            }
+        )
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+
+        # Compaction which stopped before removing the journal
+        await store.async_save({"items": [{"id": "a", "value": "v2"}], "other": 2})
+        assert not await hass.async_add_executor_job(journal_path.exists)
+        await hass.async_add_executor_job(journal_path.write_bytes, journal)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "value": "v2"}],
+            "other": 2,
+        }
+
+        # The next write compacts the stale journal
+        await store.async_save({"items": [{"id": "a", "value": "v3"}], "other": 2})
+        assert not await hass.async_add_executor_job(journal_path.exists)
+
+        # Base file written by a version without journaling
+        await store.async_save({"items": [{"id": "a", "value": "v4"}], "other": 2})
+        assert await hass.async_add_executor_job(journal_path.exists)
+        await hass.async_add_executor_job(
+            Path(store.path).write_text,
+            json.dumps(
+                {
+                    "version": MOCK_VERSION,
+                    "minor_version": 1,
+                    "key": MOCK_KEY,
+                    "data": {"items": [{"id": "a", "value": "v5"}], "other": 2},
+                }
+            ),
+        )
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "value": "v5"}],
+            "other": 2,
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_invalid_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test replaying stops at a journal record with missing keys."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        await store.async_save({"items": [{"id": "1", "value": 1}]})
+        await store.async_save({"items": [{"id": "1", "value": 2}]})
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        record = json.loads(await hass.async_add_executor_job(journal_path.read_text))
+        generation = record[storage.JOURNAL_GENERATION]
+
+        def _append_records() -> None:
+            with open(journal_path, "ab") as journal:
+                journal.write(
+                    json.dumps(
+                        {
+                            storage.JOURNAL_GENERATION: generation,
+                            "version": 1,
+                            "upsert": {"items": [{"value": 3}]},
+                            "delete": {},
+                        }
+                    ).encode()
+                    + b"\n"
+                )
+                journal.write(
+                    json.dumps(
+                        {
+                            storage.JOURNAL_GENERATION: generation,
+                            "version": 1,
+                            "minor_version": 1,
+                            "upsert": {"items": [{"id": "1", "value": 4}]},
+                            "delete": {},
+                        }
+                    ).encode()
+                    + b"\n"
+                )
+
+        await hass.async_add_executor_job(_append_records)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == {"items": [{"id": "1", "value": 2}]}
+        assert "Ignoring invalid journal" in caplog.text
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -5189,6 +5190,106 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test compiled templates are reused across restarts."""
+    template_string = "{{ 'bytecode' ~ ' cache' }}"
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    await template.async_load_bytecode_cache(hass)
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "bytecode cache"
+    assert bytecode_cache.async_get_stats() == {"entries": 1, "hits": 0, "misses": 1}
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["boot"] == 0
+    assert list(data["entries"]) == [
+        template.TemplateBytecodeCache.key("default", template_string)
+    ]
+
+    # Simulate a restart
+    del tpl
+    assert not hass.data[template._ENVIRONMENT].template_cache.get(template_string)
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    await template.async_load_bytecode_cache(hass)
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "bytecode cache"
+    assert bytecode_cache.async_get_stats() == {"entries": 1, "hits": 1, "misses": 0}
+
+
+async def test_bytecode_cache_max_entries(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only the most recently used compiled templates are persisted."""
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    await template.async_load_bytecode_cache(hass)
+
+    template_strings = [f"{{{{ 'bytecode' ~ ' {i}' }}}}" for i in range(3)]
+    keys = [
+        template.TemplateBytecodeCache.key("default", template_string)
+        for template_string in template_strings
+    ]
+    with patch.object(template, "BYTECODE_CACHE_MAX_ENTRIES", 2):
+        for i, template_string in enumerate(template_strings):
+            tpl = template.Template(template_string, hass)
+            assert tpl.async_render() == f"bytecode {i}"
+        # Use the oldest entry so the second one is the least recently used
+        assert bytecode_cache.get(keys[0]) is not None
+
+        freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert list(data["entries"]) == [keys[2], keys[0]]
+    assert bytecode_cache.async_get_stats()["entries"] == 2
+
+
+@pytest.mark.parametrize(
+    ("versions", "code"),
+    [
+        (["0.0.0", "0.0.0", "00000000"], None),
+        (None, "bm90IGNvZGU="),
+    ],
+)
+async def test_bytecode_cache_invalid(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    versions: list[str] | None,
+    code: str | None,
+) -> None:
+    """Test outdated and corrupt compiled templates are not used."""
+    template_string = "{{ 'bytecode' ~ ' cache' ~ ' invalid' }}"
+    key = template.TemplateBytecodeCache.key("default", template_string)
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY] = {
+        "version": template.BYTECODE_CACHE_STORAGE_VERSION,
+        "data": {
+            "versions": versions or template.TemplateBytecodeCache._versions(),
+            "boot": 0,
+            "entries": {key: [code or "bm90IGNvZGU=", 0]},
+        },
+    }
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    await template.async_load_bytecode_cache(hass)
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "bytecode cache invalid"
+    assert bytecode_cache.async_get_stats() == {"entries": 1, "hits": 0, "misses": 1}
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
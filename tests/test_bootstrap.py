@@ -1173,6 +1173,52 @@ async def test_bootstrap_is_cancellation_safe(
     assert "Error setting up integration cancel_integration" in caplog.text
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_startup_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the startup profile is saved and prioritizes the critical path."""
+    hass.set_state(CoreState.not_running)
+    order = []
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="fast_root", async_setup=gen_domain_setup("fast_root"))
+    )
+    mock_integration(
+        hass, MockModule(domain="slow_root", async_setup=gen_domain_setup("slow_root"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="slow_leaf",
+            dependencies=["slow_root"],
+            async_setup=gen_domain_setup("slow_leaf"),
+        ),
+    )
+    hass_storage[bootstrap.STARTUP_PROFILE_STORAGE_KEY] = {
+        "version": bootstrap.STARTUP_PROFILE_STORAGE_VERSION,
+        "data": {"setup_times": {"fast_root": 2, "slow_root": 1, "slow_leaf": 5}},
+    }
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"fast_root": {}, "slow_root": {}, "slow_leaf": {}}
+    )
+
+    assert order == ["slow_root", "slow_leaf", "fast_root"]
+    profile = hass_storage[bootstrap.STARTUP_PROFILE_STORAGE_KEY]["data"]
+    assert profile["setup_times"].keys() >= {"fast_root", "slow_root", "slow_leaf"}
+    assert {
+        event["args"]["name"] for event in profile["traceEvents"] if event["ph"] == "M"
+    } >= {"fast_root", "slow_root", "slow_leaf"}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_empty_integrations(hass: HomeAssistant) -> None:
     """Test setting up an empty integrations does not raise."""
@@ -61,6 +61,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .common import (
@@ -1165,6 +1166,100 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_entity_id_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events of a specific entity_id."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen("test", listener, entity_id="light.kitchen")
+    unsub2 = hass.bus.async_listen("test", listener, entity_id="light.kitchen")
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 2
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 3
+
+    unsub2()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 3
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, listener, entity_id="light.kitchen")
+
+
+async def test_eventbus_dispatch_plan_updates(hass: HomeAssistant) -> None:
+    """Test listener changes are picked up by the next fired event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("test", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append((MATCH_ALL, event.event_type))
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    assert calls == [("test", "test")]
+
+    calls.clear()
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    assert calls == [("test", "test"), (MATCH_ALL, "test")]
+
+    calls.clear()
+    unsub()
+    hass.bus.async_fire("test")
+    assert calls == [(MATCH_ALL, "test")]
+
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    assert calls == []
+
+
+async def test_eventbus_listener_fanout(hass: HomeAssistant) -> None:
+    """Test the bus counts the listeners run per event type."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["run"]
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", listener, event_filter=mock_filter)
+    hass.bus.async_listen("test", listener, entity_id="light.kitchen")
+
+    hass.bus.async_fire("test", {"run": False})
+    hass.bus.async_fire("test", {"run": True, "entity_id": "light.kitchen"})
+    hass.bus.async_fire("no_listeners")
+
+    fanout = hass.bus.async_listener_fanout()
+    assert fanout["test"] == 4
+    assert "no_listeners" not in fanout
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1655,79 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test states with the same attributes share the attributes."""
+    attrs = {"device_class": "power", "unit_of_measurement": "W"}
+
+    hass.states.async_set("sensor.one", "1", attrs)
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_two.attributes is state_one.attributes
+    assert isinstance(state_two.attributes, ReadOnlyDict)
+
+    # Attributes with unhashable values are not shared
+    hass.states.async_set("sensor.one", "1", {"values": [1, 2]})
+    hass.states.async_set("sensor.two", "2", {"values": [1, 2]})
+    assert (
+        hass.states.get("sensor.one").attributes
+        is not hass.states.get("sensor.two").attributes
+    )
+
+    stats = hass.states.async_attributes_interning_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["skipped"] == 2
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes_saved"] > 0
+
+    # The shared JSON of the attributes matches the JSON of the state
+    assert json_loads(state_two.as_dict_json) == json_loads(
+        json_dumps(state_two.as_dict())
+    )
+    assert json_loads(b"{" + state_two.as_compressed_state_json + b"}") == {
+        "sensor.two": {
+            "s": "2",
+            "a": attrs,
+            "c": state_two.context.id,
+            "lc": state_two.last_changed_timestamp,
+        }
+    }
+
+
+async def test_statemachine_interns_attributes_by_type(hass: HomeAssistant) -> None:
+    """Test attributes which only compare equal are not shared."""
+    utc = datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC)
+    hass.states.async_set(
+        "sensor.a", "1", {"flag": True, "temperature": 20.0, "offset": 0.0, "ts": utc}
+    )
+    hass.states.async_set("sensor.b", "1", {"flag": 1, "temperature": 20})
+    hass.states.async_set("sensor.c", "1", {"flag": True, "temperature": 20.0})
+    hass.states.async_set("sensor.d", "1", {"offset": -0.0})
+    hass.states.async_set(
+        "sensor.e",
+        "1",
+        {"ts": utc.astimezone(dt_util.get_time_zone("Europe/Amsterdam"))},
+    )
+
+    attributes = hass.states.get("sensor.b").attributes
+    assert type(attributes["flag"]) is int
+    assert type(attributes["temperature"]) is int
+    assert json_loads(hass.states.get("sensor.b").as_dict_json)["attributes"] == {
+        "flag": 1,
+        "temperature": 20,
+    }
+    assert hass.states.get("sensor.c").attributes is not attributes
+    assert type(hass.states.get("sensor.c").attributes["flag"]) is bool
+    assert str(hass.states.get("sensor.d").attributes["offset"]) == "-0.0"
+    assert hass.states.get("sensor.e").attributes["ts"].utcoffset() == timedelta(
+        hours=1
+    )
+
+    hass.states.async_set("sensor.f", "1", {"flag": 1, "temperature": 20})
+    assert hass.states.get("sensor.f").attributes is attributes
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -2032,6 +2032,81 @@ async def test_hass_helpers_use_reported(
         assert reported == expected
 
 
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests and dependencies are served from the persistent cache."""
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, "mobile_app")
+    assert await integration.resolve_dependencies()
+    dependencies = integration.all_dependencies
+    assert "http" in dependencies
+
+    stats = loader.async_get_manifest_cache_stats(hass)
+    assert stats["manifest_hits"] == 0
+    assert stats["manifest_misses"] > 0
+    assert stats["dependency_hits"] == 0
+
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    assert manifest_cache.dirty
+    data = manifest_cache.async_data_to_save()
+    assert not manifest_cache.dirty
+    assert "mobile_app" in data["dependencies"]
+
+    # Simulate a restart
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": data,
+    }
+    await loader.async_load_manifest_cache(hass)
+    cached = await loader.async_get_integration(hass, "mobile_app")
+    assert cached is not integration
+    assert cached.manifest == integration.manifest
+    assert cached.has_translations == integration.has_translations
+    assert await cached.resolve_dependencies()
+    assert cached.all_dependencies == dependencies
+
+    stats = loader.async_get_manifest_cache_stats(hass)
+    assert stats["manifest_hits"] > 0
+    assert stats["manifest_misses"] == 0
+    assert stats["dependency_hits"] == 1
+    assert not hass.data[loader.DATA_MANIFEST_CACHE].dirty
+
+
+async def test_manifest_cache_invalidation(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stale and foreign version cache entries are not used."""
+    await loader.async_load_manifest_cache(hass)
+    await loader.async_get_integration(hass, "hue")
+    data = hass.data[loader.DATA_MANIFEST_CACHE].async_data_to_save()
+    (key,) = data["manifests"]
+    data["manifests"][key]["stamp"][0] -= 1
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": data,
+    }
+    await loader.async_load_manifest_cache(hass)
+    await loader.async_get_integration(hass, "hue")
+    stats = loader.async_get_manifest_cache_stats(hass)
+    assert stats["manifest_hits"] == 0
+    assert stats["manifest_misses"] == 1
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    data["ha_version"] = "0.1.0"
+    await loader.async_load_manifest_cache(hass)
+    assert hass.data[loader.DATA_MANIFEST_CACHE].dirty
+    await loader.async_get_integration(hass, "hue")
+    assert loader.async_get_manifest_cache_stats(hass)["manifest_hits"] == 0
+
+
 async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
     """Test json_fragment roundtrip."""
     integration = await loader.async_get_integration(hass, "hue")
@@ -1163,6 +1163,38 @@ async def test_async_start_setup_simple_integration_end_to_end(
     }
 
 
+async def test_async_get_setup_timeline(hass: HomeAssistant) -> None:
+    """Test the startup timeline records each phase of an integration setup."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("test_integration_timeline"))
+    assert await setup.async_setup_component(hass, "test_integration_timeline", {})
+    await hass.async_block_till_done()
+
+    events = setup.async_get_setup_timeline(hass)
+    assert events[0] == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": 0,
+        "tid": 1,
+        "args": {"name": "test_integration_timeline"},
+    }
+    assert [event["name"] for event in events[1:]] == [
+        "import",
+        "config_validation",
+        "setup",
+    ]
+    assert all(event["ph"] == "X" and event["tid"] == 1 for event in events[1:])
+    assert events[1]["ts"] == 0
+    assert events[1]["ts"] <= events[2]["ts"] <= events[3]["ts"]
+
+
+async def test_async_get_setup_timeline_running(hass: HomeAssistant) -> None:
+    """Test the startup timeline is not recorded once running."""
+    mock_integration(hass, MockModule("test_integration_timeline"))
+    assert await setup.async_setup_component(hass, "test_integration_timeline", {})
+    assert setup.async_get_setup_timeline(hass) == []
+
+
 async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     """Test we can get the setup timings from the setup time data."""
     setup_time = setup._setup_times(hass)
@@ -602,3 +602,63 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are not parsed again."""
+    (tmp_path / "secrets.yaml").write_text("password: secret\n")
+    (tmp_path / "packages").mkdir()
+    (tmp_path / "packages" / "one.yaml").write_text(
+        "one:\n  value: !env_var TEST_A a\n"
+    )
+    (tmp_path / "configuration.yaml").write_text(
+        "packages: !include_dir_merge_named packages\npassword: !secret password\n"
+    )
+    fname = str(tmp_path / "configuration.yaml")
+
+    def load() -> tuple[dict[str, Any], int]:
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as mock_parse:
+            data = yaml_loader.load_yaml(fname, yaml_loader.Secrets(tmp_path))
+        return data, mock_parse.call_count
+
+    data, parsed = load()
+    assert data == {"packages": {"one": {"value": "a"}}, "password": "secret"}
+    assert parsed == 3
+    assert data["packages"]["one"].__config_file__ == str(
+        tmp_path / "packages" / "one.yaml"
+    )
+    assert data["packages"]["one"].__line__ == 2
+
+    # Everything is reused and returned as a copy
+    data["packages"]["one"]["value"] = "changed"
+    data, parsed = load()
+    assert data == {"packages": {"one": {"value": "a"}}, "password": "secret"}
+    assert parsed == 0
+    assert data["packages"]["one"].__config_file__ == str(
+        tmp_path / "packages" / "one.yaml"
+    )
+    assert data["packages"]["one"].__line__ == 2
+
+    # A changed environment variable
+    with patch.dict(os.environ, {"TEST_A": "b"}):
+        data, parsed = load()
+    assert data["packages"]["one"]["value"] == "b"
+    assert parsed == 2
+
+    # A changed secret
+    (tmp_path / "secrets.yaml").write_text("password: other\n")
+    data, parsed = load()
+    assert data["password"] == "other"
+    assert parsed == 3
+
+    # A new file in an included directory
+    (tmp_path / "packages" / "two.yaml").write_text("two: 2\n")
+    data, parsed = load()
+    assert data["packages"] == {"one": {"value": "a"}, "two": 2}
+    assert parsed == 2
+
+    assert yaml_loader.get_yaml_cache_stats()[fname]["hits"] == 0
+    assert yaml_loader.get_yaml_cache_stats()[str(tmp_path / "secrets.yaml")]["hits"]